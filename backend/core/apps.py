@@ -11,3 +11,9 @@ def dev_print(*args, **kwargs):
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "core"
+
+    def ready(self):
+        # 정적 지점 테이블 변경 시 공간 인덱스 무효화
+        from .utils.spatial_index import connect_signals
+
+        connect_signals()
@@ -0,0 +1,90 @@
+# backend/core/management/commands/bench_egi_debug_images.py
+
+import io
+import statistics
+import time
+import tracemalloc
+
+import numpy as np
+from django.core.management.base import BaseCommand
+from PIL import Image
+
+from core.utils.ai_inference import build_debug_images
+
+
+def _phone_photo(width, height):
+    """휴대폰 사진 크기의 JPEG (그라데이션 + 잡음)"""
+    rng = np.random.default_rng(42)
+    y = np.linspace(0, 1, height, dtype=np.float32)[:, None]
+    x = np.linspace(0, 1, width, dtype=np.float32)[None, :]
+    base = np.stack([60 + 80 * y + 0 * x, 110 + 60 * x + 0 * y, 160 + 40 * y * x], axis=2)
+    noise = rng.normal(0, 12, size=(height, width, 3)).astype(np.float32)
+    pixels = np.clip(base + noise, 0, 255).astype(np.uint8)
+
+    buf = io.BytesIO()
+    Image.fromarray(pixels).save(buf, "JPEG", quality=90)
+    return buf.getvalue()
+
+
+class Command(BaseCommand):
+    help = "에기 추천 전처리에서 디버그 이미지(박스 그리기/base64) 생성 여부에 따른 시간·메모리를 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--width", type=int, default=4032, help="사진 가로 (12MP 기본)")
+        parser.add_argument("--height", type=int, default=3024, help="사진 세로")
+        parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+
+    def _measure(self, fn, repeat):
+        """
+        (중앙값 ms, 최대 추가 메모리 MB)
+        메모리는 tracemalloc 기준 (NumPy/OpenCV 배열, base64 문자열).
+        PIL 이미지 버퍼는 잡히지 않으므로 따로 출력한다.
+        """
+        times, peaks = [], []
+        for _ in range(repeat):
+            tracemalloc.start()
+            started = time.perf_counter()
+            fn()
+            times.append((time.perf_counter() - started) * 1000)
+            peaks.append(tracemalloc.get_traced_memory()[1] / 1e6)
+            tracemalloc.stop()
+        return statistics.median(times), max(peaks)
+
+    def handle(self, *args, **options):
+        width, height = options["width"], options["height"]
+        jpeg = _phone_photo(width, height)
+        # 수면이 사진 가운데 대부분을 차지한다고 가정
+        box = (width // 5, height // 5, width * 4 // 5, height * 4 // 5)
+
+        self.stdout.write(
+            f"🚀 디버그 이미지 비용 ({width}×{height}, JPEG {len(jpeg) / 1e6:.1f}MB, "
+            f"{options['repeat']}회 중앙값)"
+        )
+
+        def lean():
+            origin = Image.open(io.BytesIO(jpeg)).convert("RGB")
+            crop = origin.crop(box)
+            crop.resize((64, 64))
+            crop.resize((224, 224))
+            return origin, crop
+
+        def with_debug():
+            origin, crop = lean()
+            return build_debug_images(origin, crop, box, 0.9)
+
+        lean_ms, lean_mb = self._measure(lean, options["repeat"])
+        debug_ms, debug_mb = self._measure(with_debug, options["repeat"])
+        payload = sum(len(v) for v in with_debug().values())
+
+        self.stdout.write(
+            f"   (두 경우 공통: 디코딩한 원본 RGB 버퍼 {width * height * 3 / 1e6:.1f} MB)"
+        )
+        self.stdout.write(f"   {'lean (기본)':<24} {lean_ms:9.1f} ms   peak {lean_mb:8.1f} MB")
+        self.stdout.write(
+            f"   {'debug 이미지 포함':<24} {debug_ms:9.1f} ms   peak {debug_mb:8.1f} MB"
+        )
+        self.stdout.write(
+            f"   -> 요청당 절약: {debug_ms - lean_ms:.1f} ms, "
+            f"{debug_mb - lean_mb:.1f} MB, 응답/소켓 base64 {payload / 1e6:.1f} MB"
+        )
+        self.stdout.write(self.style.SUCCESS("\n✅ 벤치마크 완료"))
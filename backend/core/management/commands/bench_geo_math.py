@@ -0,0 +1,124 @@
+# backend/core/management/commands/bench_geo_math.py
+
+import math
+import random
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from core.utils.geo_math import haversine_matrix, haversine_to_many
+from core.utils.spatial_index import SpatialIndex
+
+try:
+    from haversine import haversine as haversine_pkg
+except ImportError:
+    haversine_pkg = None
+
+
+def _loop_haversine_km(lat1, lon1, lat2, lon2):
+    """기존 fishing_index_api._haversine_km / find_nearest_port 내부 함수와 같은 스칼라 구현"""
+    R = 6371.0
+    rad = math.radians
+    dlat = rad(lat2 - lat1)
+    dlon = rad(lon2 - lon1)
+    a = (
+        math.sin(dlat / 2) ** 2
+        + math.cos(rad(lat1)) * math.cos(rad(lat2)) * math.sin(dlon / 2) ** 2
+    )
+    return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+class Command(BaseCommand):
+    help = "기존 파이썬 루프 haversine 과 NumPy 벡터화(geo_math)/KD-tree 최근접 검색 속도를 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--spots", type=int, default=10000, help="지점 개수")
+        parser.add_argument("--items", type=int, default=600, help="행렬 비교용 item 개수")
+        parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+
+    def _timeit(self, fn, repeat):
+        best = float("inf")
+        result = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = fn()
+            best = min(best, time.perf_counter() - started)
+        return best * 1000, result
+
+    def _report(self, label, ms, base_ms=None):
+        speedup = f"  (x{base_ms / ms:,.1f})" if base_ms else ""
+        self.stdout.write(f"   {label:<42} {ms:10.3f} ms{speedup}")
+
+    def handle(self, *args, **options):
+        n_spots = options["spots"]
+        n_items = options["items"]
+        repeat = options["repeat"]
+
+        rng = random.Random(42)
+        # 한반도 주변 해역 범위의 임의 좌표
+        spots = [(33 + rng.random() * 5, 124 + rng.random() * 8) for _ in range(n_spots)]
+        items = [(33 + rng.random() * 5, 124 + rng.random() * 8) for _ in range(n_items)]
+        user = (35.1, 129.04)
+
+        lats = np.array([s[0] for s in spots])
+        lons = np.array([s[1] for s in spots])
+
+        self.stdout.write(f"🚀 geo_math 벤치마크 (spots={n_spots}, items={n_items}, best of {repeat})")
+
+        # 1) 한 점 → 전체 지점 최근접
+        self.stdout.write("\n[1] 사용자 → 전체 지점 최근접 1개")
+
+        def loop_nearest():
+            return min(range(n_spots), key=lambda i: _loop_haversine_km(*user, *spots[i]))
+
+        base_ms, base_idx = self._timeit(loop_nearest, repeat)
+        self._report("python loop (math)", base_ms)
+
+        if haversine_pkg:
+            ms, _ = self._timeit(
+                lambda: min(range(n_spots), key=lambda i: haversine_pkg(user, spots[i])),
+                repeat,
+            )
+            self._report("python loop (haversine 패키지)", ms, base_ms)
+
+        ms, vec_idx = self._timeit(
+            lambda: int(np.argmin(haversine_to_many(*user, lats, lons))), repeat
+        )
+        self._report("geo_math.haversine_to_many + argmin", ms, base_ms)
+
+        index = SpatialIndex(list(range(n_spots)), spots)
+        ms, kd = self._timeit(lambda: index.nearest(*user, k=1), repeat)
+        self._report("SpatialIndex.nearest (KD-tree, 조회만)", ms, base_ms)
+
+        if not (base_idx == vec_idx == kd[0][0]):
+            self.stdout.write(self.style.WARNING("   ⚠️ 최근접 결과가 서로 다릅니다."))
+
+        # 2) 여러 지점 × 여러 item 최근접 매칭 (낚시지수 item 매칭과 같은 형태)
+        n_match = min(n_spots, 1000)
+        self.stdout.write(f"\n[2] 지점 {n_match}개 × item {n_items}개 최근접 매칭")
+
+        def loop_matrix():
+            return [
+                min(range(n_items), key=lambda j: _loop_haversine_km(*spots[i], *items[j]))
+                for i in range(n_match)
+            ]
+
+        base_ms, base_match = self._timeit(loop_matrix, 1)
+        self._report("python loop (math, 1회)", base_ms)
+
+        item_lats = [it[0] for it in items]
+        item_lons = [it[1] for it in items]
+        ms, vec_match = self._timeit(
+            lambda: np.argmin(
+                haversine_matrix(lats[:n_match], lons[:n_match], item_lats, item_lons),
+                axis=1,
+            ).tolist(),
+            repeat,
+        )
+        self._report("geo_math.haversine_matrix + argmin", ms, base_ms)
+
+        if base_match != vec_match:
+            self.stdout.write(self.style.WARNING("   ⚠️ 매칭 결과가 서로 다릅니다."))
+
+        self.stdout.write(self.style.SUCCESS("\n✅ 벤치마크 완료"))
@@ -0,0 +1,56 @@
+# backend/core/management/commands/bench_image_decode.py
+
+import io
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from PIL import Image
+
+from core.management.commands.bench_egi_debug_images import _phone_photo
+from core.utils.ai_inference import decode_image
+
+
+class Command(BaseCommand):
+    help = "업로드 사진 전체 크기 디코딩과 축소 디코딩(JPEG draft)의 시간·버퍼 크기를 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--width", type=int, default=4032, help="사진 가로 (12MP 기본)")
+        parser.add_argument("--height", type=int, default=3024, help="사진 세로")
+        parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+
+    def _timeit(self, fn, repeat):
+        samples, result = [], None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = fn()
+            samples.append((time.perf_counter() - started) * 1000)
+        return statistics.median(samples), result
+
+    def _report(self, label, ms, image, base_ms=None):
+        speedup = f"  (x{base_ms / ms:,.1f})" if base_ms else ""
+        buffer_mb = image.size[0] * image.size[1] * 3 / 1e6
+        self.stdout.write(
+            f"   {label:<22} {ms:9.1f} ms   {image.size[0]}×{image.size[1]}"
+            f"   RGB 버퍼 {buffer_mb:6.1f} MB{speedup}"
+        )
+
+    def handle(self, *args, **options):
+        width, height = options["width"], options["height"]
+        jpeg = _phone_photo(width, height)
+        self.stdout.write(
+            f"🚀 사진 디코딩 비교 ({width}×{height}, JPEG {len(jpeg) / 1e6:.1f}MB, "
+            f"{options['repeat']}회 중앙값)"
+        )
+
+        base_ms, full = self._timeit(
+            lambda: Image.open(io.BytesIO(jpeg)).convert("RGB"), options["repeat"]
+        )
+        self._report("전체 크기 (기존)", base_ms, full)
+
+        ms, (reduced, _) = self._timeit(
+            lambda: decode_image(io.BytesIO(jpeg)), options["repeat"]
+        )
+        self._report("축소 디코딩 (draft)", ms, reduced, base_ms)
+
+        self.stdout.write(self.style.SUCCESS("\n✅ 벤치마크 완료"))
@@ -0,0 +1,196 @@
+# backend/core/management/commands/bench_vision_backends.py
+
+import glob
+import os
+import statistics
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+from PIL import Image
+
+from core.utils import ai_inference, onnx_backend
+
+IMAGE_PATTERNS = ("*.jpg", "*.jpeg", "*.png")
+
+
+def _box_iou(a, b):
+    x1, y1 = max(a[0], b[0]), max(a[1], b[1])
+    x2, y2 = min(a[2], b[2]), min(a[3], b[3])
+    inter = max(0.0, x2 - x1) * max(0.0, y2 - y1)
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+    return inter / union if union > 0 else 0.0
+
+
+def _first_box(result):
+    for box in result.boxes:
+        return [float(v) for v in box.xyxy[0]], float(box.conf[0])
+    return None
+
+
+class Command(BaseCommand):
+    help = "TensorFlow/Ultralytics 와 ONNX Runtime 비전 모델의 결과 일치 여부와 지연 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--images", type=str, default=None, help="비교에 쓸 이미지 폴더 (jpg/png)"
+        )
+        parser.add_argument(
+            "--synthetic",
+            type=int,
+            default=8,
+            help="--images 가 없을 때 만들 임의 이미지 수",
+        )
+        parser.add_argument("--repeat", type=int, default=10, help="지연 측정 반복 횟수")
+        parser.add_argument("--batch", type=int, default=8, help="묶음 추론 측정 배치 크기")
+
+    def _load_images(self, options):
+        if options["images"]:
+            paths = []
+            for pattern in IMAGE_PATTERNS:
+                paths += glob.glob(os.path.join(options["images"], pattern))
+            if not paths:
+                raise CommandError(f"이미지가 없습니다: {options['images']}")
+            return [Image.open(p).convert("RGB") for p in sorted(paths)]
+
+        rng = np.random.default_rng(42)
+        return [
+            Image.fromarray(rng.integers(0, 256, (480, 640, 3), dtype=np.uint8))
+            for _ in range(options["synthetic"])
+        ]
+
+    def _timeit(self, fn, repeat):
+        fn()  # 첫 호출(그래프 준비 등)은 제외
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - started) * 1000)
+        return statistics.median(samples)
+
+    def _report(self, label, tf_ms, onnx_ms):
+        self.stdout.write(
+            f"   {label:<28} TF {tf_ms:9.2f} ms   ONNX {onnx_ms:9.2f} ms"
+            f"   (x{tf_ms / onnx_ms:,.2f})"
+        )
+
+    def handle(self, *args, **options):
+        onnx_models = onnx_backend.load_onnx_models()
+        if onnx_models is None:
+            raise CommandError(
+                "ONNX 모델을 사용할 수 없습니다. (onnxruntime 설치 / export_onnx_models 실행)"
+            )
+        tf_models = ai_inference.load_tensorflow_models()
+
+        images = self._load_images(options)
+        env_dim = onnx_models["egi_rec_model"].session.get_inputs()[1].shape[1]
+        rng = np.random.default_rng(0)
+        env = rng.normal(size=(1, env_dim)).astype(np.float32)
+
+        self.stdout.write(f"🚀 비전 백엔드 비교 (이미지 {len(images)}장)")
+
+        # 1) 결과 일치
+        self.stdout.write("\n[1] 결과 일치 (TF 기준)")
+        detect_agree = 0
+        ious = []
+        stats = {"egi": ([], 0), "water": ([], 0)}
+        egi_inputs, water_inputs = [], []
+
+        for image in images:
+            tf_box = _first_box(tf_models["yolo_model"](image, verbose=False)[0])
+            onnx_box = _first_box(onnx_models["yolo_model"]([image])[0])
+            detect_agree += (tf_box is None) == (onnx_box is None)
+            if tf_box and onnx_box:
+                ious.append(_box_iou(tf_box[0], onnx_box[0]))
+
+            crop = image.crop(tuple(map(int, tf_box[0]))) if tf_box else image
+            egi_in = np.array(crop.resize((64, 64)))[None] / 255.0
+            water_in = np.array(crop.resize((224, 224)), dtype=np.float32)[None]
+            egi_inputs.append(egi_in)
+            water_inputs.append(water_in)
+
+            pairs = {
+                "egi": (
+                    tf_models["egi_rec_model"].predict([egi_in, env], verbose=0),
+                    onnx_models["egi_rec_model"].predict([egi_in, env]),
+                ),
+            }
+            if tf_models["water_cls_model"] and onnx_models["water_cls_model"]:
+                pairs["water"] = (
+                    tf_models["water_cls_model"].predict(
+                        tf_models["preprocess_input"](water_in.copy()), verbose=0
+                    ),
+                    onnx_models["water_cls_model"].predict(
+                        onnx_models["preprocess_input"](water_in)
+                    ),
+                )
+
+            for name, (tf_out, onnx_out) in pairs.items():
+                diffs, agree = stats[name]
+                diffs.append(float(np.max(np.abs(tf_out - onnx_out))))
+                stats[name] = (diffs, agree + int(tf_out.argmax() == onnx_out.argmax()))
+
+        n = len(images)
+        self.stdout.write(f"   YOLO 감지 여부 일치        {detect_agree}/{n}")
+        if ious:
+            self.stdout.write(
+                f"   YOLO 첫 박스 IoU           평균 {np.mean(ious):.4f} / 최소 {min(ious):.4f}"
+            )
+        mismatch = detect_agree != n
+        for name, (diffs, agree) in stats.items():
+            if not diffs:
+                continue
+            self.stdout.write(
+                f"   {name:<6} argmax 일치 {agree}/{n}   최대 확률 차이 {max(diffs):.2e}"
+            )
+            mismatch |= agree != n
+
+        # 2) 지연 시간
+        self.stdout.write(f"\n[2] 지연 시간 (중앙값, {options['repeat']}회)")
+        image = images[0]
+        self._report(
+            "YOLO (1장)",
+            self._timeit(
+                lambda: tf_models["yolo_model"](image, verbose=False), options["repeat"]
+            ),
+            self._timeit(lambda: onnx_models["yolo_model"]([image]), options["repeat"]),
+        )
+
+        for batch in sorted({1, options["batch"]}):
+            egi_batch = np.concatenate((egi_inputs * batch)[:batch])
+            env_batch = np.repeat(env, batch, axis=0)
+            self._report(
+                f"egi (batch {batch})",
+                self._timeit(
+                    lambda: tf_models["egi_rec_model"].predict(
+                        [egi_batch, env_batch], verbose=0
+                    ),
+                    options["repeat"],
+                ),
+                self._timeit(
+                    lambda: onnx_models["egi_rec_model"].predict([egi_batch, env_batch]),
+                    options["repeat"],
+                ),
+            )
+
+            if tf_models["water_cls_model"] and onnx_models["water_cls_model"]:
+                water_batch = np.concatenate((water_inputs * batch)[:batch])
+                self._report(
+                    f"water (batch {batch})",
+                    self._timeit(
+                        lambda: tf_models["water_cls_model"].predict(
+                            tf_models["preprocess_input"](water_batch.copy()), verbose=0
+                        ),
+                        options["repeat"],
+                    ),
+                    self._timeit(
+                        lambda: onnx_models["water_cls_model"].predict(
+                            onnx_models["preprocess_input"](water_batch)
+                        ),
+                        options["repeat"],
+                    ),
+                )
+
+        if mismatch:
+            self.stdout.write(self.style.WARNING("\n⚠️ 두 백엔드의 결과가 다른 이미지가 있습니다."))
+        self.stdout.write(self.style.SUCCESS("\n✅ 비교 완료"))
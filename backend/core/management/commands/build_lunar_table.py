@@ -0,0 +1,55 @@
+# backend/core/management/commands/build_lunar_table.py
+
+import os
+
+from django.core.management.base import BaseCommand
+from core.utils.lunar_calendar import (
+    DEFAULT_END_YEAR,
+    DEFAULT_START_YEAR,
+    NO_DATA,
+    LunarTable,
+    build_table_bytes,
+    compute_lunar_months,
+    default_table_path,
+)
+
+
+class Command(BaseCommand):
+    help = "합삭/중기 계산으로 양력→음력 변환 표(data/lunar_calendar.bin)를 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start-year", type=int, default=DEFAULT_START_YEAR)
+        parser.add_argument("--end-year", type=int, default=DEFAULT_END_YEAR)
+        parser.add_argument("--output", type=str, default=None, help="저장 경로")
+
+    def handle(self, *args, **options):
+        start_year = options["start_year"]
+        end_year = options["end_year"]
+        output = options["output"] or default_table_path()
+
+        self.stdout.write(f"🌙 음력 표 생성: {start_year} ~ {end_year}년")
+
+        data = build_table_bytes(start_year, end_year)
+        table = LunarTable(data)  # 저장 전에 다시 읽어서 형식 확인
+
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+        with open(output, "wb") as f:
+            f.write(data)
+
+        leap_months = [
+            f"{m['year']}년 윤{m['month']}월"
+            for m in compute_lunar_months(start_year, end_year)
+            if m["leap"]
+        ]
+        self.stdout.write(f"   -> 윤달 {len(leap_months)}개: {', '.join(leap_months)}")
+        missing = sum(1 for v in table.days if v == NO_DATA)
+        if missing:
+            self.stdout.write(
+                self.style.WARNING(f"   ⚠️ 음력을 정하지 못한 날 {missing}일 (조회 시 API 사용)")
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ 저장 완료: {output} ({len(data):,} bytes, "
+                f"{table.first_date} ~ {table.last_date})"
+            )
+        )
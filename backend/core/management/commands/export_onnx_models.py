@@ -0,0 +1,84 @@
+# backend/core/management/commands/export_onnx_models.py
+
+import os
+import shutil
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.utils import ai_inference, onnx_backend
+
+# (이름, 원본 경로, ONNX 경로)
+KERAS_MODELS = [
+    ("egi", ai_inference.EGI_REC_PATH, onnx_backend.EGI_REC_ONNX_PATH),
+    ("water", ai_inference.WATER_CLS_PATH, onnx_backend.WATER_CLS_ONNX_PATH),
+]
+
+
+class Command(BaseCommand):
+    help = "에기 추천 비전 모델(Keras .h5 / YOLO .pt)을 ONNX 로 변환해 ai_models/ 에 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--only",
+            choices=["egi", "water", "yolo"],
+            action="append",
+            help="변환할 모델 (여러 번 지정 가능, 기본: 전부)",
+        )
+        parser.add_argument("--opset", type=int, default=13, help="ONNX opset 버전")
+        parser.add_argument(
+            "--imgsz", type=int, default=640, help="YOLO 입력 크기 (학습 크기와 같게)"
+        )
+
+    def handle(self, *args, **options):
+        targets = options["only"] or ["egi", "water", "yolo"]
+        self.stdout.write(f"🚀 ONNX 변환을 시작합니다... ({', '.join(targets)})")
+
+        for name, src, dst in KERAS_MODELS:
+            if name in targets:
+                self._export_keras(name, src, dst, options["opset"])
+
+        if "yolo" in targets:
+            self._export_yolo(options["opset"], options["imgsz"])
+
+        self.stdout.write(self.style.SUCCESS("✅ ONNX 변환 완료!"))
+
+    def _export_keras(self, name, src, dst, opset):
+        if not os.path.exists(src):
+            self.stdout.write(self.style.WARNING(f"   ⚠️ {name}: 원본 없음 ({src})"))
+            return
+
+        try:
+            import tensorflow as tf
+            import tf2onnx
+        except ImportError as e:
+            raise CommandError(f"tensorflow / tf2onnx 가 필요합니다: {e}")
+
+        model = tf.keras.models.load_model(src)
+        # 배치 차원은 가변으로 (묶음 추론용)
+        signature = [
+            tf.TensorSpec((None,) + tuple(inp.shape[1:]), tf.float32, name=f"input_{i}")
+            for i, inp in enumerate(model.inputs)
+        ]
+        tf2onnx.convert.from_keras(
+            model, input_signature=signature, opset=opset, output_path=dst
+        )
+        self.stdout.write(f"   -> {name}: {dst} ({os.path.getsize(dst) / 1e6:.1f}MB)")
+
+    def _export_yolo(self, opset, imgsz):
+        src = ai_inference.YOLO_PATH
+        dst = onnx_backend.YOLO_ONNX_PATH
+        if not os.path.exists(src):
+            self.stdout.write(self.style.WARNING(f"   ⚠️ yolo: 원본 없음 ({src})"))
+            return
+
+        try:
+            from ultralytics import YOLO
+        except ImportError as e:
+            raise CommandError(f"ultralytics 가 필요합니다: {e}")
+
+        exported = YOLO(src).export(
+            format="onnx", imgsz=imgsz, opset=opset, dynamic=True, simplify=True
+        )
+        if os.path.abspath(exported) != os.path.abspath(dst):
+            shutil.move(exported, dst)
+        self.stdout.write(f"   -> yolo: {dst} ({os.path.getsize(dst) / 1e6:.1f}MB)")
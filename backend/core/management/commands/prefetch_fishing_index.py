@@ -0,0 +1,38 @@
+# backend/core/management/commands/prefetch_fishing_index.py
+
+import time
+
+from django.core.management.base import BaseCommand
+from core.utils.fishing_index_feed import default_feed_dates, refresh_feed
+
+
+class Command(BaseCommand):
+    help = "바다낚시지수(선상+갯바위) 피드를 오늘/내일 치 미리 받아 캐시에 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=2, help="오늘부터 수집할 일수")
+        parser.add_argument("--loop", action="store_true", help="주기적으로 계속 갱신")
+        parser.add_argument(
+            "--interval", type=int, default=1800, help="--loop 갱신 간격(초)"
+        )
+
+    def _run_once(self, days):
+        for req_date in default_feed_dates(days):
+            count = refresh_feed(req_date)
+            if count:
+                self.stdout.write(f"   -> {req_date}: item {count}개 저장")
+            else:
+                self.stdout.write(
+                    self.style.WARNING(f"   ⚠️ {req_date}: 수집 실패 (기존 캐시 유지)")
+                )
+
+    def handle(self, *args, **options):
+        self.stdout.write("🚀 바다낚시지수 피드 사전 수집을 시작합니다...")
+
+        while True:
+            self._run_once(options["days"])
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
+
+        self.stdout.write(self.style.SUCCESS("✅ 바다낚시지수 피드 수집 완료!"))
@@ -0,0 +1,75 @@
+# backend/core/management/commands/pregenerate_reasons.py
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.models import RecommendationReason
+from core.utils.reason_cache import (
+    SOURCE_LLM,
+    SOURCE_RULE,
+    all_combinations,
+    generate_and_store_batch,
+    is_stale,
+)
+
+
+class Command(BaseCommand):
+    help = "물색 × 에기 색상 조합별 추천 근거를 LLM 으로 미리 생성해 DB 에 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force", action="store_true", help="이미 있는 근거도 모두 다시 생성"
+        )
+
+    def handle(self, *args, **options):
+        existing = {
+            (r.water_color, r.egi_color, r.env_bucket): r
+            for r in RecommendationReason.objects.all()
+        }
+        targets = []
+        for key in all_combinations():
+            row = existing.get(key)
+            # 기본 멘트로 저장된 근거도 is_stale 이므로 다시 생성
+            if options["force"] or row is None or is_stale(row):
+                targets.append(key)
+
+        self.stdout.write(
+            f"🚀 추천 근거 생성을 시작합니다... "
+            f"(전체 {len(all_combinations())}개 중 {len(targets)}개)"
+        )
+
+        # LLM 배치 크기만큼 묶어서 generate 한 번으로 생성
+        batch_size = max(1, getattr(settings, "LLM_BATCH_MAX_SIZE", 4))
+        counts = {}
+        started = time.monotonic()
+        for i in range(0, len(targets), batch_size):
+            close_old_connections()
+            chunk = targets[i : i + batch_size]
+            t0 = time.monotonic()
+            rows = generate_and_store_batch(chunk)
+            self.stdout.write(
+                f"   [{i + len(chunk)}/{len(targets)}] {len(chunk)}개 생성 "
+                f"({time.monotonic() - t0:.1f}s)"
+            )
+            for row in rows:
+                counts[row.source] = counts.get(row.source, 0) + 1
+                self.stdout.write(
+                    f"      {row.water_color}/{row.egi_color} ({row.source}) "
+                    f"{row.reason[:40]}"
+                )
+
+        self.stdout.write(
+            f"   -> LLM {counts.get(SOURCE_LLM, 0)}개, "
+            f"기본 멘트 {counts.get(SOURCE_RULE, 0)}개 "
+            f"({time.monotonic() - started:.1f}s)"
+        )
+        if counts.get(SOURCE_RULE):
+            self.stdout.write(
+                self.style.WARNING(
+                    "   ⚠️ LLM 을 쓰지 못한 조합이 있습니다. (다시 실행하면 재생성)"
+                )
+            )
+        self.stdout.write(self.style.SUCCESS("✅ 추천 근거 생성 완료!"))
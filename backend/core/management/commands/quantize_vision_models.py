@@ -0,0 +1,127 @@
+# backend/core/management/commands/quantize_vision_models.py
+
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.utils import ai_inference, onnx_backend
+from core.utils.vision_quantization import (
+    build_inputs,
+    compare_models,
+    list_images,
+    quantize_model,
+)
+
+REPORT_PATH = os.path.join(onnx_backend.MODEL_DIR, "quantization_report.json")
+
+
+class Command(BaseCommand):
+    help = "에기 추천 / 물색 분류 ONNX 모델을 보정 이미지로 int8 양자화하고 정확도 변화를 보고합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--calib", type=str, required=True, help="보정(calibration) 이미지 폴더"
+        )
+        parser.add_argument(
+            "--eval",
+            type=str,
+            default=None,
+            help="평가 이미지 폴더 (하위 폴더 clear/medium/muddy 이면 물색 정확도도 계산)",
+        )
+        parser.add_argument(
+            "--only", choices=["egi", "water"], action="append", help="양자화할 모델"
+        )
+        parser.add_argument(
+            "--max-images", type=int, default=300, help="폴더마다 사용할 최대 이미지 수"
+        )
+        parser.add_argument(
+            "--report-only",
+            action="store_true",
+            help="양자화 없이 기존 int8 모델로 리포트만 다시 만듦",
+        )
+
+    def handle(self, *args, **options):
+        if onnx_backend.ort is None:
+            raise CommandError("onnxruntime 이 필요합니다. (pip install onnxruntime)")
+
+        fp32 = onnx_backend.load_onnx_models(quantized=False)
+        if fp32 is None:
+            raise CommandError("ONNX 모델이 없습니다. export_onnx_models 를 먼저 실행하세요.")
+
+        targets = options["only"] or ["egi", "water"]
+        if fp32["water_cls_model"] is None and "water" in targets:
+            self.stdout.write(self.style.WARNING("   ⚠️ 물색 ONNX 모델이 없어 건너뜁니다."))
+            targets = [t for t in targets if t != "water"]
+
+        env_dim = fp32["egi_rec_model"].session.get_inputs()[1].shape[1]
+        calib_paths = list_images(options["calib"], options["max_images"])
+        if not calib_paths:
+            raise CommandError(f"보정 이미지가 없습니다: {options['calib']}")
+
+        if options["eval"]:
+            eval_paths = list_images(options["eval"], options["max_images"])
+        else:
+            self.stdout.write(
+                self.style.WARNING("   ⚠️ --eval 이 없어 보정 이미지로 평가합니다.")
+            )
+            eval_paths = calib_paths
+
+        self.stdout.write(
+            f"🚀 int8 양자화 (보정 {len(calib_paths)}장 / 평가 {len(eval_paths)}장)"
+        )
+        calib = build_inputs(calib_paths, fp32["yolo_model"], env_dim, seed=0)
+        evaluation = build_inputs(eval_paths, fp32["yolo_model"], env_dim, seed=1)
+        labels = [s["label"] for s in evaluation]
+
+        models = {
+            "egi": (onnx_backend.EGI_REC_ONNX_PATH, None),
+            "water": (onnx_backend.WATER_CLS_ONNX_PATH, ai_inference.WATER_CLASSES),
+        }
+
+        report = {}
+        for name in targets:
+            src, classes = models[name]
+            dst = onnx_backend.int8_path(src)
+
+            if not options["report_only"]:
+                self.stdout.write(f"   -> {name}: 양자화 중... ({dst})")
+                quantize_model(src, dst, [s[name] for s in calib])
+            elif not os.path.exists(dst):
+                raise CommandError(f"int8 모델이 없습니다: {dst}")
+
+            report[name] = compare_models(
+                src,
+                dst,
+                [s[name] for s in evaluation],
+                labels=labels if classes else None,
+                classes=classes,
+            )
+            self._print_report(name, report[name])
+
+        with open(REPORT_PATH, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        self.stdout.write(f"\n   리포트 저장: {REPORT_PATH}")
+        self.stdout.write(
+            self.style.SUCCESS("✅ 양자화 완료! (서빙: .env 에 VISION_QUANTIZED=true)")
+        )
+
+    def _print_report(self, name, r):
+        self.stdout.write(
+            f"      top-1 일치 {r['top1_agreement'] * 100:.1f}%  "
+            f"확률 차이 최대 {r['max_abs_diff']:.4f} / 평균 {r['mean_abs_diff']:.4f}"
+        )
+        self.stdout.write(
+            f"      지연 {r['fp32_ms']:.2f} → {r['int8_ms']:.2f} ms  "
+            f"크기 {r['fp32_mb']:.1f} → {r['int8_mb']:.1f} MB"
+        )
+        if "accuracy_drop" in r:
+            self.stdout.write(
+                f"      정확도 {r['fp32_accuracy'] * 100:.1f}% → "
+                f"{r['int8_accuracy'] * 100:.1f}% "
+                f"(하락 {r['accuracy_drop'] * 100:.1f}%p, {r['labeled_samples']}장)"
+            )
+        if r["top1_agreement"] < 0.98:
+            self.stdout.write(
+                self.style.WARNING(f"      ⚠️ {name}: fp32 와 결과가 다른 샘플이 많습니다.")
+            )
@@ -0,0 +1,31 @@
+# backend/core/management/commands/rebuild_spatial_index.py
+
+from django.core.management.base import BaseCommand
+from core.utils.spatial_index import INDEX_SOURCES, get_index, invalidate
+
+
+class Command(BaseCommand):
+    help = "부이/조위관측소/해안지점/낚시포인트/항구 공간 인덱스를 무효화하고 다시 만듭니다. (CSV 대량 적재 후 실행)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "names",
+            nargs="*",
+            help=f"대상 인덱스 이름 (생략 시 전체: {', '.join(INDEX_SOURCES)})",
+        )
+
+    def handle(self, *args, **options):
+        names = options["names"] or list(INDEX_SOURCES.keys())
+
+        for name in names:
+            if name not in INDEX_SOURCES:
+                self.stdout.write(self.style.ERROR(f"❌ 알 수 없는 인덱스: {name}"))
+                continue
+
+            invalidate(name)
+            index = get_index(name)
+            self.stdout.write(f"   -> {name}: {len(index)}개 지점")
+
+        self.stdout.write(
+            self.style.SUCCESS("✅ 공간 인덱스 갱신 완료! 다른 워커도 다음 조회 때 다시 만듭니다.")
+        )
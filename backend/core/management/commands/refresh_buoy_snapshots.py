@@ -0,0 +1,47 @@
+# backend/core/management/commands/refresh_buoy_snapshots.py
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from core.utils.ocean_api import refresh_buoy_snapshots
+
+
+class Command(BaseCommand):
+    help = "전체 해양관측부이의 최신 관측값을 받아 BuoySnapshot 테이블에 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--loop", action="store_true", help="주기적으로 계속 갱신")
+        parser.add_argument(
+            "--interval", type=int, default=600, help="--loop 갱신 간격(초)"
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="동시 요청 수 (기본: BUOY_POLL_MAX_WORKERS)",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("🚀 부이 스냅샷 갱신을 시작합니다...")
+
+        while True:
+            close_old_connections()
+            started = time.monotonic()
+            updated, total = refresh_buoy_snapshots(max_workers=options["workers"])
+            elapsed = time.monotonic() - started
+
+            if updated:
+                self.stdout.write(
+                    f"   -> 부이 {total}개 중 {updated}개 갱신 ({elapsed:.1f}s)"
+                )
+            else:
+                self.stdout.write(
+                    self.style.WARNING(f"   ⚠️ 갱신된 부이 없음 (기존 스냅샷 유지)")
+                )
+
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
+
+        self.stdout.write(self.style.SUCCESS("✅ 부이 스냅샷 갱신 완료!"))
@@ -0,0 +1,46 @@
+# backend/core/management/commands/refresh_tide_tables.py
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from core.utils.tide_table import refresh_tide_tables
+
+
+class Command(BaseCommand):
+    help = "전체 조위 관측소의 만조/간조 예보를 며칠치 받아 TidePrediction 테이블에 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=3, help="오늘부터 저장할 일수")
+        parser.add_argument("--workers", type=int, default=8, help="동시 요청 수")
+        parser.add_argument("--loop", action="store_true", help="주기적으로 계속 갱신")
+        parser.add_argument(
+            "--interval", type=int, default=86400, help="--loop 갱신 간격(초)"
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("🚀 조석 예보 표 갱신을 시작합니다...")
+
+        while True:
+            close_old_connections()
+            started = time.monotonic()
+            updated, total, saved = refresh_tide_tables(
+                days=options["days"], max_workers=options["workers"]
+            )
+            elapsed = time.monotonic() - started
+
+            if updated:
+                self.stdout.write(
+                    f"   -> 관측소 {total}곳 중 {updated}곳 갱신, "
+                    f"예보 {saved}건 저장 ({elapsed:.1f}s)"
+                )
+            else:
+                self.stdout.write(
+                    self.style.WARNING("   ⚠️ 갱신된 관측소 없음 (기존 예보 유지)")
+                )
+
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
+
+        self.stdout.write(self.style.SUCCESS("✅ 조석 예보 표 갱신 완료!"))
@@ -0,0 +1,27 @@
+# backend/core/management/commands/run_model_server.py
+
+from django.core.management.base import BaseCommand
+from core.utils.model_server import default_socket_path, serve
+
+
+class Command(BaseCommand):
+    help = "에기 추천 비전 모델(YOLO/Keras)을 한 번 로드하고 Unix 소켓으로 추론 요청을 받습니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--socket",
+            type=str,
+            default=None,
+            help="Unix 소켓 경로 (기본: MODEL_SERVER_SOCKET 설정)",
+        )
+
+    def handle(self, *args, **options):
+        socket_path = options["socket"] or default_socket_path()
+        self.stdout.write(f"🚀 모델 서버를 시작합니다... ({socket_path})")
+
+        try:
+            serve(socket_path)
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS("✅ 모델 서버 종료"))
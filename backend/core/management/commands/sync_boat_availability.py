@@ -0,0 +1,47 @@
+# backend/core/management/commands/sync_boat_availability.py
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from core.utils.boat_availability import sync_boat_availability
+
+
+class Command(BaseCommand):
+    help = "전체 선박의 출항 스케줄을 받아 예약 현황(BoatAvailability) 테이블을 동기화합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, default=None, help="오늘부터 동기화할 일수"
+        )
+        parser.add_argument("--workers", type=int, default=10, help="동시 요청 수")
+        parser.add_argument("--loop", action="store_true", help="주기적으로 계속 동기화")
+        parser.add_argument(
+            "--interval", type=int, default=900, help="--loop 동기화 간격(초)"
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("🚀 선박 예약 현황 동기화를 시작합니다...")
+
+        while True:
+            close_old_connections()
+            stats = sync_boat_availability(
+                days=options["days"], max_workers=options["workers"]
+            )
+            self.stdout.write(
+                f"   -> 선박 {stats['boats']}척 / (선박, 월) {stats['months']}건 "
+                f"(변경 {stats['changed']}, 동일 {stats['unchanged']}), "
+                f"출항 {stats['rows']}건 저장 ({stats['elapsed']:.1f}s)"
+            )
+            if stats["failed"]:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"   ⚠️ {stats['failed']}건 수집 실패 (기존 현황 유지)"
+                    )
+                )
+
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
+
+        self.stdout.write(self.style.SUCCESS("✅ 선박 예약 현황 동기화 완료!"))
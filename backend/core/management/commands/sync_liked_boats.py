@@ -0,0 +1,62 @@
+# backend/core/management/commands/sync_liked_boats.py
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from core.utils.boat_availability import sync_liked_boats
+
+
+class Command(BaseCommand):
+    help = "찜한 선박의 출항 스케줄을 짧은 주기로 동기화합니다. (변경된 달만 다시 저장)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, default=None, help="오늘부터 동기화할 일수"
+        )
+        parser.add_argument("--workers", type=int, default=10, help="동시 요청 수")
+        parser.add_argument(
+            "--batch", type=int, default=200, help="한 번에 동기화할 (선박, 월) 최대 개수"
+        )
+        parser.add_argument(
+            "--max-age",
+            type=int,
+            default=None,
+            help="이 시간(초)보다 오래 확인하지 않은 달만 동기화",
+        )
+        parser.add_argument("--loop", action="store_true", help="주기적으로 계속 동기화")
+        parser.add_argument(
+            "--interval", type=int, default=60, help="--loop 동기화 간격(초)"
+        )
+
+    def handle(self, *args, **options):
+        max_age = options["max_age"] or getattr(settings, "BOAT_LIKED_SYNC_MAX_AGE", 600)
+        self.stdout.write("🚀 찜한 선박 스케줄 동기화를 시작합니다...")
+
+        while True:
+            close_old_connections()
+            stats = sync_liked_boats(
+                days=options["days"],
+                max_workers=options["workers"],
+                batch_size=options["batch"],
+                max_age=max_age,
+            )
+            self.stdout.write(
+                f"   -> 찜한 선박 {stats['boats']}척, 대상 {stats['due']}건 중 "
+                f"{stats['months']}건 확인 (변경 {stats['changed']}, "
+                f"동일 {stats['unchanged']}) / 남은 {stats['pending']}건, "
+                f"지연 {stats['lag']:.0f}s ({stats['elapsed']:.1f}s)"
+            )
+            if stats["failed"]:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"   ⚠️ {stats['failed']}건 수집 실패 (기존 현황 유지)"
+                    )
+                )
+
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
+
+        self.stdout.write(self.style.SUCCESS("✅ 찜한 선박 스케줄 동기화 완료!"))
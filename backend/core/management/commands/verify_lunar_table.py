@@ -0,0 +1,62 @@
+# backend/core/management/commands/verify_lunar_table.py
+
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from core.utils.lun_cal_api import _call_lun_cal_api, parse_luncal_api_dict
+from core.utils.lunar_calendar import get_lunar_table
+
+
+class Command(BaseCommand):
+    help = "음력 표(data/lunar_calendar.bin)를 한국천문연구원 음력변환 API 결과와 대조합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--start", type=str, default=None, help="시작일 YYYY-MM-DD (기본: 오늘)"
+        )
+        parser.add_argument("--days", type=int, default=60, help="검사할 일수")
+        parser.add_argument("--step", type=int, default=1, help="검사 간격(일)")
+        parser.add_argument(
+            "--sleep", type=float, default=0.1, help="API 호출 사이 대기(초)"
+        )
+
+    def handle(self, *args, **options):
+        table = get_lunar_table()
+        if table is None:
+            raise CommandError("음력 표가 없습니다. build_lunar_table 을 먼저 실행하세요.")
+
+        start = (
+            date.fromisoformat(options["start"]) if options["start"] else date.today()
+        )
+        self.stdout.write(
+            f"🔍 음력 표 검증: {start}부터 {options['days']}일 ({options['step']}일 간격)"
+        )
+
+        checked = mismatched = failed = 0
+        for offset in range(0, options["days"], options["step"]):
+            sol_date = start + timedelta(days=offset)
+            expected = None
+            parsed = _call_lun_cal_api(sol_date)
+            if parsed:
+                expected = parse_luncal_api_dict(parsed)
+            if not expected:
+                failed += 1
+                continue
+
+            actual = table.lookup(sol_date)
+            checked += 1
+            keys = ("year", "month", "day", "nday", "leapmonth")
+            if actual is None or any(actual[k] != expected["lun"][k] for k in keys):
+                mismatched += 1
+                self.stdout.write(
+                    self.style.ERROR(
+                        f"   ❌ {sol_date}: 표={actual} / API={expected['lun']}"
+                    )
+                )
+            time.sleep(options["sleep"])
+
+        summary = f"검사 {checked}일, 불일치 {mismatched}일, API 실패 {failed}일"
+        if mismatched:
+            raise CommandError(summary)
+        self.stdout.write(self.style.SUCCESS(f"✅ {summary}"))
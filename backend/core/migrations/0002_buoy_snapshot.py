@@ -0,0 +1,29 @@
+# Generated by Django 4.2 on 2026-10-17 01:48
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BuoySnapshot',
+            fields=[
+                ('buoy', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='snapshot', serialize=False, to='core.buoy')),
+                ('water_temp', models.FloatField(null=True)),
+                ('wave_height', models.FloatField(null=True)),
+                ('wind_speed', models.FloatField(null=True)),
+                ('wind_direction_deg', models.FloatField(null=True)),
+                ('record_time', models.CharField(blank=True, max_length=30)),
+                ('fetched_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'buoy_snapshots',
+            },
+        ),
+    ]
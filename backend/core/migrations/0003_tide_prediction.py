@@ -0,0 +1,29 @@
+# Generated by Django 4.2 on 2026-10-17 01:52
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_buoy_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TidePrediction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tide_time', models.DateTimeField()),
+                ('hl_code', models.CharField(max_length=10)),
+                ('tide_level', models.FloatField(null=True)),
+                ('station', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tide_predictions', to='core.tidestation')),
+            ],
+            options={
+                'db_table': 'tide_predictions',
+                'ordering': ['station', 'tide_time'],
+                'unique_together': {('station', 'tide_time')},
+            },
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2 on 2026-10-17 01:55
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_tide_prediction'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoatAvailability',
+            fields=[
+                ('availability_id', models.AutoField(primary_key=True, serialize=False)),
+                ('sail_date', models.DateField()),
+                ('stime', models.CharField(blank=True, max_length=8)),
+                ('etime', models.CharField(blank=True, max_length=8)),
+                ('status', models.CharField(blank=True, max_length=50)),
+                ('status_code', models.CharField(blank=True, max_length=20)),
+                ('remain_embarkation_num', models.IntegerField(default=0)),
+                ('embarkation_num', models.IntegerField(default=0)),
+                ('price', models.IntegerField(blank=True, null=True)),
+                ('fish_type', models.CharField(blank=True, max_length=100)),
+                ('fishing_method', models.CharField(blank=True, max_length=100)),
+                ('tide_water', models.CharField(blank=True, max_length=50)),
+                ('schedule_no', models.CharField(blank=True, max_length=50)),
+                ('synced_at', models.DateTimeField()),
+                ('boat', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='availabilities', to='core.boat')),
+            ],
+            options={
+                'db_table': 'boat_availability',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='boatavailability',
+            index=models.Index(fields=['sail_date', 'status_code', 'remain_embarkation_num'], name='boat_availa_sail_da_646d37_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boatavailability',
+            index=models.Index(fields=['boat', 'sail_date'], name='boat_availa_boat_id_6770ac_idx'),
+        ),
+    ]
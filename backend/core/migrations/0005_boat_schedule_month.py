@@ -0,0 +1,36 @@
+# Generated by Django 4.2 on 2026-10-17 01:57
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_boat_availability'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoatScheduleMonth',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year_month', models.CharField(max_length=6)),
+                ('content_hash', models.CharField(max_length=64)),
+                ('synced_at', models.DateTimeField()),
+                ('changed_at', models.DateTimeField()),
+                ('boat', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='schedule_months', to='core.boat')),
+            ],
+            options={
+                'db_table': 'boat_schedule_months',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='boatschedulemonth',
+            index=models.Index(fields=['synced_at'], name='boat_schedu_synced__30d8b1_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='boatschedulemonth',
+            unique_together={('boat', 'year_month')},
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2 on 2026-10-17 02:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_boat_schedule_month'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecommendationReason',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('water_color', models.CharField(max_length=20)),
+                ('egi_color', models.CharField(max_length=20)),
+                ('env_bucket', models.CharField(default='all', max_length=50)),
+                ('reason', models.TextField()),
+                ('source', models.CharField(max_length=10)),
+                ('generated_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'recommendation_reasons',
+                'unique_together': {('water_color', 'egi_color', 'env_bucket')},
+            },
+        ),
+    ]
@@ -18,6 +18,25 @@ class Buoy(models.Model):
         return self.name
 
 
+# 0-1-1. 부이 최신 관측값 (refresh_buoy_snapshots 배치가 주기적으로 갱신)
+class BuoySnapshot(models.Model):
+    buoy = models.OneToOneField(
+        Buoy, on_delete=models.CASCADE, primary_key=True, related_name="snapshot"
+    )
+    water_temp = models.FloatField(null=True)
+    wave_height = models.FloatField(null=True)
+    wind_speed = models.FloatField(null=True)
+    wind_direction_deg = models.FloatField(null=True)
+    record_time = models.CharField(max_length=30, blank=True)  # API 관측 시각 원문
+    fetched_at = models.DateTimeField()  # 배치가 수집한 시각
+
+    class Meta:
+        db_table = "buoy_snapshots"
+
+    def __str__(self):
+        return f"{self.buoy_id} @ {self.record_time}"
+
+
 # 0-2. 기상청 해안 지점 (격자 좌표 참조용)
 class CoastalPoint(models.Model):
     """기상청 격자 좌표 참조용 해안 지점"""
@@ -86,6 +105,24 @@ class TideStation(models.Model):
         return self.name
 
 
+# 0-4-1. 조석예보 (refresh_tide_tables 배치가 관측소별로 며칠치 미리 저장)
+class TidePrediction(models.Model):
+    station = models.ForeignKey(
+        TideStation, on_delete=models.CASCADE, related_name="tide_predictions"
+    )
+    tide_time = models.DateTimeField()  # 만조/간조 시각
+    hl_code = models.CharField(max_length=10)  # 고조 / 저조
+    tide_level = models.FloatField(null=True)  # 예측 조위(cm)
+
+    class Meta:
+        db_table = "tide_predictions"
+        unique_together = ("station", "tide_time")
+        ordering = ["station", "tide_time"]
+
+    def __str__(self):
+        return f"{self.station_id} {self.tide_time} {self.hl_code}"
+
+
 # 0-5. 항구 정보 (CSV 업로드용)
 class Port(models.Model):
     port_name = models.CharField(max_length=100, verbose_name="어항명")
@@ -164,6 +201,57 @@ class Boat(models.Model):
         ]
 
 
+# 2-0. 선박 예약 가능 현황 (sync_boat_availability 배치가 스케줄 API 에서 동기화)
+class BoatAvailability(models.Model):
+    availability_id = models.AutoField(primary_key=True)
+    boat = models.ForeignKey(
+        Boat, on_delete=models.CASCADE, related_name="availabilities"
+    )
+    sail_date = models.DateField()  # 출항일 (sdate)
+    stime = models.CharField(max_length=8, blank=True)  # 출항 시각 HH:MM:SS
+    etime = models.CharField(max_length=8, blank=True)
+    status = models.CharField(max_length=50, blank=True)
+    status_code = models.CharField(max_length=20, blank=True)  # ING = 예약 가능
+    remain_embarkation_num = models.IntegerField(default=0)  # 잔여석
+    embarkation_num = models.IntegerField(default=0)  # 총원
+    price = models.IntegerField(null=True, blank=True)
+    fish_type = models.CharField(max_length=100, blank=True)
+    fishing_method = models.CharField(max_length=100, blank=True)
+    tide_water = models.CharField(max_length=50, blank=True)
+    schedule_no = models.CharField(max_length=50, blank=True)
+    synced_at = models.DateTimeField()
+
+    class Meta:
+        db_table = "boat_availability"
+        indexes = [
+            # 검색: 날짜 구간 + 예약 가능 + 잔여석
+            models.Index(fields=["sail_date", "status_code", "remain_embarkation_num"]),
+            models.Index(fields=["boat", "sail_date"]),
+        ]
+
+    def __str__(self):
+        return f"{self.boat_id} {self.sail_date} {self.stime} ({self.status_code})"
+
+
+# 2-0-1. 선박 스케줄 월별 동기화 상태 (내용이 같으면 BoatAvailability 를 다시 쓰지 않음)
+class BoatScheduleMonth(models.Model):
+    boat = models.ForeignKey(
+        Boat, on_delete=models.CASCADE, related_name="schedule_months"
+    )
+    year_month = models.CharField(max_length=6)  # YYYYMM
+    content_hash = models.CharField(max_length=64)  # 스케줄 응답 sha256
+    synced_at = models.DateTimeField()  # 마지막으로 확인한 시각
+    changed_at = models.DateTimeField()  # 내용이 마지막으로 바뀐 시각
+
+    class Meta:
+        db_table = "boat_schedule_months"
+        unique_together = (("boat", "year_month"),)
+        indexes = [models.Index(fields=["synced_at"])]
+
+    def __str__(self):
+        return f"{self.boat_id} {self.year_month}"
+
+
 # 2-1. 선박 좋아요 (찜하기)
 class BoatLike(models.Model):
     like_id = models.AutoField(primary_key=True)
@@ -232,6 +320,23 @@ class Egi(models.Model):
         return self.name
 
 
+# 3-2. 에기 추천 근거 (pregenerate_reasons 명령이 미리 생성, 오래되면 백그라운드 재생성)
+class RecommendationReason(models.Model):
+    water_color = models.CharField(max_length=20)  # clear / medium / muddy
+    egi_color = models.CharField(max_length=20)  # red / blue ...
+    env_bucket = models.CharField(max_length=50, default="all")  # 환경 조건 구간
+    reason = models.TextField()
+    source = models.CharField(max_length=10)  # llm / rule (LLM 없이 기본 멘트)
+    generated_at = models.DateTimeField()
+
+    class Meta:
+        db_table = "recommendation_reasons"
+        unique_together = (("water_color", "egi_color", "env_bucket"),)
+
+    def __str__(self):
+        return f"{self.water_color}/{self.egi_color}/{self.env_bucket}"
+
+
 # 4. 낚시 일지 (메인)
 class Diary(models.Model):
     diary_id = models.AutoField(primary_key=True)
@@ -718,6 +718,9 @@ class EgiEnvironmentSerializer(serializers.Serializer):
     current_speed = serializers.FloatField(help_text="조류")
     wind_direction_deg = serializers.IntegerField(help_text="풍향 (각도)")
     wind_direction_16 = serializers.CharField(help_text="풍향 (16방위)")
+    buoy_age_sec = serializers.IntegerField(
+        allow_null=True, help_text="부이 관측값 수집 후 경과 시간(초)"
+    )
     fishing_index = serializers.CharField(help_text="낚시 지수")
     fishing_score = serializers.FloatField(help_text="낚시 점수")
     source = serializers.CharField(help_text="데이터 출처")
@@ -803,6 +806,14 @@ class OceanDataResponseSerializer(serializers.Serializer):
 
     sol_date = serializers.CharField(allow_null=True, help_text="기준 날짜")
 
+    # 부이 관측값 신선도
+    buoy_fetched_at = serializers.CharField(
+        allow_null=True, help_text="부이 관측값 수집 시각"
+    )
+    buoy_age_sec = serializers.IntegerField(
+        allow_null=True, help_text="부이 관측값 수집 후 경과 시간(초)"
+    )
+
 
 # ========================
 # 항구 Serializers
@@ -17,6 +17,7 @@ from .views import (
     ProfileCharacterListView,
     VerifyPasswordView,
     EgiRecommendView,
+    EgiRecommendStreamView,
     SignupView,
     LoginView,
     MeView,
@@ -24,6 +25,8 @@ from .views import (
     BoatScheduleView,
     BoatLikeToggleView,
     MyLikedBoatsView,
+    MetricsView,
+    HealthView,
 )
 
 urlpatterns = [
@@ -43,6 +46,11 @@ urlpatterns = [
     path("diaries/summary/", DiarySummaryView.as_view(), name="diary-summary"),
     # 에기 추천
     path("egi/recommend/", EgiRecommendView.as_view(), name="egi-recommend"),
+    path(
+        "egi/recommend/stream/",
+        EgiRecommendStreamView.as_view(),
+        name="egi-recommend-stream",
+    ),
     # 회원
     path("auth/signup/", SignupView.as_view(), name="auth-signup"),
     path("auth/login/", LoginView.as_view(), name="auth-login"),
@@ -73,4 +81,7 @@ urlpatterns = [
     path("boats/my-likes/", MyLikedBoatsView.as_view(), name="my-liked-boats"),
     # 항구 검색
     path("ports/search/", PortSearchView.as_view(), name="port-search"),
+    # 운영 지표 (관리자)
+    path("metrics/", MetricsView.as_view(), name="metrics"),
+    path("health/", HealthView.as_view(), name="health"),
 ]
@@ -1,5 +1,6 @@
 # backend/core/utils/ai_inference.py
 
+import gc
 import os
 
 # os.environ["CUDA_VISIBLE_DEVICES"] = "-1"
@@ -13,10 +14,11 @@ import pandas as pd
 from PIL import Image
 from datetime import datetime
 from django.conf import settings
-from tensorflow.keras.models import load_model
-import tensorflow as tf
-from ultralytics import YOLO
-from tensorflow.keras.applications.resnet50 import preprocess_input
+
+from . import lazy_resource
+
+# TensorFlow / Ultralytics 는 load_tensorflow_models() 안에서 import 한다.
+# (모델 서버를 쓰거나 ONNX 백엔드를 쓰면 이 무거운 라이브러리를 메모리에 올리지 않음)
 
 
 MODEL_DIR = os.path.join(settings.BASE_DIR, "core", "ai_models")
@@ -28,6 +30,9 @@ SCALER_PATH = os.path.join(MODEL_DIR, "scaler.pkl")
 LE_TARGET_PATH = os.path.join(MODEL_DIR, "le_target.pkl")
 META_COLS_PATH = os.path.join(MODEL_DIR, "metadata_cols.pkl")
 
+# 물색 분류 모델 출력 순서
+WATER_CLASSES = ["clear", "medium", "muddy"]
+
 
 def dev_print(*args, **kwargs):
     if os.getenv("APP_ENV") == "development":
@@ -43,58 +48,148 @@ yolo_model = None
 scaler = None
 metadata_cols = []
 EGI_CLASSES = []
+preprocess_input = None
 
 
 # ==========================================
 # 3. 모델 로딩 함수 (지연 로딩용)
 # ==========================================
-def load_ai_models():
-    """요청이 들어왔을 때 비로소 모델을 로딩함"""
+# 실제로 로드한 백엔드 ("onnx" / "tensorflow")
+loaded_backend = None
+
+
+def load_tensorflow_models():
+    """Keras(.h5) / Ultralytics(.pt) 원본 모델"""
+    from tensorflow.keras.models import load_model
+    from tensorflow.keras.applications.resnet50 import (
+        preprocess_input as resnet_preprocess_input,
+    )
+    from ultralytics import YOLO
+
+    models = {
+        "egi_rec_model": None,
+        "water_cls_model": None,
+        "yolo_model": None,
+        "preprocess_input": resnet_preprocess_input,
+    }
+    if os.path.exists(EGI_REC_PATH):
+        models["egi_rec_model"] = load_model(EGI_REC_PATH)
+        dev_print("✅ egi_rec_model 로드 성공")
+    if os.path.exists(WATER_CLS_PATH):
+        models["water_cls_model"] = load_model(WATER_CLS_PATH)
+        dev_print("✅ water_cls_model 로드 성공")
+    if os.path.exists(YOLO_PATH):
+        models["yolo_model"] = YOLO(YOLO_PATH)
+        dev_print("✅ yolo_model 로드 성공")
+    return models
+
+
+def _load_backend_models():
+    """
+    VISION_BACKEND 설정에 따라 모델 로드
+    - auto       : ONNX 파일과 onnxruntime 이 있으면 ONNX, 아니면 TensorFlow
+    - onnx       : ONNX 만 (없으면 TensorFlow 로 대체하며 경고)
+    - tensorflow : 원본 모델만
+    """
+    backend = getattr(settings, "VISION_BACKEND", "auto")
+
+    if backend in ("auto", "onnx"):
+        from .onnx_backend import load_onnx_models
+
+        try:
+            models = load_onnx_models()
+        except Exception as e:
+            print(f"⚠️ ONNX 모델 로드 실패: {e}")
+            models = None
+        if models is not None:
+            dev_print("✅ ONNX Runtime 모델 로드 성공")
+            return "onnx", models
+        if backend == "onnx":
+            print("⚠️ ONNX 모델을 사용할 수 없어 TensorFlow 모델로 대체합니다.")
+
+    return "tensorflow", load_tensorflow_models()
+
+
+def _load_vision_models():
+    """비전 모델 + 전처리 자료 로드 (lazy_resource 로더, 실패하면 예외 → 다음 요청에서 재시도)"""
     global egi_rec_model, water_cls_model, yolo_model, scaler, metadata_cols, EGI_CLASSES
+    global preprocess_input, loaded_backend
 
     dev_print("🔍 모델 파일 존재 여부:")
     dev_print(f"EGI_REC_PATH exists: {os.path.exists(EGI_REC_PATH)}")
     dev_print(f"WATER_CLS_PATH exists: {os.path.exists(WATER_CLS_PATH)}")
     dev_print(f"YOLO_PATH exists: {os.path.exists(YOLO_PATH)}")
 
-    # 이미 로딩되어 있다면 건너뜀
-    if egi_rec_model is not None and yolo_model is not None:
-        return
-
     dev_print(f"⏳ [Lazy Load] Vision AI (YOLO/Keras) 모델 로딩 시작...")
 
+    backend, models = _load_backend_models()
+    if models["egi_rec_model"] is None or models["yolo_model"] is None:
+        raise RuntimeError("egi / yolo 모델 파일이 없습니다.")
+
+    if os.path.exists(SCALER_PATH):
+        scaler = joblib.load(SCALER_PATH)
+        le_target = joblib.load(LE_TARGET_PATH)
+        metadata_cols = joblib.load(META_COLS_PATH)
+        EGI_CLASSES = list(le_target.classes_)
+    else:
+        EGI_CLASSES = [
+            "red",
+            "green",
+            "purple",
+            "blue",
+            "gold",
+            "silver",
+            "rainbow",
+        ]
+
+    loaded_backend = backend
+    egi_rec_model = models["egi_rec_model"]
+    water_cls_model = models["water_cls_model"]
+    yolo_model = models["yolo_model"]
+    preprocess_input = models["preprocess_input"]
+
+    dev_print(f"✅ Vision AI Models Loaded. ({loaded_backend})")
+    return models
+
+
+def _unload_vision_models(_models):
+    global egi_rec_model, water_cls_model, yolo_model, loaded_backend
+
+    egi_rec_model = water_cls_model = yolo_model = None
+    loaded_backend = None
+    gc.collect()
+
+
+# 한 번만 로드 (동시 첫 요청 합치기) + VISION_IDLE_UNLOAD_SECONDS 동안 안 쓰면 언로드
+_vision = lazy_resource.register(
+    "vision",
+    _load_vision_models,
+    _unload_vision_models,
+    idle_seconds=getattr(settings, "VISION_IDLE_UNLOAD_SECONDS", 0),
+)
+
+
+def load_ai_models():
+    """요청이 들어왔을 때 비로소 모델을 로딩함"""
     try:
-        if os.path.exists(EGI_REC_PATH):
-            egi_rec_model = load_model(EGI_REC_PATH)
-            dev_print("✅ egi_rec_model 로드 성공")
-        if os.path.exists(WATER_CLS_PATH):
-            water_cls_model = load_model(WATER_CLS_PATH)
-            dev_print("✅ water_cls_model 로드 성공")
-        if os.path.exists(YOLO_PATH):
-            yolo_model = YOLO(YOLO_PATH)
-            dev_print("✅ yolo_model 로드 성공")
-
-        if os.path.exists(SCALER_PATH):
-            scaler = joblib.load(SCALER_PATH)
-            le_target = joblib.load(LE_TARGET_PATH)
-            metadata_cols = joblib.load(META_COLS_PATH)
-            EGI_CLASSES = list(le_target.classes_)
-        else:
-            EGI_CLASSES = [
-                "red",
-                "green",
-                "purple",
-                "blue",
-                "gold",
-                "silver",
-                "rainbow",
-            ]
-
-        dev_print("✅ Vision AI Models Loaded.")
+        _vision.get()
     except Exception as e:
         print(f"⚠️ Vision AI Load Error: {e}")
 
 
+def warm_up_models():
+    """모델을 로드하고 더미 입력으로 한 번씩 실행 (첫 요청의 그래프 준비 비용을 미리 치름)"""
+    with _vision.acquire():
+        dummy = Image.new("RGB", (640, 480), (40, 90, 120))
+        yolo_model([dummy], verbose=False)
+
+        egi_in = np.zeros((1, 64, 64, 3), dtype=np.float32)
+        egi_rec_model.predict([egi_in, preprocess_env_data({})], verbose=0)
+        if water_cls_model:
+            water_in = np.zeros((1, 224, 224, 3), dtype=np.float32)
+            water_cls_model.predict(preprocess_input(water_in), verbose=0)
+
+
 # ==========================================
 # 4. 유틸리티 함수
 # ==========================================
@@ -146,100 +241,265 @@ def preprocess_env_data(marine_data):
 # 5. 추론 로직 (지연 로딩 적용)
 # ==========================================
 def predict_best_egi(image_file, marine_data):
-    dev_print(f"\n>>> AI Inference Start")
-
-    if egi_rec_model is None or yolo_model is None:
-        load_ai_models()
-
-    if not egi_rec_model or not yolo_model:
-        return None, None, {"error": "AI Models not ready"}
+    """
+    (추천 색상, 물색, debug_info)
+    MODEL_SERVER_ENABLED 이면 모델 서버(run_model_server)에 요청하고,
+    서버에 연결할 수 없으면 MODEL_SERVER_LOCAL_FALLBACK 설정에 따라 이 프로세스에서 추론
+    (서버가 추론 에러를 돌려준 경우는 대체하지 않고 에러로 응답)
+    """
+    if getattr(settings, "MODEL_SERVER_ENABLED", False):
+        from .model_server import (
+            ModelServerError,
+            ModelServerUnavailable,
+            predict_via_server,
+        )
 
-    debug_info = {}
+        try:
+            return predict_via_server(image_file, marine_data)
+        except ModelServerError as e:
+            print(f"⚠️ 모델 서버 추론 에러: {e}")
+            return None, None, {"error": f"AI model server error: {e}"}
+        except ModelServerUnavailable as e:
+            print(f"⚠️ 모델 서버 연결 실패: {e}")
+            if not getattr(settings, "MODEL_SERVER_LOCAL_FALLBACK", False):
+                return None, None, {"error": "AI model server unavailable"}
+            if hasattr(image_file, "seek"):
+                image_file.seek(0)
+
+    return infer(image_file, marine_data)
+
+
+def run_inference(image_file, marine_data):
+    """이 프로세스에 로드한 모델로 한 장 추론"""
+    return run_inference_batch([(image_file, marine_data)])[0]
+
+
+def inference_batching_enabled() -> bool:
+    """
+    추론 요청을 묶어 처리할지
+    모델 서버 프로세스는 MODEL_SERVER_BATCHING(기본 사용),
+    웹 워커에서 직접 추론할 때는 INFERENCE_BATCHING(기본 사용 안 함)
+    """
+    from .model_server import is_serving
+
+    if is_serving():
+        return getattr(settings, "MODEL_SERVER_BATCHING", True)
+    return getattr(settings, "INFERENCE_BATCHING", False)
+
+
+def infer(image_file, marine_data):
+    """
+    이 프로세스에서 추론. 묶음 처리를 쓰면 동시에 들어온 요청과 묶어서
+    (YOLO / Keras 모델을 배치로 한 번씩) 실행한다. (모델 서버도 이 함수를 호출)
+    """
+    if not inference_batching_enabled():
+        return run_inference(image_file, marine_data)
+    return _get_batcher().submit((image_file, marine_data))
+
+
+_batcher = None
+
+
+def _get_batcher():
+    global _batcher
+    if _batcher is None:
+        from .micro_batcher import MicroBatcher
+
+        _batcher = MicroBatcher(
+            run_inference_batch,
+            max_batch_size=getattr(settings, "INFERENCE_BATCH_MAX_SIZE", 8),
+            max_wait_ms=getattr(settings, "INFERENCE_BATCH_WAIT_MS", 10),
+            name="egi-inference",
+            metric_name="egi_inference",
+        )
+    return _batcher
+
+
+def decode_image(image_file, target_side=None):
+    """
+    업로드 이미지를 YOLO 입력 크기에 가깝게 디코딩 → (RGB 이미지, 원본 대비 배율)
+    JPEG 는 draft 모드로 DCT 단계에서 1/2·1/4·1/8 로 줄여 읽는다
+    (결과는 target_side × target_side 이상). 그 외 형식은 원본 크기 그대로
+    """
+    target_side = target_side or getattr(settings, "VISION_DECODE_SIZE", 640)
+    if hasattr(image_file, "seek"):
+        image_file.seek(0)
+
+    image = Image.open(image_file)
+    orig_width = image.size[0]
+    if target_side and image.format == "JPEG":
+        image.draft("RGB", (target_side, target_side))
+    image = image.convert("RGB")
+    return image, orig_width / image.size[0]
+
+
+def crop_for_models(image_file, image, scale, box, min_side=224):
+    """
+    모델 입력용 crop. 줄여 읽은 이미지에서 crop 한 영역이 min_side(물색 모델 입력)보다
+    작으면, 필요한 해상도로 다시 읽어 원본 좌표로 옮긴 박스로 crop 한다.
+    """
+    x1, y1, x2, y2 = box
+    short_side = min(x2 - x1, y2 - y1)
+    if scale <= 1 or short_side >= min_side or short_side <= 0:
+        return image.crop(box)
+
+    # 원본 기준으로 필요한 배율 (이 배율 이상으로 다시 읽음)
+    need = min(1.0, min_side / (short_side * scale))
+    if hasattr(image_file, "seek"):
+        image_file.seek(0)
+    source = Image.open(image_file)
+    orig_width, orig_height = source.size
+    source.draft("RGB", (int(orig_width * need), int(orig_height * need)))
+    source = source.convert("RGB")
+
+    ratio = scale * source.size[0] / orig_width  # 줄인 이미지 → 다시 읽은 이미지
+    return source.crop(tuple(int(round(v * ratio)) for v in box))
+
+
+def _first_box(yolo_result):
+    """YOLO 결과의 첫 번째 박스 ((x1, y1, x2, y2), conf). 감지된 것이 없으면 None"""
+    for box in yolo_result.boxes:
+        return tuple(map(int, box.xyxy[0])), float(box.conf[0])
+    return None
+
+
+def debug_images_enabled() -> bool:
+    """디버그 이미지(박스 그린 원본, crop) 생성 여부 (기본: 개발 모드에서만)"""
+    value = getattr(settings, "VISION_DEBUG_IMAGES", None)
+    if value is None:
+        return os.getenv("APP_ENV") == "development"
+    return value
+
+
+def build_debug_images(origin_pil, crop_pil, box, conf):
+    """박스를 그린 원본과 crop 을 JPEG base64 로 (개발 모드 응답용)"""
+    x1, y1, x2, y2 = box
+    debug_img_draw = cv2.cvtColor(np.array(origin_pil), cv2.COLOR_RGB2BGR)
+    cv2.rectangle(debug_img_draw, (x1, y1), (x2, y2), (0, 255, 0), 4)
+    cv2.putText(
+        debug_img_draw,
+        f"Water: {conf:.2f}",
+        (x1, y1 - 10),
+        cv2.FONT_HERSHEY_SIMPLEX,
+        0.9,
+        (0, 255, 0),
+        2,
+    )
+    crop_cv2 = cv2.cvtColor(np.array(crop_pil), cv2.COLOR_RGB2BGR)
+    return {
+        "yolo_image": f"data:image/jpeg;base64,{encode_image_to_base64(debug_img_draw)}",
+        "crop_image": f"data:image/jpeg;base64,{encode_image_to_base64(crop_cv2)}",
+    }
+
+
+def run_inference_batch(requests):
+    """
+    [(image_file, marine_data), ...] → [(추천 색상, 물색, debug_info), ...]
+    YOLO 와 두 Keras 모델을 요청 묶음 전체에 대해 한 번씩만 호출한다.
+    한 요청의 이미지가 잘못되어도 나머지 요청은 그대로 처리
+    """
+    dev_print(f"\n>>> AI Inference Start (batch {len(requests)})")
+
+    # 추론하는 동안은 유휴 언로드되지 않도록 빌려 둔다.
+    with _vision.acquire(required=False) as models:
+        if models is None:
+            return [(None, None, {"error": "AI Models not ready"}) for _ in requests]
+        return _run_inference_batch(requests)
+
+
+def _run_inference_batch(requests):
+    results = [None] * len(requests)
+
+    # 1. 이미지 로드 (YOLO 입력 크기에 가깝게 줄여 디코딩)
+    images, scales = {}, {}
+    for i, (image_file, _) in enumerate(requests):
+        try:
+            images[i], scales[i] = decode_image(image_file)
+        except Exception as e:
+            print(f"Critical AI Error: {e}")
+            results[i] = (None, None, {"error": str(e)})
 
+    # 2. YOLO 감지 (이미지 목록을 한 번에)
+    order = list(images)
     try:
-        # 1. 이미지 로드
-        origin_pil = Image.open(image_file).convert("RGB")
-        open_cv_image = cv2.cvtColor(np.array(origin_pil), cv2.COLOR_RGB2BGR)
-        debug_img_draw = open_cv_image.copy()
-
-        # 2. YOLO 감지
-        crop_pil = None
-        detected = False
-
-        results = yolo_model(origin_pil, verbose=False)
-
-        for r in results:
-            for box in r.boxes:
-                x1, y1, x2, y2 = map(int, box.xyxy[0])
-                conf = float(box.conf[0])
-
-                cv2.rectangle(debug_img_draw, (x1, y1), (x2, y2), (0, 255, 0), 4)
-                cv2.putText(
-                    debug_img_draw,
-                    f"Water: {conf:.2f}",
-                    (x1, y1 - 10),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.9,
-                    (0, 255, 0),
-                    2,
-                )
-
-                crop_pil = origin_pil.crop((x1, y1, x2, y2))
-                detected = True
-                debug_info["yolo_status"] = "detected"
-                break
-            if detected:
-                break
-
-        if not detected or crop_pil is None:
-            dev_print("⚠️ YOLO detected nothing. Request retry.")
-            return None, None, {"error": "No water detected"}
-
-        # 3. 후처리 및 추론
-        debug_info["yolo_image"] = (
-            f"data:image/jpeg;base64,{encode_image_to_base64(debug_img_draw)}"
-        )
-        crop_cv2 = cv2.cvtColor(np.array(crop_pil), cv2.COLOR_RGB2BGR)
-        debug_info["crop_image"] = (
-            f"data:image/jpeg;base64,{encode_image_to_base64(crop_cv2)}"
+        yolo_results = (
+            yolo_model([images[i] for i in order], verbose=False) if order else []
         )
+    except Exception as e:
+        print(f"Critical AI Error: {e}")
+        return [r or (None, None, {"error": str(e)}) for r in results]
 
-        img_input_egi = crop_pil.resize((64, 64))
-        img_array_egi = np.array(img_input_egi) / 255.0
-        img_array_egi = np.expand_dims(img_array_egi, axis=0)
+    # 3. 후처리 (crop → 모델 입력)
+    ready = []  # (요청 index, debug_info)
+    egi_inputs, water_inputs, env_inputs = [], [], []
+    with_debug_images = debug_images_enabled()
+    for i, yolo_result in zip(order, yolo_results):
+        try:
+            detection = _first_box(yolo_result)
+            if detection is None:
+                dev_print("⚠️ YOLO detected nothing. Request retry.")
+                results[i] = (None, None, {"error": "No water detected"})
+                continue
+
+            box, conf = detection
+            crop_pil = crop_for_models(requests[i][0], images[i], scales[i], box)
+            debug_info = {"yolo_status": "detected"}
+            # 디버그 이미지는 개발 모드에서만 (원본 복사/그리기/인코딩 생략)
+            if with_debug_images:
+                debug_info.update(build_debug_images(images[i], crop_pil, box, conf))
+
+            img_input_egi = crop_pil.resize((64, 64))
+            img_array_egi = np.array(img_input_egi) / 255.0
+
+            img_input_water = crop_pil.resize((224, 224))
+            img_array_water = np.array(img_input_water, dtype=np.float32)
+
+            env_vector = preprocess_env_data(requests[i][1])
+        except Exception as e:
+            print(f"Critical AI Error: {e}")
+            results[i] = (None, None, {"error": str(e)})
+            continue
 
-        img_input_water = crop_pil.resize((224, 224))
-        img_array_water = np.array(img_input_water, dtype=np.float32)
-        img_array_water = np.expand_dims(img_array_water, axis=0)
-        img_array_water = preprocess_input(img_array_water)
+        ready.append((i, debug_info))
+        egi_inputs.append(img_array_egi)
+        water_inputs.append(img_array_water)
+        env_inputs.append(env_vector)
 
-        env_vector = preprocess_env_data(marine_data)
+    if not ready:
+        return results
 
-        recommended_color = ""
-        try:
-            egi_pred = egi_rec_model.predict([img_array_egi, env_vector], verbose=0)
-            best_idx = np.argmax(egi_pred[0])
+    # 4. Keras 모델 추론 (쌓은 배열로 한 번에)
+    recommended_colors = [""] * len(ready)
+    try:
+        egi_pred = egi_rec_model.predict(
+            [np.stack(egi_inputs), np.concatenate(env_inputs, axis=0)], verbose=0
+        )
+        for n, row in enumerate(egi_pred):
+            best_idx = np.argmax(row)
             if best_idx < len(EGI_CLASSES):
-                recommended_color = EGI_CLASSES[best_idx]
-        except Exception as e:
-            dev_print(f"Egi Model Error: {e}")
-
-        water_color_result = ""
-        if water_cls_model:
-            try:
-                water_pred = water_cls_model.predict(img_array_water, verbose=0)
-                w_idx = np.argmax(water_pred[0])
-                water_classes = ["clear", "medium", "muddy"]
-                if w_idx < len(water_classes):
-                    water_color_result = water_classes[w_idx]
-            except:
-                pass
+                recommended_colors[n] = EGI_CLASSES[best_idx]
+    except Exception as e:
+        dev_print(f"Egi Model Error: {e}")
 
+    water_colors = [""] * len(ready)
+    if water_cls_model:
+        try:
+            water_pred = water_cls_model.predict(
+                preprocess_input(np.stack(water_inputs)), verbose=0
+            )
+            for n, row in enumerate(water_pred):
+                w_idx = np.argmax(row)
+                if w_idx < len(WATER_CLASSES):
+                    water_colors[n] = WATER_CLASSES[w_idx]
+        except:
+            pass
+
+    # 5. 요청별로 나누기
+    for (i, debug_info), recommended_color, water_color_result in zip(
+        ready, recommended_colors, water_colors
+    ):
         debug_info["final_decision"] = recommended_color
         debug_info["ai_prediction"] = water_color_result
+        results[i] = (recommended_color, water_color_result, debug_info)
 
-        return recommended_color, water_color_result, debug_info
-
-    except Exception as e:
-        print(f"Critical AI Error: {e}")
-        return None, None, {"error": str(e)}
+    return results
@@ -0,0 +1,441 @@
+# core/utils/boat_availability.py
+"""
+선박 예약 가능 현황 (BoatAvailability) 동기화 / 조회
+
+- sync_boat_availability 배치가 전체 선박의 스케줄을 월 단위로 받아
+  BoatAvailability 테이블을 (선박, 월) 단위로 교체
+  (응답 내용 해시가 같은 달은 다시 쓰지 않음 - BoatScheduleMonth)
+- sync_liked_boats 워커는 찜한 선박만 더 짧은 주기로 순환 동기화
+- 선박 검색은 이 테이블로 날짜 구간 + 인원 조건을 SQL 에서 먼저 거른 뒤
+  페이지를 나누므로, 요청 중 외부 API 호출이 없고 전체 개수/깊은 페이지가 정확하다.
+- 동기화 범위 밖 날짜를 검색하거나 동기화가 오래 멈췄으면 호출자가
+  기존 실시간 조회로 대체한다 (availability_covers)
+  범위 안이어도 받지 못한 선박(다운로드 실패, 새로 추가)은 그 선박만 실시간 조회
+- 선박별 최신 여부는 BoatScheduleMonth.synced_at 으로 판단한다 (synced_boat_ids)
+  → 찜 목록은 전체 동기화 없이 sync_liked_boats 만 돌아도 예약 현황을 쓴다.
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Exists, Min, OuterRef, Q
+from django.utils import timezone
+
+from . import metrics
+from .boat_schedule_service import (
+    _download_month_schedule,
+    _months_in_range,
+    _parse_date,
+    _safe_get,
+)
+
+# 마지막 동기화 정보 {"through": "YYYY-MM-DD", "synced_at": epoch}
+SYNC_STATE_CACHE_KEY = "boat_availability:sync_state"
+
+
+# 개발 모드용 출력 함수
+def dev_print(*args, **kwargs):
+    if os.getenv("APP_ENV") == "development":
+        print(*args, **kwargs)
+
+
+def today_kst() -> date:
+    return (datetime.utcnow() + timedelta(hours=9)).date()
+
+
+def _to_int(value, default=None):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _month_bounds(year_month: str):
+    first = date(int(year_month[:4]), int(year_month[4:]), 1)
+    next_first = (first + timedelta(days=32)).replace(day=1)
+    return first, next_first - timedelta(days=1)
+
+
+# ==========================================
+# 동기화 (manage.py sync_boat_availability)
+# ==========================================
+def _availability_rows(boat, schedules, synced_at):
+    from core.models import BoatAvailability
+
+    rows = []
+    for sc in schedules:
+        sail_date = _parse_date(_safe_get(sc, "sdate", ""))
+        if not sail_date:
+            continue
+        rows.append(
+            BoatAvailability(
+                boat=boat,
+                sail_date=sail_date,
+                stime=_safe_get(sc, "stime", ""),
+                etime=_safe_get(sc, "etime", ""),
+                status=_safe_get(sc, "status", ""),
+                status_code=_safe_get(sc, "status_code", ""),
+                remain_embarkation_num=_to_int(
+                    _safe_get(sc, "remain_embarkation_num", 0), 0
+                ),
+                embarkation_num=_to_int(_safe_get(sc, "embarkation_num", 0), 0),
+                price=_to_int(_safe_get(sc, "price")),
+                fish_type=_safe_get(sc, "fish_type", ""),
+                fishing_method=_safe_get(sc, "fishing_method", ""),
+                tide_water=_safe_get(sc, "tide_water", ""),
+                schedule_no=str(_safe_get(sc, "schedule_no", "")),
+                synced_at=synced_at,
+            )
+        )
+    return rows
+
+
+def replace_month_availability(boat, year_month, schedules, synced_at=None) -> int:
+    """(선박, 월) 의 예약 현황을 schedules 로 교체. 저장한 행 수 반환"""
+    from core.models import BoatAvailability
+
+    first, last = _month_bounds(year_month)
+    rows = _availability_rows(boat, schedules, synced_at or timezone.now())
+
+    with transaction.atomic():
+        BoatAvailability.objects.filter(
+            boat=boat, sail_date__range=(first, last)
+        ).delete()
+        BoatAvailability.objects.bulk_create(rows)
+    return len(rows)
+
+
+def _content_hash(schedules) -> str:
+    payload = json.dumps(schedules, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def sync_boat_months(pairs, max_workers: int = 10, metric_prefix: str = "boat_sync"):
+    """
+    (선박, YYYYMM) 목록의 스케줄을 동시에 받아 BoatAvailability 에 반영.
+    - 응답 내용(sha256)이 지난번과 같으면 행을 다시 쓰지 않고 synced_at 만 갱신
+    - 받아오지 못한 달은 기존 행을 유지
+    처리 결과와 처리량은 metric_prefix 아래 지표로도 남긴다.
+    """
+    from core.models import BoatScheduleMonth
+
+    pairs = list(pairs)
+    started = time.monotonic()
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="boat-availability"
+    ) as executor:
+        results = list(
+            executor.map(lambda p: _download_month_schedule(p[0].ship_no, p[1]), pairs)
+        )
+
+    existing = {
+        (m.boat_id, m.year_month): m
+        for m in BoatScheduleMonth.objects.filter(
+            boat__in={boat for boat, _ in pairs},
+            year_month__in={ym for _, ym in pairs},
+        )
+    }
+
+    now = timezone.now()
+    changed = unchanged = failed = saved = 0
+    unchanged_ids = []
+
+    for (boat, ym), schedules in zip(pairs, results):
+        if schedules is None:
+            failed += 1
+            continue
+
+        content_hash = _content_hash(schedules)
+        month = existing.get((boat.boat_id, ym))
+        if month is not None and month.content_hash == content_hash:
+            unchanged += 1
+            unchanged_ids.append(month.pk)
+            continue
+
+        saved += replace_month_availability(boat, ym, schedules, now)
+        BoatScheduleMonth.objects.update_or_create(
+            boat=boat,
+            year_month=ym,
+            defaults={"content_hash": content_hash, "synced_at": now, "changed_at": now},
+        )
+        changed += 1
+
+    if unchanged_ids:
+        BoatScheduleMonth.objects.filter(pk__in=unchanged_ids).update(synced_at=now)
+
+    elapsed = time.monotonic() - started
+    stats = {
+        "months": len(pairs),
+        "changed": changed,
+        "unchanged": unchanged,
+        "failed": failed,
+        "rows": saved,
+        "elapsed": elapsed,
+    }
+
+    metrics.incr(f"{metric_prefix}.months_synced", len(pairs) - failed)
+    metrics.incr(f"{metric_prefix}.months_changed", changed)
+    metrics.incr(f"{metric_prefix}.months_unchanged", unchanged)
+    metrics.incr(f"{metric_prefix}.months_failed", failed)
+    metrics.set_gauge(f"{metric_prefix}.last_run_at", now.isoformat())
+    metrics.set_gauge(f"{metric_prefix}.last_run_seconds", round(elapsed, 3))
+    if pairs and elapsed > 0:
+        metrics.set_gauge(
+            f"{metric_prefix}.months_per_second", round(len(pairs) / elapsed, 2)
+        )
+
+    return stats
+
+
+def sync_boat_availability(days: Optional[int] = None, max_workers: int = 10):
+    """
+    전체 선박의 오늘 ~ days 일 뒤까지(월 단위) 스케줄을 받아 BoatAvailability 반영.
+    """
+    from core.models import Boat, BoatAvailability
+
+    days = days or getattr(settings, "BOAT_AVAILABILITY_DAYS", 30)
+    today = today_kst()
+    through = today + timedelta(days=days)
+    months = _months_in_range(today, through)
+
+    boats = list(Boat.objects.all())
+    stats = sync_boat_months(
+        [(boat, ym) for boat in boats for ym in months],
+        max_workers=max_workers,
+        metric_prefix="availability_sync",
+    )
+
+    # 지난 날짜 정리
+    BoatAvailability.objects.filter(sail_date__lt=today).delete()
+
+    # 받지 못한 달이 있어도 상태는 기록한다. (그 선박은 synced_boat_ids 에서 빠져
+    # 검색 때 실시간 조회로 대체됨)
+    cache.set(
+        SYNC_STATE_CACHE_KEY,
+        {
+            "through": through.isoformat(),
+            "synced_at": time.time(),
+            "failed": stats["failed"],
+        },
+        None,
+    )
+
+    return {"boats": len(boats), **stats}
+
+
+def sync_liked_boats(
+    days: Optional[int] = None,
+    max_workers: int = 10,
+    batch_size: int = 200,
+    max_age: int = 600,
+):
+    """
+    찜한 선박(BoatLike)의 (선박, 월) 중 max_age 초 넘게 확인하지 않은 것부터
+    batch_size 개씩 동기화 (--loop 로 돌리면 찜한 선박 전체가 순환하며 갱신됨).
+    동기화 후 가장 오래된 확인 시각까지의 지연을 liked_sync.lag_seconds 로 남긴다.
+    """
+    from core.models import Boat, BoatLike, BoatScheduleMonth
+
+    days = days or getattr(settings, "BOAT_AVAILABILITY_DAYS", 30)
+    today = today_kst()
+    months = _months_in_range(today, today + timedelta(days=days))
+
+    boats = list(Boat.objects.filter(likes__isnull=False).distinct())
+    synced = {
+        (boat_id, ym): synced_at
+        for boat_id, ym, synced_at in BoatScheduleMonth.objects.filter(
+            boat__in=boats, year_month__in=months
+        ).values_list("boat_id", "year_month", "synced_at")
+    }
+
+    now = timezone.now()
+    threshold = now - timedelta(seconds=max_age)
+    oldest = now - timedelta(days=3650)  # 한 번도 받지 않은 달이 가장 먼저
+
+    due = [
+        (boat, ym)
+        for boat in boats
+        for ym in months
+        if synced.get((boat.boat_id, ym), oldest) < threshold
+    ]
+    due.sort(key=lambda p: synced.get((p[0].boat_id, p[1]), oldest))
+    batch = due[:batch_size]
+
+    stats = sync_boat_months(batch, max_workers=max_workers, metric_prefix="liked_sync")
+
+    # 지연: 찜한 선박의 (선박, 월) 중 가장 오래 확인하지 않은 것의 경과 시간
+    # 한 번도 받지 않은 달은 찜한 시각부터 기다린 것으로 본다.
+    now = timezone.now()
+    synced_after = {
+        (boat_id, ym): synced_at
+        for boat_id, ym, synced_at in BoatScheduleMonth.objects.filter(
+            boat__in=boats, year_month__in=months
+        ).values_list("boat_id", "year_month", "synced_at")
+    }
+    liked_since = dict(
+        BoatLike.objects.filter(boat__in=boats)
+        .values("boat_id")
+        .annotate(first=Min("created_at"))
+        .values_list("boat_id", "first")
+    )
+    waiting_since = [
+        synced_after.get((boat.boat_id, ym), liked_since.get(boat.boat_id, now))
+        for boat in boats
+        for ym in months
+    ]
+    never_synced = sum(
+        1 for boat in boats for ym in months if (boat.boat_id, ym) not in synced_after
+    )
+    threshold = now - timedelta(seconds=max_age)
+    pending = sum(
+        1
+        for boat in boats
+        for ym in months
+        if synced_after.get((boat.boat_id, ym), oldest) < threshold
+    )
+    lag = (now - min(waiting_since)).total_seconds() if waiting_since else 0.0
+
+    metrics.set_gauge("liked_sync.lag_seconds", round(lag))
+    metrics.set_gauge("liked_sync.pending_months", pending)
+    metrics.set_gauge("liked_sync.never_synced_months", never_synced)
+
+    return {
+        "boats": len(boats),
+        "due": len(due),
+        "lag": lag,
+        "pending": pending,
+        **stats,
+    }
+
+
+# ==========================================
+# 검색 시 조회
+# ==========================================
+def availability_covers(end_date: date) -> bool:
+    """
+    end_date 까지 최근에 동기화된 예약 현황이 있는지 (전체 동기화 기준)
+    선박 하나하나가 최신인지는 synced_boat_ids 로 따로 확인한다.
+    """
+    if not getattr(settings, "BOAT_AVAILABILITY_ENABLED", True):
+        return False
+
+    state = cache.get(SYNC_STATE_CACHE_KEY)
+    if not state:
+        return False
+
+    age = time.time() - state["synced_at"]
+    if age > getattr(settings, "BOAT_AVAILABILITY_MAX_AGE", 10800):
+        dev_print(f"[예약현황] 동기화가 {age:.0f}초 전에 멈춤 → 실시간 조회")
+        return False
+    return date.fromisoformat(state["through"]) >= end_date
+
+
+def _fresh_months_qs(start_date: date, end_date: date):
+    """기간의 달 중 BOAT_AVAILABILITY_MAX_AGE 안에 확인한 BoatScheduleMonth"""
+    from core.models import BoatScheduleMonth
+
+    fresh_after = timezone.now() - timedelta(
+        seconds=getattr(settings, "BOAT_AVAILABILITY_MAX_AGE", 10800)
+    )
+    return BoatScheduleMonth.objects.filter(
+        year_month__in=_months_in_range(start_date, end_date),
+        synced_at__gte=fresh_after,
+    )
+
+
+def synced_boat_ids(boat_ids: Iterable[int], start_date: date, end_date: date) -> set:
+    """
+    start_date ~ end_date 의 모든 달을 BOAT_AVAILABILITY_MAX_AGE 안에 확인한 선박 id
+    (전체 동기화 / 찜한 선박 동기화 어느 쪽이 받았든 BoatScheduleMonth 기준)
+    """
+    if not getattr(settings, "BOAT_AVAILABILITY_ENABLED", True):
+        return set()
+
+    boat_ids = list(boat_ids)
+    months = _months_in_range(start_date, end_date)
+
+    fresh_months: Dict[int, set] = {}
+    for boat_id, ym in (
+        _fresh_months_qs(start_date, end_date)
+        .filter(boat_id__in=boat_ids)
+        .values_list("boat_id", "year_month")
+    ):
+        fresh_months.setdefault(boat_id, set()).add(ym)
+    return {b for b in boat_ids if fresh_months.get(b, set()) >= set(months)}
+
+
+def _available_qs(start_date: date, end_date: date, min_passengers: int):
+    from core.models import BoatAvailability
+
+    return BoatAvailability.objects.filter(
+        sail_date__range=(start_date, end_date),
+        status_code="ING",
+        remain_embarkation_num__gte=min_passengers,
+    )
+
+
+def filter_available_boats(qs, start_date: date, end_date: date, min_passengers: int):
+    """
+    Boat queryset 을 기간 안에 예약 가능한 출항이 있는 선박으로 제한
+    기간의 달을 아직(또는 최근에) 받지 못한 선박은 예약 현황 행이 없어도 남겨 둔다.
+    (동기화 실패, 동기화 뒤에 추가된 선박 → 호출자가 synced_boat_ids 로 골라 실시간 조회)
+    """
+    fresh = _fresh_months_qs(start_date, end_date)
+    synced = Q()
+    for ym in _months_in_range(start_date, end_date):
+        synced &= Q(Exists(fresh.filter(boat=OuterRef("pk"), year_month=ym)))
+
+    return qs.filter(
+        Q(
+            Exists(
+                _available_qs(start_date, end_date, min_passengers).filter(
+                    boat=OuterRef("pk")
+                )
+            )
+        )
+        | ~synced
+    )
+
+
+def _schedule_summary(row) -> Dict[str, Any]:
+    """find_nearest_available_schedule 와 같은 형태의 요약"""
+    return {
+        "sdate": row.sail_date.isoformat(),
+        "stime": row.stime or None,
+        "etime": row.etime or None,
+        "status": row.status or None,
+        "status_code": row.status_code or None,
+        "remain_embarkation_num": row.remain_embarkation_num,
+        "embarkation_num": row.embarkation_num,
+        "price": row.price,
+        "fish_type": row.fish_type or None,
+        "fishing_method": row.fishing_method or None,
+        "tide_water": row.tide_water or None,
+        "schedule_no": row.schedule_no or None,
+    }
+
+
+def nearest_available_by_boat(
+    boat_ids: Iterable[int], start_date: date, end_date: date, min_passengers: int
+) -> Dict[int, Dict[str, Any]]:
+    """boat_id → 기간 안 가장 가까운 예약 가능 출항 요약 (쿼리 1번)"""
+    rows = (
+        _available_qs(start_date, end_date, min_passengers)
+        .filter(boat_id__in=list(boat_ids))
+        .order_by("boat_id", "sail_date", "stime")
+    )
+
+    result: Dict[int, Dict[str, Any]] = {}
+    for row in rows:
+        if row.boat_id not in result:
+            result[row.boat_id] = _schedule_summary(row)
+    return result
@@ -2,15 +2,30 @@
 
 import os
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import requests
+from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+
+from .single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
 SCHEDULE_BASE_URL = "https://api.sunsang24.com/ship/schedule_fleet_list"
 
+# (ship_no, YYYYMM) 단위 스케줄 캐시
+# - BOAT_SCHEDULE_CACHE_TTL 초 동안은 그대로 사용 (fresh)
+# - 그 뒤 BOAT_SCHEDULE_STALE_TTL 초 동안은 이전 값을 바로 돌려주고
+#   백그라운드에서 다시 받아 둔다 (stale-while-revalidate)
+SCHEDULE_CACHE_KEY = "boat_schedule:{ship_no}:{year_month}"
+SCHEDULE_REFRESH_LOCK_KEY = "boat_schedule:refreshing:{ship_no}:{year_month}"
+
 
 # 개발 모드용 출력 함수
 def dev_print(*args, **kwargs):
@@ -30,10 +45,51 @@ def _parse_date(date_str: str) -> Optional[date]:
         return None
 
 
-def fetch_month_schedule(ship_no: int, year_month: str) -> List[Dict[str, Any]]:
+# 스케줄 조회용 공용 스레드 풀 / HTTP 세션 (프로세스당 1개)
+_executor = None
+_session = None
+_init_lock = threading.Lock()
+_month_flight = SingleFlight()
+
+
+def _max_workers():
+    return getattr(settings, "BOAT_SCHEDULE_MAX_WORKERS", 10)
+
+
+def _get_executor():
+    global _executor
+
+    if _executor is None:
+        with _init_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=_max_workers(), thread_name_prefix="boat-schedule"
+                )
+    return _executor
+
+
+def _get_session():
+    """sunsang24 와의 keep-alive 커넥션을 재사용하는 세션"""
+    global _session
+
+    if _session is None:
+        with _init_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_max_workers())
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def _download_month_schedule(
+    ship_no: int, year_month: str
+) -> Optional[List[Dict[str, Any]]]:
     """
-    한 달치 스케줄 조회
+    한 달치 스케줄 API 호출
     year_month: 'YYYYMM'
+    실패하면 None (빈 달은 [])
     """
     url = f"{SCHEDULE_BASE_URL}/{ship_no}/{year_month}"
     params = {
@@ -45,12 +101,12 @@ def fetch_month_schedule(ship_no: int, year_month: str) -> List[Dict[str, Any]]:
     dev_print(f"[선박스케줄] [요청시작] {ship_no}번 선박 / {year_month} 조회 중...")
 
     try:
-        resp = requests.get(url, params=params, timeout=5)  # 타임아웃 5초로 늘림
+        resp = _get_session().get(url, params=params, timeout=5)  # 타임아웃 5초로 늘림
 
         # 1. 응답 실패 시
         if resp.status_code != 200:
             print(f"[선박스케줄] [응답실패] Status Code: {resp.status_code}")
-            return []
+            return None
 
         data = resp.json()
 
@@ -90,7 +146,113 @@ def fetch_month_schedule(ship_no: int, year_month: str) -> List[Dict[str, Any]]:
     except Exception as e:
         # 4. 에러 발생 시 로그 출력
         print(f"[선박스케줄] [Error] {e}")
-        return []
+        return None
+
+
+# ==========================================
+# (ship_no, YYYYMM) 캐시
+# ==========================================
+def _cache_key(ship_no, year_month):
+    return SCHEDULE_CACHE_KEY.format(ship_no=ship_no, year_month=year_month)
+
+
+def _store_month(ship_no, year_month, schedules):
+    fresh = getattr(settings, "BOAT_SCHEDULE_CACHE_TTL", 60)
+    stale = getattr(settings, "BOAT_SCHEDULE_STALE_TTL", 600)
+    cache.set(
+        _cache_key(ship_no, year_month),
+        {"schedules": schedules, "fetched_at": time.time()},
+        fresh + stale,
+    )
+
+
+def _load_month(ship_no, year_month) -> List[Dict[str, Any]]:
+    """API 호출 후 캐시에 저장 (같은 달 동시 요청은 한 번만 호출)"""
+
+    def _load():
+        schedules = _download_month_schedule(ship_no, year_month)
+        if schedules is None:
+            return []
+        _store_month(ship_no, year_month, schedules)
+        return schedules
+
+    return _month_flight.do((ship_no, year_month), _load)
+
+
+def _revalidate_in_background(ship_no, year_month):
+    """오래된 캐시를 백그라운드에서 다시 받기 (프로세스 간 중복 방지)"""
+    lock_key = SCHEDULE_REFRESH_LOCK_KEY.format(ship_no=ship_no, year_month=year_month)
+    if not cache.add(lock_key, 1, 30):
+        return
+
+    def _refresh():
+        try:
+            _load_month(ship_no, year_month)
+        finally:
+            cache.delete(lock_key)
+
+    _get_executor().submit(_refresh)
+
+
+def _use_cached(ship_no, year_month, entry) -> List[Dict[str, Any]]:
+    """캐시 값을 돌려주고, fresh 기간이 지났으면 백그라운드 갱신 예약"""
+    age = time.time() - entry["fetched_at"]
+    if age > getattr(settings, "BOAT_SCHEDULE_CACHE_TTL", 60):
+        dev_print(f"[선박스케줄] [STALE] {ship_no} / {year_month} ({age:.0f}s)")
+        _revalidate_in_background(ship_no, year_month)
+    return entry["schedules"]
+
+
+def fetch_month_schedule(ship_no: int, year_month: str) -> List[Dict[str, Any]]:
+    """
+    한 달치 스케줄 조회 (캐시 우선)
+    year_month: 'YYYYMM'
+    """
+    entry = cache.get(_cache_key(ship_no, year_month))
+    if entry is not None:
+        return _use_cached(ship_no, year_month, entry)
+    return _load_month(ship_no, year_month)
+
+
+def fetch_month_schedules(
+    pairs: Iterable[Tuple[int, str]]
+) -> Dict[Tuple[int, str], List[Dict[str, Any]]]:
+    """
+    여러 (ship_no, YYYYMM) 를 한 번에 조회.
+    캐시에 없는 달만 공용 세션으로 동시에 받는다.
+    """
+    pairs = list(dict.fromkeys(pairs))
+    cached = cache.get_many([_cache_key(ship_no, ym) for ship_no, ym in pairs])
+
+    result: Dict[Tuple[int, str], List[Dict[str, Any]]] = {}
+    missing = []
+    for ship_no, ym in pairs:
+        entry = cached.get(_cache_key(ship_no, ym))
+        if entry is not None:
+            result[(ship_no, ym)] = _use_cached(ship_no, ym, entry)
+        else:
+            missing.append((ship_no, ym))
+
+    if missing:
+        dev_print(f"[선박스케줄] 캐시 없음 {len(missing)}건 동시 조회")
+        # 공용 풀은 백그라운드 갱신도 쓰므로, 요청 안의 일괄 조회는 별도 풀 사용
+        with ThreadPoolExecutor(
+            max_workers=min(len(missing), _max_workers()),
+            thread_name_prefix="boat-schedule-batch",
+        ) as executor:
+            loaded = executor.map(lambda p: _load_month(*p), missing)
+            result.update(zip(missing, loaded))
+
+    return result
+
+
+def _months_in_range(start_date: date, end_date: date) -> List[str]:
+    months = set()
+    cur = start_date
+    while cur <= end_date:
+        months.add(cur.strftime("%Y%m"))
+        cur = cur + timedelta(days=1)
+    return sorted(months)
 
 
 def find_nearest_available_schedule(
@@ -106,16 +268,50 @@ def find_nearest_available_schedule(
     start_date = base_date
     end_date = base_date + timedelta(days=max_days)
 
-    months = set()
-    cur = start_date
-    while cur <= end_date:
-        months.add(cur.strftime("%Y%m"))
-        cur = cur + timedelta(days=1)
-
     all_schedules: List[Dict[str, Any]] = []
-    for ym in sorted(months):
+    for ym in _months_in_range(start_date, end_date):
         all_schedules.extend(fetch_month_schedule(ship_no, ym))
 
+    return _pick_nearest_schedule(all_schedules, start_date, end_date, min_passengers)
+
+
+def find_nearest_available_schedules(
+    ship_nos: Iterable[int],
+    base_date: date,
+    max_days: int = 7,
+    min_passengers: int = 1,
+) -> Dict[int, Optional[Dict[str, Any]]]:
+    """
+    여러 선박의 find_nearest_available_schedule 결과를 한 번에 계산
+    (필요한 모든 달을 동시에 받아서 페이지 크기와 관계없이 한 번의 대기로 끝남)
+    """
+    start_date = base_date
+    end_date = base_date + timedelta(days=max_days)
+    months = _months_in_range(start_date, end_date)
+    ship_nos = list(dict.fromkeys(ship_nos))
+
+    month_schedules = fetch_month_schedules(
+        (ship_no, ym) for ship_no in ship_nos for ym in months
+    )
+
+    result = {}
+    for ship_no in ship_nos:
+        all_schedules: List[Dict[str, Any]] = []
+        for ym in months:
+            all_schedules.extend(month_schedules.get((ship_no, ym), []))
+        result[ship_no] = _pick_nearest_schedule(
+            all_schedules, start_date, end_date, min_passengers
+        )
+    return result
+
+
+def _pick_nearest_schedule(
+    all_schedules: List[Dict[str, Any]],
+    start_date: date,
+    end_date: date,
+    min_passengers: int,
+) -> Optional[Dict[str, Any]]:
+    """스케줄 목록에서 예약 가능 + 잔여석 충분한 가장 가까운 1건"""
     # 필터링
     candidates: List[Dict[str, Any]] = []
     for sc in all_schedules:
@@ -193,15 +389,12 @@ def get_schedules_in_range(
     start_date = base_date
     end_date = base_date + timedelta(days=days - 1)
 
-    months = set()
-    cur = start_date
-    while cur <= end_date:
-        months.add(cur.strftime("%Y%m"))
-        cur = cur + timedelta(days=1)
+    months = _months_in_range(start_date, end_date)
+    month_schedules = fetch_month_schedules((ship_no, ym) for ym in months)
 
     all_schedules: List[Dict[str, Any]] = []
-    for ym in sorted(months):
-        all_schedules.extend(fetch_month_schedule(ship_no, ym))
+    for ym in months:
+        all_schedules.extend(month_schedules.get((ship_no, ym), []))
 
     result: List[Dict[str, Any]] = []
     for sc in all_schedules:
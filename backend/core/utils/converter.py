@@ -6,21 +6,20 @@
 import math
 
 
-def map_to_grid(lat, lon):
-    """
-    위도(lat), 경도(lon)를 기상청 격자 좌표(nx, ny)로 변환
-    """
-    RE = 6371.00877  # 지구 반경(km)
-    GRID = 5.0  # 격자 간격(km)
-    SLAT1 = 30.0  # 투영 위도1(degree)
-    SLAT2 = 60.0  # 투영 위도2(degree)
-    OLON = 126.0  # 기준점 경도(degree)
-    OLAT = 38.0  # 기준점 위도(degree)
-    XO = 43  # 기준점 X좌표(GRID)
-    YO = 136  # 기준점 Y좌표(GRID)
+RE = 6371.00877  # 지구 반경(km)
+GRID = 5.0  # 격자 간격(km)
+SLAT1 = 30.0  # 투영 위도1(degree)
+SLAT2 = 60.0  # 투영 위도2(degree)
+OLON = 126.0  # 기준점 경도(degree)
+OLAT = 38.0  # 기준점 위도(degree)
+XO = 43  # 기준점 X좌표(GRID)
+YO = 136  # 기준점 Y좌표(GRID)
+
+DEGRAD = math.pi / 180.0
 
-    DEGRAD = math.pi / 180.0
 
+def _lcc_params():
+    """람베르트 정각원추도법 투영 상수 (re, olon, sn, sf, ro)"""
     re = RE / GRID
     slat1 = SLAT1 * DEGRAD
     slat2 = SLAT2 * DEGRAD
@@ -33,6 +32,14 @@ def map_to_grid(lat, lon):
     sf = (math.pow(sf, sn) * math.cos(slat1)) / sn
     ro = math.tan(math.pi * 0.25 + olat * 0.5)
     ro = (re * sf) / math.pow(ro, sn)
+    return re, olon, sn, sf, ro
+
+
+def map_to_grid(lat, lon):
+    """
+    위도(lat), 경도(lon)를 기상청 격자 좌표(nx, ny)로 변환
+    """
+    re, olon, sn, sf, ro = _lcc_params()
 
     ra = math.tan(math.pi * 0.25 + (lat) * DEGRAD * 0.5)
     ra = (re * sf) / math.pow(ra, sn)
@@ -48,3 +55,29 @@ def map_to_grid(lat, lon):
     y = int(ro - ra * math.cos(theta) + YO + 0.5)
 
     return x, y
+
+
+def grid_to_map(nx, ny):
+    """
+    기상청 격자 좌표(nx, ny) → 격자 중심의 위도, 경도
+    """
+    re, olon, sn, sf, ro = _lcc_params()
+
+    xn = nx - XO
+    yn = ro - ny + YO
+    ra = math.sqrt(xn * xn + yn * yn)
+    if sn < 0.0:
+        ra = -ra
+
+    alat = math.pow((re * sf / ra), (1.0 / sn))
+    alat = 2.0 * math.atan(alat) - math.pi * 0.5
+
+    if abs(xn) <= 0.0:
+        theta = 0.0
+    elif abs(yn) <= 0.0:
+        theta = math.pi * 0.5 if xn > 0 else -math.pi * 0.5
+    else:
+        theta = math.atan2(xn, yn)
+
+    alon = theta / sn + olon
+    return alat / DEGRAD, alon / DEGRAD
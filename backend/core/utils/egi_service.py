@@ -3,7 +3,9 @@
 import os
 from .integrated_data_collector import collect_all_marine_data
 from .ai_inference import predict_best_egi
-from .sllm_service import generate_recommendation_reason
+from .reason_cache import get_reason
+from .result_cache import get_egi_result, image_digest, set_egi_result
+from .sllm_service import RULE_BASED_PROMPT
 
 
 def dev_print(*args, **kwargs):
@@ -11,7 +13,11 @@ def dev_print(*args, **kwargs):
         print(*args, **kwargs)
 
 
-def get_recommendation_context(lat, lon, image_file, target_fish="쭈갑"):
+def get_recommendation_context(lat, lon, image_file, target_fish="쭈갑", with_reason=True):
+    """
+    해양 데이터 수집 → 비전 추론 → 추천 근거
+    with_reason=False 면 근거 단계를 건너뛴다. (스트리밍 API 가 따로 흘려보냄)
+    """
     dev_print(f">>> get_recommendation_context 시작")
     dev_print(f"Params: lat={lat}, lon={lon}, target_fish={target_fish}")
 
@@ -19,16 +25,39 @@ def get_recommendation_context(lat, lon, image_file, target_fish="쭈갑"):
         # 1. 데이터 수집
         marine_data = collect_all_marine_data(lat, lon, target_fish)
 
+        # 같은 사진 + 비슷한 해양 조건으로 이미 추천한 결과가 있으면 그대로 사용
+        digest = image_digest(image_file)
+        cached = get_egi_result(digest, marine_data)
+        if cached is not None:
+            dev_print(f">>> 추천 결과 캐시 사용 ({digest[:12]})")
+            return {
+                **cached,
+                "image_digest": digest,
+                "marine_data": marine_data,
+                "debug_info": {"result_cache": "hit"},
+                "sllm_prompt": "",
+            }
+
         # 2. AI 모델 추론 (YOLO -> Crop -> RecModel)
         rec_color, water_color, debug_info = predict_best_egi(image_file, marine_data)
 
         if rec_color is None:
             return None
 
-        # 3. LLM 근거 생성
-        reason, sllm_prompt = generate_recommendation_reason(
-            water_color, rec_color, marine_data
-        )
+        if not with_reason:
+            return {
+                "recommended_color": rec_color,
+                "water_color": water_color,
+                "image_digest": digest,
+                "marine_data": marine_data,
+                "debug_info": debug_info,
+            }
+
+        # 3. 추천 근거 (미리 생성해 둔 LLM 근거, 없으면 기본 멘트 + 백그라운드 생성)
+        reason, sllm_prompt = get_reason(water_color, rec_color, marine_data)
+        # 기본 멘트는 결과 캐시에 넣지 않는다. (다음 요청에서 LLM 근거를 받도록)
+        if sllm_prompt != RULE_BASED_PROMPT:
+            set_egi_result(digest, marine_data, rec_color, water_color, reason)
 
         # 4. 결과 반환
         return {
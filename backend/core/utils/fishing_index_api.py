@@ -4,7 +4,6 @@
 """
 
 import os
-import math
 from typing import Optional, List, Dict, Any, Tuple
 
 import requests
@@ -12,6 +11,8 @@ from dotenv import load_dotenv
 
 from core.models import FishingSpot
 from datetime import datetime
+from .fishing_index_feed import current_noon_code, get_feed_index
+from .spatial_index import get_index
 
 load_dotenv()
 
@@ -35,23 +36,6 @@ def _normalize_target_fish(target_fish: Optional[str]) -> str:
     return "쭈갑"
 
 
-def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """두 위경도 좌표 사이 거리(km)."""
-    try:
-        R = 6371.0
-        rad = math.radians
-        dlat = rad(lat2 - lat1)
-        dlon = rad(lon2 - lon1)
-        a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(rad(lat1)) * math.cos(rad(lat2)) * math.sin(dlon / 2) ** 2
-        )
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        return R * c
-    except Exception:
-        return 999999.0
-
-
 def _get_service_key() -> Optional[str]:
     """환경변수에서 서비스키 가져오기."""
     key = os.getenv("KMA_SERVICE_KEY")
@@ -294,9 +278,9 @@ def get_fishing_index_data(
     바다낚시지수 API 데이터를 거리 기반으로 매칭해
     최종 낚시지수 정보를 반환한다.
 
-    - API를 gubun='선상', gubun='갯바위' 두 번 호출한다.
-    - 두 gubun의 item을 모두 합친 뒤, 각 FishingSpot 에서
-      가장 가까운 API 지점을 찾는다.
+    - 선상/갯바위 두 gubun 의 item 을 합친 피드(fishing_index_feed)를 사용한다.
+      (배치로 미리 받아 둔 목록, 없으면 한 번만 직접 수집)
+    - 각 FishingSpot 에서 피드 공간 인덱스로 가장 가까운 API 지점을 찾는다.
     - FishingSpot.method(선상/갯바위)는 API 호출 gubun에는 사용하지 않는다.
     """
     norm_target_fish = _normalize_target_fish(target_fish)
@@ -306,35 +290,28 @@ def get_fishing_index_data(
         )
     )
 
-    # 1) DB 에서 모든 FishingSpot 가져와 거리 계산
-    all_spots = FishingSpot.objects.all()
-    dev_print("[낚시지수] [DEBUG] DB에 등록된 낚시 포인트: {}개".format(all_spots.count()))
+    # 1) 공간 인덱스에서 가장 가까운 FishingSpot 조회
+    spot_index = get_index("fishing_spot")
+    dev_print("[낚시지수] [DEBUG] DB에 등록된 낚시 포인트: {}개".format(len(spot_index)))
 
-    spot_with_dist: List[Tuple[FishingSpot, float]] = []
-    for spot in all_spots:
-        if spot.lat is None or spot.lon is None:
-            continue
-        d = _haversine_km(user_lat, user_lon, spot.lat, spot.lon)
-        spot_with_dist.append((spot, d))
+    chosen_spots: List[Tuple[FishingSpot, float]] = spot_index.nearest(
+        user_lat, user_lon, k=max_spots
+    )
 
-    if not spot_with_dist:
+    if not chosen_spots:
         dev_print("[낚시지수] 유효한 좌표를 가진 낚시 포인트가 없습니다.")
         return None
 
-    spot_with_dist.sort(key=lambda x: x[1])
-    chosen_spots = spot_with_dist[:max_spots]
-
     dev_print("[낚시지수] [DEBUG] 가장 가까운 낚시 포인트 {}개:".format(len(chosen_spots)))
     for idx, (spot, dist) in enumerate(chosen_spots, start=1):
         dev_print("  {}. {} ({}, ~{:.1f}km)".format(idx, spot.name, spot.method, dist))
 
-    # 2) 바다낚시지수 API를 선상 + 갯바위 모두 호출
-    items = _get_all_items_for_both_gubun(
-        req_date=requested_at.strftime("%Y%m%d") if requested_at else None
-    )
-    if not items:
-        dev_print("[낚시지수] [Error] 바다낚시지수 API 에서 데이터를 가져오지 못했습니다.")
+    # 2) 선상 + 갯바위 피드 인덱스 조회 (사전 수집본)
+    feed = get_feed_index(requested_at.strftime("%Y%m%d") if requested_at else None)
+    if feed is None or not len(feed):
+        dev_print("[낚시지수] [Error] 바다낚시지수 피드 데이터를 가져오지 못했습니다.")
         return None
+    noon_code = current_noon_code(feed.req_date)
 
     # 3) 각 포인트에 대해 가장 가까운 API item 찾기 + 결과 병합
     final_result: Dict[str, Any] = {
@@ -357,22 +334,9 @@ def get_fishing_index_data(
         best_item: Optional[Dict[str, Any]] = None
         best_dist: Optional[float] = None
 
-        for it in items:
-            api_lat = it.get("lat")
-            api_lon = it.get("lot")
-            if api_lat is None or api_lon is None:
-                continue
-
-            try:
-                api_lat_f = float(api_lat)
-                api_lon_f = float(api_lon)
-            except (TypeError, ValueError):
-                continue
-
-            d = _haversine_km(spot.lat, spot.lon, api_lat_f, api_lon_f)
-            if best_item is None or best_dist is None or d < best_dist:
-                best_item = it
-                best_dist = d
+        found = feed.nearest_item(spot.lat, spot.lon, noon_code=noon_code)
+        if found:
+            best_item, best_dist = found
 
         if best_item is None or best_dist is None:
             dev_print(
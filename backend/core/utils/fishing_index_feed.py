@@ -0,0 +1,178 @@
+# core/utils/fishing_index_feed.py
+"""
+바다낚시지수 피드 사전 수집(prefetch) + 공간 인덱스
+
+- 피드는 날짜/오전·오후 단위로만 바뀌므로, 선상+갯바위 전체 목록을
+  오늘/내일 치를 미리 받아 pick_fields_from_item 으로 정규화해 캐시에 저장
+  (manage.py prefetch_fishing_index --loop 로 주기 갱신)
+- 요청 시에는 캐시된 목록으로 만든 KD-tree 에서 최근접 item 만 조회
+- 캐시가 비어 있으면(배치 미실행) 한 번만 직접 내려받아 채운다.
+"""
+
+import os
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.core.cache import cache
+
+from .spatial_index import SpatialIndex
+
+FEED_CACHE_KEY = "fishing_feed:{req_date}"
+# 오늘/내일 치를 받아두므로 이틀 + 여유
+FEED_CACHE_TIMEOUT = 60 * 60 * 50
+# 다른 프로세스(배치)가 갱신했는지 확인하는 최소 간격(초)
+FEED_CHECK_INTERVAL = 60
+
+# 같은 지점으로 볼 거리(km) - 같은 위치의 오전/오후 item 중 하나를 고를 때 사용
+SAME_POINT_KM = 0.5
+
+
+# 개발 모드용 출력 함수
+def dev_print(*args, **kwargs):
+    if os.getenv("APP_ENV") == "development":
+        print(*args, **kwargs)
+
+
+def _now_kst():
+    return datetime.utcnow() + timedelta(hours=9)
+
+
+def _digits(value: Any) -> str:
+    return re.sub(r"\D", "", str(value or ""))
+
+
+class FishingFeedIndex(SpatialIndex):
+    """정규화된 낚시지수 item 목록 위의 최근접 검색"""
+
+    def __init__(self, req_date: str, items: List[Dict[str, Any]], fetched_at: str):
+        super().__init__(items, [(it["lat"], it["lot"]) for it in items])
+        self.req_date = req_date
+        self.fetched_at = fetched_at
+
+    def nearest_item(
+        self, lat: float, lon: float, noon_code: Optional[str] = None
+    ) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        가장 가까운 item 과 거리(km).
+        같은 지점에 여러 item(날짜/오전·오후)이 있으면 요청 날짜, noon_code 와
+        일치하는 item 을 우선한다.
+        """
+        candidates = self.nearest(lat, lon, k=8)
+        if not candidates:
+            return None
+
+        best_dist = candidates[0][1]
+        same_point = [c for c in candidates if c[1] - best_dist <= SAME_POINT_KM]
+
+        def rank(candidate):
+            item, dist = candidate
+            return (
+                _digits(item.get("predcYmd")) != self.req_date,
+                noon_code is not None and item.get("predcNoonSeCd") != noon_code,
+                dist,
+            )
+
+        return min(same_point, key=rank)
+
+
+# ==========================================
+# 피드 수집 / 저장
+# ==========================================
+def download_feed(req_date: str) -> List[Dict[str, Any]]:
+    """선상+갯바위 목록을 내려받아 pick_fields_from_item 으로 정규화"""
+    from .fishing_index_api import _get_all_items_for_both_gubun, pick_fields_from_item
+
+    normalized: List[Dict[str, Any]] = []
+    for it in _get_all_items_for_both_gubun(req_date=req_date):
+        picked = pick_fields_from_item(it)
+        if picked["lat"] is None or picked["lot"] is None:
+            continue
+        picked["_gubun"] = it.get("_gubun")  # 선상/갯바위 출처
+        normalized.append(picked)
+
+    dev_print(f"[낚시지수 피드] {req_date}: item {len(normalized)}개 정규화")
+    return normalized
+
+
+def refresh_feed(req_date: str) -> int:
+    """
+    req_date(YYYYMMDD) 피드를 내려받아 캐시에 저장. 저장한 item 개수 반환.
+    다운로드 실패(0개) 시 기존 캐시는 그대로 둔다.
+    """
+    items = download_feed(req_date)
+    if not items:
+        return 0
+
+    cache.set(
+        FEED_CACHE_KEY.format(req_date=req_date),
+        {"items": items, "fetched_at": _now_kst().isoformat()},
+        FEED_CACHE_TIMEOUT,
+    )
+    _feed_indexes.pop(req_date, None)
+    return len(items)
+
+
+def default_feed_dates(days: int = 2) -> List[str]:
+    """오늘부터 days 일치 날짜 (KST, YYYYMMDD)"""
+    today = _now_kst()
+    return [(today + timedelta(days=d)).strftime("%Y%m%d") for d in range(days)]
+
+
+# ==========================================
+# 요청 시 조회
+# ==========================================
+# req_date -> {"index": FishingFeedIndex, "checked_at": float}
+_feed_indexes: Dict[str, Dict[str, Any]] = {}
+_feed_lock = threading.Lock()
+
+
+def _load_from_cache(req_date: str) -> Optional[FishingFeedIndex]:
+    payload = cache.get(FEED_CACHE_KEY.format(req_date=req_date))
+    if not payload:
+        return None
+
+    entry = _feed_indexes.get(req_date)
+    cached_index = entry["index"] if entry is not None else None
+    if cached_index is not None and cached_index.fetched_at == payload["fetched_at"]:
+        return cached_index
+
+    return FishingFeedIndex(req_date, payload["items"], payload["fetched_at"])
+
+
+def get_feed_index(req_date: Optional[str] = None) -> Optional[FishingFeedIndex]:
+    """
+    req_date(YYYYMMDD, None 이면 오늘) 피드 인덱스.
+    캐시가 비어 있으면 한 스레드만 직접 내려받아 채운다.
+    """
+    req_date = req_date or _now_kst().strftime("%Y%m%d")
+    now = time.monotonic()
+
+    entry = _feed_indexes.get(req_date)
+    if entry is not None and now - entry["checked_at"] < FEED_CHECK_INTERVAL:
+        return entry["index"]
+
+    with _feed_lock:
+        entry = _feed_indexes.get(req_date)
+        if entry is not None and now - entry["checked_at"] < FEED_CHECK_INTERVAL:
+            return entry["index"]
+
+        index = _load_from_cache(req_date)
+        if index is None:
+            dev_print(f"[낚시지수 피드] {req_date} 캐시 없음 → 직접 수집")
+            if refresh_feed(req_date):
+                index = _load_from_cache(req_date)
+
+        # 실패(None)도 잠시 기억해서 매 요청마다 upstream 을 다시 호출하지 않음
+        _feed_indexes[req_date] = {"index": index, "checked_at": now}
+        return index
+
+
+def current_noon_code(req_date: str) -> Optional[str]:
+    """요청 날짜가 오늘이면 현재 시각의 오전/오후 코드, 아니면 None"""
+    now = _now_kst()
+    if req_date != now.strftime("%Y%m%d"):
+        return None
+    return "오전" if now.hour < 12 else "오후"
@@ -0,0 +1,92 @@
+# core/utils/geo_math.py
+"""
+위경도 거리 계산 (NumPy 벡터화)
+
+- haversine_km       : 두 좌표(또는 같은 모양의 배열) 사이 거리
+- haversine_to_many  : 한 점 → 여러 점 거리 (1차원 배열)
+- haversine_matrix   : 여러 점 × 여러 점 거리 행렬
+- nearest_index      : 한 점에서 가장 가까운 점의 인덱스/거리
+
+모든 거리 단위는 km, 입력 좌표 단위는 degree.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def _as_radians(values) -> np.ndarray:
+    return np.radians(np.asarray(values, dtype=np.float64))
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """
+    두 좌표 사이 거리(km). 배열을 넣으면 브로드캐스팅 규칙대로 계산.
+    스칼라 입력이면 float 반환.
+    """
+    lat1_r, lon1_r = _as_radians(lat1), _as_radians(lon1)
+    lat2_r, lon2_r = _as_radians(lat2), _as_radians(lon2)
+
+    dlat = lat2_r - lat1_r
+    dlon = lon2_r - lon1_r
+    a = (
+        np.sin(dlat / 2.0) ** 2
+        + np.cos(lat1_r) * np.cos(lat2_r) * np.sin(dlon / 2.0) ** 2
+    )
+    distance = 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+    if np.ndim(distance) == 0:
+        return float(distance)
+    return distance
+
+
+def haversine_to_many(lat: float, lon: float, lats, lons) -> np.ndarray:
+    """한 점(lat, lon)에서 여러 점(lats, lons)까지의 거리 배열"""
+    return np.atleast_1d(haversine_km(lat, lon, lats, lons))
+
+
+def haversine_matrix(lats1, lons1, lats2, lons2) -> np.ndarray:
+    """
+    (n,) 점 집합 × (m,) 점 집합의 거리 행렬 (n, m)
+    """
+    lats1 = np.asarray(lats1, dtype=np.float64)[:, np.newaxis]
+    lons1 = np.asarray(lons1, dtype=np.float64)[:, np.newaxis]
+    lats2 = np.asarray(lats2, dtype=np.float64)[np.newaxis, :]
+    lons2 = np.asarray(lons2, dtype=np.float64)[np.newaxis, :]
+    return np.atleast_2d(haversine_km(lats1, lons1, lats2, lons2))
+
+
+def nearest_index(lat: float, lon: float, lats, lons) -> Optional[Tuple[int, float]]:
+    """가장 가까운 점의 (인덱스, 거리 km). 점이 없으면 None"""
+    if len(lats) == 0:
+        return None
+    distances = haversine_to_many(lat, lon, lats, lons)
+    idx = int(np.argmin(distances))
+    return idx, float(distances[idx])
+
+
+# ==========================================
+# 단위 구 좌표 변환 (KD-tree 용)
+# ==========================================
+def to_unit_xyz(lats, lons) -> np.ndarray:
+    """위경도(deg) 배열 → 단위 구 위의 (x, y, z) 배열 (n, 3)"""
+    lat_r = _as_radians(lats)
+    lon_r = _as_radians(lons)
+    cos_lat = np.cos(lat_r)
+    return np.column_stack(
+        (cos_lat * np.cos(lon_r), cos_lat * np.sin(lon_r), np.sin(lat_r))
+    )
+
+
+def chord_to_km(chord) -> np.ndarray:
+    """단위 구 위의 현 길이 → 대원 거리(km)"""
+    chord = np.clip(np.asarray(chord, dtype=np.float64), 0.0, 2.0)
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(chord / 2.0)
+
+
+def km_to_chord(distance_km: float) -> float:
+    """대원 거리(km) → 단위 구 위의 현 길이"""
+    angle = min(distance_km / EARTH_RADIUS_KM, np.pi)
+    return float(2.0 * np.sin(angle / 2.0))
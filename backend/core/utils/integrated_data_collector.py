@@ -3,7 +3,15 @@
 통합 해양/기상 데이터 수집기
 """
 import os
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from django.conf import settings
+from django.db import connection
+
 from core.utils.lun_cal_api import get_multtae_by_location
+from . import marine_cache
 from .fishing_index_api import get_fishing_index_data
 from .ocean_api import get_buoy_data
 from .kma_api import get_kma_weather
@@ -16,7 +24,149 @@ def dev_print(*args, **kwargs):
         print(*args, **kwargs)
 
 
-def collect_all_marine_data(user_lat, user_lon, target_fish=None, requested_at=None):
+# ==========================================
+# 소스별 수집 함수 (우선순위 순서)
+# - 좌표 격자 단위 캐시(marine_cache)를 먼저 확인
+# - 조석예보는 관측소 단위로 tide_api 내부에서 캐싱
+# ==========================================
+def _fetch_fishing(user_lat, user_lon, target_fish, requested_at):
+    return marine_cache.get_or_fetch(
+        "fishing",
+        marine_cache.cell_key(user_lat, user_lon, target_fish),
+        lambda: get_fishing_index_data(
+            user_lat, user_lon, target_fish=target_fish, requested_at=requested_at
+        ),
+        requested_at=requested_at,
+    )
+
+
+def _fetch_buoy(user_lat, user_lon, target_fish, requested_at):
+    return marine_cache.get_or_fetch(
+        "buoy",
+        marine_cache.cell_key(user_lat, user_lon),
+        lambda: get_buoy_data(user_lat, user_lon),
+    )
+
+
+def _fetch_kma(user_lat, user_lon, target_fish, requested_at):
+    return marine_cache.get_or_fetch(
+        "kma",
+        marine_cache.cell_key(user_lat, user_lon),
+        lambda: get_kma_weather(user_lat, user_lon),
+    )
+
+
+def _fetch_tide(user_lat, user_lon, target_fish, requested_at):
+    return get_tide_info(user_lat, user_lon)
+
+
+def _fetch_luncal(user_lat, user_lon, target_fish, requested_at):
+    return marine_cache.get_or_fetch(
+        "luncal",
+        marine_cache.cell_key(user_lat, user_lon),
+        lambda: get_multtae_by_location(user_lat, user_lon),
+    )
+
+
+MARINE_SOURCES = [
+    ("fishing", _fetch_fishing),
+    ("buoy", _fetch_buoy),
+    ("kma", _fetch_kma),
+    ("tide", _fetch_tide),
+    ("luncal", _fetch_luncal),
+]
+
+
+def _run_source(name, fetcher, user_lat, user_lon, target_fish, requested_at):
+    """단일 소스 호출 (예외는 로그를 남기고 None 으로 흡수)"""
+    try:
+        return fetcher(user_lat, user_lon, target_fish, requested_at)
+    except Exception as e:
+        print(f"[기상 통합] [Error] {name} 수집 중 예외: {e}")
+        dev_print(traceback.format_exc())
+        return None
+
+
+def _run_source_in_thread(name, fetcher, user_lat, user_lon, target_fish, requested_at):
+    """워커 스레드용 래퍼 - 스레드별 DB 커넥션을 정리한다."""
+    try:
+        return _run_source(name, fetcher, user_lat, user_lon, target_fish, requested_at)
+    finally:
+        connection.close()
+
+
+def _collect_sequential(user_lat, user_lon, target_fish, requested_at):
+    """기존 방식: 소스를 하나씩 순서대로 호출"""
+    started = time.monotonic()
+    results = {}
+    for name, fetcher in MARINE_SOURCES:
+        source_started = time.monotonic()
+        results[name] = _run_source(
+            name, fetcher, user_lat, user_lon, target_fish, requested_at
+        )
+        if results[name] is None:
+            dev_print(
+                f"[기상 통합] [Warning] {name} 결과 없음 "
+                f"({time.monotonic() - source_started:.2f}s) → 제외"
+            )
+
+    received = sum(1 for value in results.values() if value is not None)
+    dev_print(
+        f"[기상 통합] 순차 수집 완료: {time.monotonic() - started:.2f}s "
+        f"(수신 {received} / 전체 {len(results)})"
+    )
+    return results
+
+
+def _collect_concurrent(user_lat, user_lon, target_fish, requested_at, deadline):
+    """
+    모든 소스를 동시에 호출하고, 공통 마감 시간(deadline 초)까지 도착한 결과만 사용.
+    마감 시간을 넘긴 소스는 None 으로 취급한다.
+
+    스레드 풀은 요청마다 따로 만든다. 마감을 넘긴 소스가 스레드를 계속 잡고 있어도
+    다른 요청의 수집을 막지 않는다. (각 API 의 HTTP timeout 이 지나면 스레드도 끝남)
+    """
+    started = time.monotonic()
+    executor = ThreadPoolExecutor(
+        max_workers=len(MARINE_SOURCES), thread_name_prefix="marine-fanout"
+    )
+    try:
+        futures = {
+            name: executor.submit(
+                _run_source_in_thread,
+                name,
+                fetcher,
+                user_lat,
+                user_lon,
+                target_fish,
+                requested_at,
+            )
+            for name, fetcher in MARINE_SOURCES
+        }
+        done, not_done = wait(futures.values(), timeout=deadline)
+    finally:
+        # 늦은 소스를 기다리지 않고 풀을 닫는다. (시작 전인 작업은 취소)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    results = {}
+    for name, future in futures.items():
+        if future in done:
+            results[name] = future.result()
+        else:
+            # 실행 중인 소스는 결과만 버림 (스레드는 요청 전용 풀이라 다른 요청과 무관)
+            results[name] = None
+            dev_print(f"[기상 통합] [Warning] {name} 마감 시간({deadline}s) 초과 → 제외")
+
+    dev_print(
+        f"[기상 통합] 병렬 수집 완료: {time.monotonic() - started:.2f}s "
+        f"(완료 {len(done)} / 전체 {len(futures)})"
+    )
+    return results
+
+
+def collect_all_marine_data(
+    user_lat, user_lon, target_fish=None, requested_at=None, parallel=None
+):
     """
     모든 소스에서 해양/기상 데이터 수집 (우선순위 적용)
 
@@ -25,7 +175,16 @@ def collect_all_marine_data(user_lat, user_lon, target_fish=None, requested_at=N
     2. 해양관측부이 API (부이 기반)
     3. 기상청 초단기실황 API (격자 기반)
     4. 조석예보 API (물때 계산)
+
+    parallel:
+    - True  : 모든 소스를 동시에 호출 (MARINE_FANOUT_DEADLINE 초 공통 마감)
+    - False : 기존처럼 순서대로 호출
+    - None  : settings.MARINE_FANOUT_ENABLED 값을 따름
+
+    어느 방식이든 결과 병합은 위 우선순위대로 _merge_data 를 적용한다.
     """
+    if parallel is None:
+        parallel = getattr(settings, "MARINE_FANOUT_ENABLED", True)
 
     # 어종 미지정시 기본값 설정
     if not target_fish:
@@ -61,17 +220,30 @@ def collect_all_marine_data(user_lat, user_lon, target_fish=None, requested_at=N
         "tide_station": None,
         "wind_direction_deg": None,
         "wind_direction_16": None,
+        "buoy_fetched_at": None,
     }
 
+    # ================================================================
+    # 소스 호출 (병렬 또는 순차)
+    # ================================================================
+    if parallel:
+        deadline = getattr(settings, "MARINE_FANOUT_DEADLINE", 20.0)
+        dev_print(f"\n[기상 통합] 병렬 수집 모드 (마감 {deadline}s)")
+        source_results = _collect_concurrent(
+            user_lat, user_lon, target_fish, requested_at, deadline
+        )
+    else:
+        source_results = _collect_sequential(
+            user_lat, user_lon, target_fish, requested_at
+        )
+
     # ================================================================
     # [1순위] 바다낚시지수 API
     # ================================================================
-    dev_print(f"\n[1단계] 바다낚시지수 API 시도")
+    dev_print(f"\n[1단계] 바다낚시지수 API 결과 병합")
     dev_print("-" * 70)
 
-    fishing_data = get_fishing_index_data(
-        user_lat, user_lon, target_fish=target_fish, requested_at=requested_at
-    )
+    fishing_data = source_results.get("fishing")
 
     if fishing_data:
         dev_print(f"[기상 통합] 낚시지수 데이터 수집 성공!")
@@ -88,10 +260,10 @@ def collect_all_marine_data(user_lat, user_lon, target_fish=None, requested_at=N
     # ================================================================
     # [2순위] 해양관측부이 API
     # ================================================================
-    dev_print(f"\n[2단계] 해양관측부이 API 시도")
+    dev_print(f"\n[2단계] 해양관측부이 API 결과 병합")
     dev_print("-" * 70)
 
-    buoy_data = get_buoy_data(user_lat, user_lon)
+    buoy_data = source_results.get("buoy")
 
     if buoy_data:
         dev_print(f"[기상 통합] 부이 데이터 수집 성공!")
@@ -106,10 +278,10 @@ def collect_all_marine_data(user_lat, user_lon, target_fish=None, requested_at=N
     # ================================================================
     # [3순위] 기상청 API (초단기실황)
     # ================================================================
-    dev_print(f"\n[3단계] 기상청 API 시도")
+    dev_print(f"\n[3단계] 기상청 API 결과 병합")
     dev_print("-" * 70)
 
-    weather_data = get_kma_weather(user_lat, user_lon)
+    weather_data = source_results.get("kma")
 
     if weather_data:
         dev_print(f"[기상 통합] 기상청 데이터 수집 성공!")
@@ -126,10 +298,10 @@ def collect_all_marine_data(user_lat, user_lon, target_fish=None, requested_at=N
     # ================================================================
     # [4순위] 조석예보 API (만조/간조 시간 정보)
     # ================================================================
-    dev_print(f"\n[4단계] 조석예보 API 시도 (만조/간조 시간)")
+    dev_print(f"\n[4단계] 조석예보 API 결과 병합 (만조/간조 시간)")
     dev_print("-" * 70)
 
-    tide_data = get_tide_info(user_lat, user_lon)
+    tide_data = source_results.get("tide")
 
     if tide_data:
         dev_print(f"[기상 통합] 조석 정보 수집 성공!")
@@ -144,10 +316,10 @@ def collect_all_marine_data(user_lat, user_lon, target_fish=None, requested_at=N
     # ================================================================
     # [5순위] 음력 변환 API (물때 계산)
     # ================================================================
-    dev_print(f"\n[5단계] 음력 변환 API 시도 (물때 계산)")
+    dev_print(f"\n[5단계] 음력 변환 API 결과 병합 (물때 계산)")
     dev_print("-" * 70)
 
-    luncal_data = get_multtae_by_location(user_lat, user_lon)
+    luncal_data = source_results.get("luncal")
 
     if luncal_data:
         dev_print(f"[기상 통합] 음력 정보 수집 성공!")
@@ -7,16 +7,30 @@ import os
 from datetime import datetime, timedelta
 
 import requests
-from haversine import haversine
+from django.conf import settings
+from django.core.cache import cache
 from dotenv import load_dotenv
 
-from core.models import CoastalPoint
-from .converter import map_to_grid
+from .converter import grid_to_map, map_to_grid
+from .single_flight import SingleFlight
+from .spatial_index import get_index
 
 load_dotenv()
 
 KMA_SERVICE_KEY = os.getenv("KMA_SERVICE_KEY")
 
+# 초단기실황 캐시: (nx, ny, base_date, base_time) 단위
+# base_time 이 키에 들어가므로 다음 발표 이후에는 자연히 쓰이지 않는다.
+NOWCAST_CACHE_KEY = "kma_nowcast:{nx}:{ny}:{base_date}{base_time}"
+NOWCAST_CACHE_TIMEOUT = 2 * 60 * 60
+# 해당 발표 시각에 전부 결측이었던 격자 표시
+NOWCAST_MISSING = "missing"
+
+# 결측이 반복되는 격자(주로 해상) 표시 - 이 기간 동안은 사용자 격자를 건너뜀
+MISSING_CELL_CACHE_KEY = "kma_missing_cell:{nx}:{ny}"
+
+_nowcast_flight = SingleFlight()
+
 
 # 개발 모드용 출력 함수
 def dev_print(*args, **kwargs):
@@ -92,16 +106,18 @@ def _vec_to_16dir(deg):
     return dirs_16[idx]
 
 
-def _call_kma_api(nx, ny):
+def _call_kma_api(nx, ny, base_date=None, base_time=None):
     """
     기상청 초단기실황 API 호출 (UltraSrtNcst)
     - nx, ny: 기상청 격자 좌표
+    - base_date, base_time: 생략하면 현재 시각 기준으로 계산
     """
     if not KMA_SERVICE_KEY:
         print("[KMA][ERROR] KMA_SERVICE_KEY 가 설정되지 않았습니다 (.env 확인)")
         return None
 
-    base_date, base_time = _calc_base_datetime()
+    if base_date is None or base_time is None:
+        base_date, base_time = _calc_base_datetime()
 
     url = "http://apis.data.go.kr/1360000/" "VilageFcstInfoService_2.0/getUltraSrtNcst"
 
@@ -203,24 +219,17 @@ def get_nearest_land_grid_from_db(lat, lon):
     - 해상 격자가 결측인 경우, 가까운 육지 해안 격자를 대신 사용하는 fallback 전략
     """
     try:
-        points = CoastalPoint.objects.filter(is_active=True)
-        if not points.exists():
+        index = get_index("coastal_point")
+        if not len(index):
             dev_print("[KMA][WARNING] CoastalPoint 데이터가 없습니다.")
             return None
 
-        user_pos = (lat, lon)
-        nearest = None
-        min_dist = 999999.0
-
-        for cp in points:
-            d = haversine(user_pos, (cp.lat, cp.lon))
-            if d < min_dist:
-                min_dist = d
-                nearest = cp
-
-        if nearest is None:
+        found = index.nearest(lat, lon, k=1)
+        if not found:
             return None
 
+        nearest, min_dist = found[0]
+
         dev_print(
             f"[KMA] 가장 가까운 해안 지점: {nearest.name} "
             f"({min_dist:.1f}km, nx={nearest.nx}, ny={nearest.ny})"
@@ -240,14 +249,109 @@ def get_nearest_land_grid_from_db(lat, lon):
         return None
 
 
+# ==========================================
+# 격자 단위 캐시 + 동시 요청 합치기
+# ==========================================
+def _fetch_nowcast(nx, ny, base_date, base_time, cache_key):
+    """
+    실제 API 호출 (single-flight 리더만 실행).
+    - 정상 응답인데 전부 결측이면 NOWCAST_MISSING 을 캐시하고 격자를 결측으로 표시
+    - 네트워크/인증 오류는 캐시하지 않음 (다음 요청에서 재시도)
+    """
+    # 기다리는 동안 다른 프로세스가 채웠을 수도 있음
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    data = _call_kma_api(nx, ny, base_date, base_time)
+    if not data:
+        return None
+
+    response = data.get("response", {})
+    result_code = response.get("header", {}).get("resultCode")
+    if result_code not in ("00", "03"):  # 03 = NODATA_ERROR
+        print(f"[KMA][ERROR] API 오류 코드: {result_code}")
+        return None
+
+    items = response.get("body", {}).get("items", {}).get("item", [])
+    info = _parse_kma_items(items, nx, ny, None) if items else None
+
+    if info is None:
+        cache.set(cache_key, NOWCAST_MISSING, NOWCAST_CACHE_TIMEOUT)
+        cache.set(
+            MISSING_CELL_CACHE_KEY.format(nx=nx, ny=ny),
+            base_date + base_time,
+            getattr(settings, "KMA_MISSING_CELL_TTL", 86400),
+        )
+        return NOWCAST_MISSING
+
+    cache.set(cache_key, info, NOWCAST_CACHE_TIMEOUT)
+    cache.delete(MISSING_CELL_CACHE_KEY.format(nx=nx, ny=ny))
+    return info
+
+
+def get_grid_nowcast(nx, ny, base_date, base_time, grid_source_label):
+    """
+    (nx, ny, base_date, base_time) 단위로 캐시된 초단기실황.
+    같은 키로 동시에 들어온 요청은 upstream 호출 한 번을 공유한다.
+    결측/실패면 None
+    """
+    cache_key = NOWCAST_CACHE_KEY.format(
+        nx=nx, ny=ny, base_date=base_date, base_time=base_time
+    )
+
+    info = cache.get(cache_key)
+    if info is None:
+        info = _nowcast_flight.do(
+            cache_key,
+            lambda: _fetch_nowcast(nx, ny, base_date, base_time, cache_key),
+        )
+    else:
+        dev_print(f"[KMA] 캐시 HIT {cache_key}")
+
+    if info is None or info == NOWCAST_MISSING:
+        return None
+    return {**info, "grid_source": grid_source_label}
+
+
+def is_known_missing_cell(nx, ny):
+    """최근 발표에서 전부 결측이었던 격자인지"""
+    return cache.get(MISSING_CELL_CACHE_KEY.format(nx=nx, ny=ny)) is not None
+
+
+# 사용자 격자 → 대체 해안 격자 (격자 중심 기준으로 한 번만 계산)
+# {"index": SpatialIndex, "cells": {(nx, ny): cp_info}}
+_coastal_by_cell = {"index": None, "cells": {}}
+
+
+def get_coastal_grid_for_cell(nx, ny):
+    """
+    격자 (nx, ny) 의 중심에서 가장 가까운 해안 지점 격자.
+    CoastalPoint 인덱스가 다시 만들어지면 계산 결과도 버린다.
+    """
+    index = get_index("coastal_point")
+    if _coastal_by_cell["index"] is not index:
+        _coastal_by_cell["index"] = index
+        _coastal_by_cell["cells"] = {}
+
+    cells = _coastal_by_cell["cells"]
+    if (nx, ny) not in cells:
+        center_lat, center_lon = grid_to_map(nx, ny)
+        cells[(nx, ny)] = get_nearest_land_grid_from_db(center_lat, center_lon)
+    return cells[(nx, ny)]
+
+
 def get_kma_weather(lat, lon):
     """
     기상청 초단기실황 기준 현재 기상정보 조회
 
     1) 사용자 (lat, lon)를 격자(nx, ny)로 변환해서 조회 시도
-    2) 결과가 전부 결측이면, CoastalPoint 에서 가장 가까운 해안 격자(nx, ny)로 다시 시도
+       (최근 결측으로 확인된 격자면 건너뜀)
+    2) 결과가 전부 결측이면, 격자 중심에서 가장 가까운 해안 격자(nx, ny)로 다시 시도
     3) 둘 다 실패하면 None 반환
 
+    두 조회 모두 (nx, ny, base_date, base_time) 단위로 캐시된다.
+
     반환 예시:
     {
         "source": "기상청 초단기실황",
@@ -263,34 +367,31 @@ def get_kma_weather(lat, lon):
     }
     """
     try:
+        base_date, base_time = _calc_base_datetime()
+
         # 1) 사용자 위치 기준 격자
         nx, ny = map_to_grid(lat, lon)
         dev_print(f"[KMA] 사용자 위치 격자: nx={nx}, ny={ny}")
 
-        data = _call_kma_api(nx, ny)
-        if data:
-            body = data.get("response", {}).get("body", {})
-            items = body.get("items", {}).get("item", [])
-            if items:
-                info = _parse_kma_items(items, nx, ny, "user_grid")
-                if info is not None:
-                    return info
+        if is_known_missing_cell(nx, ny):
+            dev_print(f"[KMA] 결측 격자로 확인됨 → 해안 격자로 바로 조회")
+        else:
+            info = get_grid_nowcast(nx, ny, base_date, base_time, "user_grid")
+            if info is not None:
+                return info
 
         # 2) 해안 격자 fallback
-        cp_info = get_nearest_land_grid_from_db(lat, lon)
-        if cp_info:
-            nx2 = cp_info["nx"]
-            ny2 = cp_info["ny"]
-            data2 = _call_kma_api(nx2, ny2)
-            if data2:
-                body2 = data2.get("response", {}).get("body", {})
-                items2 = body2.get("items", {}).get("item", [])
-                if items2:
-                    info2 = _parse_kma_items(
-                        items2, nx2, ny2, "coastal_point:" + cp_info["name"]
-                    )
-                    if info2 is not None:
-                        return info2
+        cp_info = get_coastal_grid_for_cell(nx, ny)
+        if cp_info and (cp_info["nx"], cp_info["ny"]) != (nx, ny):
+            info2 = get_grid_nowcast(
+                cp_info["nx"],
+                cp_info["ny"],
+                base_date,
+                base_time,
+                "coastal_point:" + cp_info["name"],
+            )
+            if info2 is not None:
+                return info2
 
         dev_print(
             "[KMA][WARNING] 기상청 초단기실황에서 유효한 데이터를 얻지 못했습니다."
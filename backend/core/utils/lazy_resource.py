@@ -0,0 +1,202 @@
+# core/utils/lazy_resource.py
+"""
+무거운 AI 자원(비전 모델, LLM, 검색 엔진)의 지연 로딩 레지스트리
+
+- 첫 요청이 동시에 몰려도 로더는 한 번만 실행된다 (single-flight).
+  기다리던 요청은 같은 결과(또는 같은 예외)를 받는다.
+- 로드 실패(예외)는 저장하지 않으므로 다음 요청에서 다시 시도한다.
+- acquire() 로 빌린 동안에는 참조 수가 올라가 언로드되지 않는다.
+- idle_seconds 가 0 보다 크면 마지막 사용 후 그만큼 아무도 쓰지 않을 때
+  unloader 를 불러 메모리를 돌려준다. 다음 요청이 오면 다시 로드한다.
+- 프로세스 안(스레드 사이)에서만 동작한다. (gunicorn 워커마다 따로)
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional
+
+from .single_flight import SingleFlight
+
+
+# 개발 모드용 출력 함수
+def dev_print(*args, **kwargs):
+    if os.getenv("APP_ENV") == "development":
+        print(*args, **kwargs)
+
+
+class LazyResource:
+    def __init__(
+        self,
+        name: str,
+        loader: Callable[[], Any],
+        unloader: Optional[Callable[[Any], None]] = None,
+        idle_seconds: float = 0,
+    ):
+        self.name = name
+        self.loader = loader
+        self.unloader = unloader
+        self.idle_seconds = idle_seconds
+
+        self._value = None
+        self._loaded = False
+        self._refs = 0
+        self._last_used = 0.0
+        self._timer: Optional[threading.Timer] = None
+
+        # _state_lock: 참조 수/값, _load_lock: 로드와 언로드가 겹치지 않게
+        self._state_lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._flight = SingleFlight()
+
+        self.loads = 0
+        self.unloads = 0
+        self.load_seconds = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    # ------------------------------------------
+    # 로드 / 언로드
+    # ------------------------------------------
+    def _load(self):
+        with self._load_lock:
+            if self._loaded:
+                return self._value
+
+            started = time.monotonic()
+            value = self.loader()
+            with self._state_lock:
+                self._value = value
+                self._loaded = True
+                self._last_used = time.monotonic()
+            self.loads += 1
+            self.load_seconds = round(time.monotonic() - started, 2)
+            dev_print(f"✅ [자원] {self.name} 로드 ({self.load_seconds}s)")
+
+        self._schedule_idle_unload()
+        return value
+
+    def get(self):
+        """로드된 값 (없으면 로드). 동시에 불려도 로더는 한 번만 실행"""
+        with self._state_lock:
+            if self._loaded:
+                self._last_used = time.monotonic()
+                return self._value
+        return self._flight.do(self.name, self._load)
+
+    def unload(self, force: bool = False) -> bool:
+        """쓰는 곳이 없으면(force 면 무조건) 언로드. 언로드했으면 True"""
+        with self._load_lock:
+            with self._state_lock:
+                if not self._loaded or (self._refs and not force):
+                    return False
+                value = self._value
+                self._value = None
+                self._loaded = False
+
+            if self.unloader is not None:
+                try:
+                    self.unloader(value)
+                except Exception as e:
+                    print(f"⚠️ [자원] {self.name} 언로드 오류: {e}")
+            self.unloads += 1
+            dev_print(f"🧹 [자원] {self.name} 언로드")
+            return True
+
+    # ------------------------------------------
+    # 참조 관리
+    # ------------------------------------------
+    @contextmanager
+    def acquire(self, required: bool = True):
+        """
+        with resource.acquire() as value: ...
+        블록 안에서는 언로드되지 않는다.
+        required=False 면 로드 실패 시 예외 대신 None 을 넘긴다.
+        """
+        with self._state_lock:
+            self._refs += 1
+        try:
+            try:
+                value = self.get()
+            except Exception:
+                if required:
+                    raise
+                value = None
+            yield value
+        finally:
+            with self._state_lock:
+                self._refs -= 1
+                self._last_used = time.monotonic()
+            self._schedule_idle_unload()
+
+    # ------------------------------------------
+    # 유휴 언로드
+    # ------------------------------------------
+    def _schedule_idle_unload(self, delay: Optional[float] = None):
+        if self.idle_seconds <= 0:
+            return
+        with self._state_lock:
+            if self._timer is not None or not self._loaded:
+                return
+            self._timer = threading.Timer(
+                self.idle_seconds if delay is None else delay, self._on_idle_timer
+            )
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _on_idle_timer(self):
+        with self._state_lock:
+            self._timer = None
+            in_use = self._refs > 0
+            idle_for = time.monotonic() - self._last_used
+
+        if in_use:
+            # 반납될 때 다시 예약됨
+            return
+        if idle_for < self.idle_seconds:
+            self._schedule_idle_unload(self.idle_seconds - idle_for)
+            return
+        self.unload()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": self._loaded,
+            "refs": self._refs,
+            "loads": self.loads,
+            "unloads": self.unloads,
+            "load_seconds": self.load_seconds,
+            "idle_seconds": self.idle_seconds,
+        }
+
+
+# ==========================================
+# 레지스트리
+# ==========================================
+_registry: Dict[str, LazyResource] = {}
+_registry_lock = threading.Lock()
+
+
+def register(
+    name: str,
+    loader: Callable[[], Any],
+    unloader: Optional[Callable[[Any], None]] = None,
+    idle_seconds: float = 0,
+) -> LazyResource:
+    """name 으로 자원 등록 (이미 있으면 기존 것을 돌려줌 - 모듈 재import 대비)"""
+    with _registry_lock:
+        resource = _registry.get(name)
+        if resource is None:
+            resource = LazyResource(name, loader, unloader, idle_seconds)
+            _registry[name] = resource
+        return resource
+
+
+def get_resource(name: str) -> LazyResource:
+    return _registry[name]
+
+
+def registry_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: resource.stats() for name, resource in _registry.items()}
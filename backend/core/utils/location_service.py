@@ -2,7 +2,8 @@
 
 import os
 from typing import Optional, Tuple
-from math import radians, cos, sin, asin, sqrt
+
+from .spatial_index import get_index
 
 
 def dev_print(*args, **kwargs):
@@ -58,33 +59,11 @@ def find_nearest_port(
     Returns:
         항구 이름 또는 None
     """
-    from core.models import Port
-
-    def haversine(lat1, lon1, lat2, lon2):
-        """두 좌표 간의 거리(km) 계산"""
-        R = 6371  # 지구 반지름 (km)
-
-        lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-
-        a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
-        c = 2 * asin(sqrt(a))
-
-        return R * c
-
-    ports = Port.objects.all()
-    if not ports:
+    found = get_index("port").nearest(lat, lon, k=1)
+    if not found:
         return None
 
-    nearest_port = None
-    min_distance = float("inf")
-
-    for port in ports:
-        distance = haversine(lat, lon, port.lat, port.lon)
-        if distance < min_distance:
-            min_distance = distance
-            nearest_port = port
+    nearest_port, min_distance = found[0]
 
     # 최대 거리 이내의 항구만 반환
     if min_distance <= max_distance_km:
@@ -4,9 +4,9 @@ import requests
 import os
 import xmltodict
 from datetime import date
-from haversine import haversine
-from core.models import FishingSpot
 from dotenv import load_dotenv
+from .lunar_calendar import solar_to_lunar
+from .spatial_index import get_index
 from typing import Any, Dict, Optional, Tuple, Literal
 
 load_dotenv()
@@ -233,6 +233,21 @@ def build_tide_from_luncal_api(parsed: dict, formula: TideFormula) -> Optional[d
     return result
 
 
+def _lunar_from_table(sol_date: date) -> Optional[dict]:
+    """
+    오프라인 음력 표로 parse_luncal_api_dict 와 같은 형태의 결과 생성
+    (표가 없거나 범위 밖이면 None)
+    """
+    lun = solar_to_lunar(sol_date)
+    if lun is None:
+        return None
+
+    return {
+        "sol": {"year": sol_date.year, "month": sol_date.month, "day": sol_date.day},
+        "lun": lun,
+    }
+
+
 def get_multtae_by_location(
     user_lat: float,
     user_lon: float,
@@ -251,32 +266,28 @@ def get_multtae_by_location(
     """
     sol_date = target_date or date.today()
 
-    # API 호출 (양력 날짜 전달)
-    parsed = _call_lun_cal_api(sol_date)
-    if not parsed:
-        return None
+    # 오프라인 음력 표 조회 (표가 없거나 범위 밖일 때만 API 호출)
+    result = _lunar_from_table(sol_date)
+    if result is None:
+        dev_print(f"[음력변환] 음력 표에 {sol_date} 없음 → API 호출")
 
-    # 음력 정보 파싱
-    result = parse_luncal_api_dict(parsed)
-    if not result:
-        return None
+        parsed = _call_lun_cal_api(sol_date)
+        if not parsed:
+            return None
+
+        # 음력 정보 파싱
+        result = parse_luncal_api_dict(parsed)
+        if not result:
+            return None
 
     # 위치 기반 물때 공식 선택
     formula = "8"  # 기본값: 8물때
     try:
         nearest_area_sea: Optional[str] = None
-        nearest_dist_km: Optional[float] = None
-        user_coord = (user_lat, user_lon)
-
-        for lat, lon, area_sea in (
-            FishingSpot.objects.exclude(lat__isnull=True)
-            .exclude(lon__isnull=True)
-            .values_list("lat", "lon", "area_sea")
-        ):
-            dist = haversine(user_coord, (lat, lon))
-            if nearest_dist_km is None or dist < nearest_dist_km:
-                nearest_dist_km = dist
-                nearest_area_sea = area_sea
+
+        found = get_index("fishing_spot").nearest(user_lat, user_lon, k=1)
+        if found:
+            nearest_area_sea = found[0][0].area_sea
 
         if nearest_area_sea:
             formula = _choose_tide_formula_by_location(nearest_area_sea)
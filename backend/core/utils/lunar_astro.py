@@ -0,0 +1,202 @@
+# core/utils/lunar_astro.py
+"""
+음력 표 생성용 천문 계산 (Jean Meeus, Astronomical Algorithms)
+
+- new_moon_jde      : 합삭(신월) 시각 (49장, 주기항 + 행성 보정항)
+- solar_longitude   : 태양 시황경 (25장 저정밀식, 약 0.01°)
+- solar_term_jde    : 태양 황경이 주어진 값이 되는 시각 (절기/중기)
+- jde_to_kst_date   : JDE(역학시) → 한국 표준시(UTC+9) 날짜
+
+요청 처리 중에는 사용하지 않고, build_lunar_table 명령이 표를 만들 때만 쓴다.
+"""
+
+import math
+from datetime import date
+
+SYNODIC_MONTH = 29.530588861
+TROPICAL_YEAR = 365.242189
+
+# date.toordinal() 과 율리우스 적일(JDN)의 차이
+JDN_ORDINAL_OFFSET = 1721425
+
+KST_OFFSET_DAYS = 9 / 24
+
+
+def _sin(deg):
+    return math.sin(math.radians(deg))
+
+
+# ==========================================
+# 합삭 (Meeus 49장)
+# ==========================================
+# (계수, E 거듭제곱, M 배수, M' 배수, F 배수, Ω 배수)
+_NEW_MOON_TERMS = [
+    (-0.40720, 0, 0, 1, 0, 0),
+    (0.17241, 1, 1, 0, 0, 0),
+    (0.01608, 0, 0, 2, 0, 0),
+    (0.01039, 0, 0, 0, 2, 0),
+    (0.00739, 1, -1, 1, 0, 0),
+    (-0.00514, 1, 1, 1, 0, 0),
+    (0.00208, 2, 2, 0, 0, 0),
+    (-0.00111, 0, 0, 1, -2, 0),
+    (-0.00057, 0, 0, 1, 2, 0),
+    (0.00056, 1, 1, 2, 0, 0),
+    (-0.00042, 0, 0, 3, 0, 0),
+    (0.00042, 1, 1, 0, 2, 0),
+    (0.00038, 1, 1, 0, -2, 0),
+    (-0.00024, 1, -1, 2, 0, 0),
+    (-0.00017, 0, 0, 0, 0, 1),
+    (-0.00007, 0, 2, 1, 0, 0),
+    (0.00004, 0, 0, 2, -2, 0),
+    (0.00004, 0, 3, 0, 0, 0),
+    (0.00003, 0, 1, 1, -2, 0),
+    (0.00003, 0, 0, 2, 2, 0),
+    (-0.00003, 0, 1, 1, 2, 0),
+    (0.00003, 0, -1, 1, 2, 0),
+    (-0.00002, 0, -1, 1, -2, 0),
+    (-0.00002, 0, 1, 3, 0, 0),
+    (0.00002, 0, 0, 4, 0, 0),
+]
+
+# 행성 보정항 A1~A14: (계수, 기준각, k 계수)
+_PLANETARY_TERMS = [
+    (0.000325, 299.77, 0.107408),
+    (0.000165, 251.88, 0.016321),
+    (0.000164, 251.83, 26.651886),
+    (0.000126, 349.42, 36.412478),
+    (0.000110, 84.66, 18.206239),
+    (0.000062, 141.74, 53.303771),
+    (0.000060, 207.14, 2.453732),
+    (0.000056, 154.84, 7.306860),
+    (0.000047, 34.52, 27.261239),
+    (0.000042, 207.19, 0.121824),
+    (0.000040, 291.34, 1.844379),
+    (0.000037, 161.72, 24.198154),
+    (0.000035, 239.56, 25.513099),
+    (0.000023, 331.55, 3.592518),
+]
+
+
+def new_moon_k(year_fraction: float) -> int:
+    """소수 연도(예: 2024.1) 직후 합삭의 lunation 번호 k (2000-01-06 합삭 = 0)"""
+    return math.ceil((year_fraction - 2000) * 12.3685)
+
+
+def new_moon_jde(k: int) -> float:
+    """lunation 번호 k 의 합삭 시각 (JDE)"""
+    t = k / 1236.85
+    jde = (
+        2451550.09766
+        + SYNODIC_MONTH * k
+        + 0.00015437 * t**2
+        - 0.000000150 * t**3
+        + 0.00000000073 * t**4
+    )
+
+    e = 1 - 0.002516 * t - 0.0000074 * t**2
+    m = 2.5534 + 29.10535670 * k - 0.0000014 * t**2 - 0.00000011 * t**3
+    mp = (
+        201.5643
+        + 385.81693528 * k
+        + 0.0107582 * t**2
+        + 0.00001238 * t**3
+        - 0.000000058 * t**4
+    )
+    f = (
+        160.7108
+        + 390.67050284 * k
+        - 0.0016118 * t**2
+        - 0.00000227 * t**3
+        + 0.000000011 * t**4
+    )
+    omega = 124.7746 - 1.56375588 * k + 0.0020672 * t**2 + 0.00000215 * t**3
+
+    for coef, e_pow, m_mul, mp_mul, f_mul, om_mul in _NEW_MOON_TERMS:
+        arg = m_mul * m + mp_mul * mp + f_mul * f + om_mul * omega
+        jde += coef * (e**e_pow) * _sin(arg)
+
+    for coef, base, k_coef in _PLANETARY_TERMS:
+        angle = base + k_coef * k
+        if base == 299.77:  # A1 만 T² 항이 있음
+            angle -= 0.009173 * t**2
+        jde += coef * _sin(angle)
+
+    return jde
+
+
+# ==========================================
+# 태양 황경 (Meeus 25장)
+# ==========================================
+def solar_longitude(jde: float) -> float:
+    """JDE 시각의 태양 시황경 (deg, 0~360)"""
+    t = (jde - 2451545.0) / 36525
+    l0 = 280.46646 + 36000.76983 * t + 0.0003032 * t**2
+    m = 357.52911 + 35999.05029 * t - 0.0001537 * t**2
+    c = (
+        (1.914602 - 0.004817 * t - 0.000014 * t**2) * _sin(m)
+        + (0.019993 - 0.000101 * t) * _sin(2 * m)
+        + 0.000289 * _sin(3 * m)
+    )
+    omega = 125.04 - 1934.136 * t
+    apparent = l0 + c - 0.00569 - 0.00478 * _sin(omega)
+    return apparent % 360
+
+
+def solar_term_jde(target_longitude: float, near_jde: float) -> float:
+    """near_jde 근처에서 태양 황경이 target_longitude 가 되는 시각 (JDE)"""
+    jde = near_jde
+    for _ in range(20):
+        diff = (target_longitude - solar_longitude(jde) + 180) % 360 - 180
+        step = diff * TROPICAL_YEAR / 360
+        jde += step
+        if abs(step) < 1e-6:
+            break
+    return jde
+
+
+def solar_terms_of_year(year: int, step_deg: int = 30):
+    """
+    year 년 춘분(0°)부터 다음 해 춘분 직전까지의 (황경, JDE) 목록.
+    기본값은 중기(30° 간격). 춘분이 3월 20일 전후라는 점을 이용해 초기값을 잡는다.
+    """
+    spring_equinox = _date_to_jd(date(year, 3, 20))
+    terms = []
+    for longitude in range(0, 360, step_deg):
+        guess = spring_equinox + (longitude / 360) * TROPICAL_YEAR
+        jde = solar_term_jde(longitude, guess)
+        terms.append((longitude, jde))
+    return terms
+
+
+# ==========================================
+# 시간 변환
+# ==========================================
+def delta_t_seconds(year: float) -> float:
+    """ΔT = TT - UT (초), Espenak & Meeus 다항식"""
+    if year < 2005:
+        t = year - 2000
+        return (
+            63.86
+            + 0.3345 * t
+            - 0.060374 * t**2
+            + 0.0017275 * t**3
+            + 0.000651814 * t**4
+            + 0.00002373599 * t**5
+        )
+    if year < 2050:
+        t = year - 2000
+        return 62.92 + 0.32217 * t + 0.005589 * t**2
+    return -20 + 32 * ((year - 1820) / 100) ** 2 - 0.5628 * (2150 - year)
+
+
+def _date_to_jd(d: date) -> float:
+    """날짜 00:00 UT 의 율리우스일"""
+    return d.toordinal() + JDN_ORDINAL_OFFSET - 0.5
+
+
+def jde_to_kst_date(jde: float) -> date:
+    """JDE(역학시) → 한국 표준시 기준 날짜"""
+    year = 2000 + (jde - 2451545.0) / 365.25
+    jd_ut = jde - delta_t_seconds(year) / 86400
+    jdn = math.floor(jd_ut + KST_OFFSET_DAYS + 0.5)
+    return date.fromordinal(jdn - JDN_ORDINAL_OFFSET)
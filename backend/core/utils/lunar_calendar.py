@@ -0,0 +1,277 @@
+# core/utils/lunar_calendar.py
+"""
+오프라인 양력 → 음력 변환 표
+
+- build_lunar_table 명령이 합삭/중기 계산(lunar_astro)으로 표를 만들어
+  data/lunar_calendar.bin 에 저장 (verify_lunar_table 명령으로 KASI API 와 대조)
+- 요청 시에는 표를 한 번 읽어 두고 날짜 → 음력을 O(1) 로 조회
+
+음력 규칙 (한국천문연구원 방식)
+- 합삭(신월)이 든 날(KST)이 음력 초하루
+- 동지(황경 270°)가 든 달이 11월
+- 11월 ~ 다음 11월 사이가 13개월이면 그 사이 처음으로 중기가 없는 달이 윤달
+
+파일 형식 (little-endian)
+- 헤더  : magic "NLUN", version(u16), 시작일 ordinal(u32), 일수(u32), 월 개수(u32)
+- 월 표 : 월마다 (음력 연도 u16, 월 u8 [윤달이면 0x80], 그 달 일수 u8)
+- 일 표 : 날짜마다 u16 = (월 표 인덱스 << 5) | (음력 일 - 1), 표에 없는 날은 0xFFFF
+"""
+
+import os
+import struct
+import sys
+import threading
+from array import array
+from datetime import date
+from typing import Dict, List, Optional
+
+from django.conf import settings
+
+from . import lunar_astro
+
+TABLE_MAGIC = b"NLUN"
+TABLE_VERSION = 2
+_HEADER = struct.Struct("<4sHIII")
+_MONTH = struct.Struct("<HBB")
+
+LEAP_FLAG = 0x80
+DAY_BITS = 5
+# 음력을 정하지 못한 날 (월 표 인덱스로는 나올 수 없는 값)
+NO_DATA = 0xFFFF
+
+# 기본 수록 범위 (양력 연도)
+DEFAULT_START_YEAR = 1990
+DEFAULT_END_YEAR = 2060
+
+
+# 개발 모드용 출력 함수
+def dev_print(*args, **kwargs):
+    if os.getenv("APP_ENV") == "development":
+        print(*args, **kwargs)
+
+
+def default_table_path() -> str:
+    return getattr(
+        settings,
+        "LUNAR_TABLE_PATH",
+        os.path.join(settings.BASE_DIR, "data", "lunar_calendar.bin"),
+    )
+
+
+# ==========================================
+# 표 생성 (build_lunar_table 명령)
+# ==========================================
+def _new_moon_dates(start: date, end: date) -> List[date]:
+    """start 이전 마지막 합삭일 ~ end 이후 첫 합삭일 (KST)"""
+    k = lunar_astro.new_moon_k(start.year + (start.timetuple().tm_yday - 1) / 365.25)
+    k -= 2
+    dates = []
+    while True:
+        d = lunar_astro.jde_to_kst_date(lunar_astro.new_moon_jde(k))
+        k += 1
+        if d <= start:
+            dates = [d]
+            continue
+        dates.append(d)
+        if d > end:
+            return dates
+
+
+def _principal_term_dates(start_year: int, end_year: int) -> List[tuple]:
+    """(KST 날짜, 황경) 중기 목록 - 날짜순"""
+    terms = []
+    for year in range(start_year, end_year + 1):
+        for longitude, jde in lunar_astro.solar_terms_of_year(year):
+            terms.append((lunar_astro.jde_to_kst_date(jde), longitude))
+    terms.sort()
+    return terms
+
+
+def compute_lunar_months(start_year: int, end_year: int) -> List[Dict]:
+    """
+    start_year-01-01 ~ end_year-12-31 을 덮는 음력 달 목록.
+    각 원소: {"start": date, "nday": int, "year": int, "month": int, "leap": bool}
+    """
+    # 앞뒤로 동지 달이 하나 이상 들어오도록 여유를 둔다.
+    # (end_year 의 11월 이후 달에 번호를 붙이려면 이듬해 동지 달까지 필요)
+    first_day = date(start_year - 1, 10, 1)
+    last_day = date(end_year + 2, 1, 31)
+    moon_starts = _new_moon_dates(first_day, last_day)
+    terms = _principal_term_dates(start_year - 2, end_year + 2)
+
+    months = []
+    term_idx = 0
+    for start, next_start in zip(moon_starts, moon_starts[1:]):
+        while term_idx < len(terms) and terms[term_idx][0] < start:
+            term_idx += 1
+        contained = []
+        while term_idx < len(terms) and terms[term_idx][0] < next_start:
+            contained.append(terms[term_idx][1])
+            term_idx += 1
+        months.append(
+            {
+                "start": start,
+                "nday": (next_start - start).days,
+                "terms": contained,
+            }
+        )
+
+    # 동지가 든 달 = 11월
+    winter_idxs = [i for i, m in enumerate(months) if 270 in m["terms"]]
+    if len(winter_idxs) < 2:
+        raise ValueError("동지 달을 찾을 수 없습니다. 수록 범위를 확인하세요.")
+
+    for a, b in zip(winter_idxs, winter_idxs[1:]):
+        leap_idx = None
+        if b - a == 13:
+            leap_idx = next(
+                (i for i in range(a + 1, b) if not months[i]["terms"]), None
+            )
+
+        number = 11
+        months[a].update(month=11, leap=False)
+        for i in range(a + 1, b):
+            if i == leap_idx:
+                months[i].update(month=number, leap=True)
+            else:
+                number = number % 12 + 1
+                months[i].update(month=number, leap=False)
+
+    # 첫 번째 / 마지막 동지 달 바깥은 번호를 정할 수 없으므로 버린다.
+    months = months[winter_idxs[0] : winter_idxs[-1]]
+
+    for m in months:
+        start = m["start"]
+        # 11·12월이 양력 이듬해 초에 시작하면 전년도 음력
+        m["year"] = start.year
+        if m["month"] >= 11 and start.month < 6:
+            m["year"] -= 1
+        del m["terms"]
+
+    first_needed = date(start_year, 1, 1)
+    last_needed = date(end_year, 12, 31)
+    return [
+        m
+        for m in months
+        if m["start"] <= last_needed
+        and m["start"].toordinal() + m["nday"] > first_needed.toordinal()
+    ]
+
+
+def build_table_bytes(
+    start_year: int = DEFAULT_START_YEAR, end_year: int = DEFAULT_END_YEAR
+) -> bytes:
+    """음력 표를 파일 형식(bytes)으로 생성"""
+    months = compute_lunar_months(start_year, end_year)
+    base = date(start_year, 1, 1).toordinal()
+    n_days = date(end_year, 12, 31).toordinal() - base + 1
+
+    days = array("H", [NO_DATA]) * n_days
+    for idx, m in enumerate(months):
+        first = m["start"].toordinal()
+        for offset in range(m["nday"]):
+            pos = first + offset - base
+            if 0 <= pos < n_days:
+                days[pos] = (idx << DAY_BITS) | offset
+
+    if sys.byteorder != "little":
+        days.byteswap()
+
+    out = [_HEADER.pack(TABLE_MAGIC, TABLE_VERSION, base, n_days, len(months))]
+    for m in months:
+        flags = m["month"] | (LEAP_FLAG if m["leap"] else 0)
+        out.append(_MONTH.pack(m["year"], flags, m["nday"]))
+    out.append(days.tobytes())
+    return b"".join(out)
+
+
+# ==========================================
+# 요청 시 조회
+# ==========================================
+class LunarTable:
+    """lunar_calendar.bin 을 메모리에 올려 두고 날짜별 음력 조회"""
+
+    def __init__(self, data: bytes):
+        magic, version, base, n_days, n_months = _HEADER.unpack_from(data, 0)
+        if magic != TABLE_MAGIC or version != TABLE_VERSION:
+            raise ValueError("음력 표 파일 형식이 올바르지 않습니다.")
+
+        self.base = base
+        self.n_days = n_days
+        self.months = [
+            _MONTH.unpack_from(data, _HEADER.size + i * _MONTH.size)
+            for i in range(n_months)
+        ]
+
+        self.days = array("H")
+        self.days.frombytes(data[_HEADER.size + n_months * _MONTH.size :])
+        if sys.byteorder != "little":
+            self.days.byteswap()
+        if len(self.days) != n_days:
+            raise ValueError("음력 표 파일이 손상되었습니다.")
+
+    @property
+    def first_date(self) -> date:
+        return date.fromordinal(self.base)
+
+    @property
+    def last_date(self) -> date:
+        return date.fromordinal(self.base + self.n_days - 1)
+
+    def lookup(self, sol_date: date) -> Optional[Dict]:
+        """
+        양력 날짜 → 음력 dict (범위 밖이면 None)
+        {"year", "month", "day", "nday", "leapmonth"("평"/"윤")}
+        - 음력변환 API 의 lunYear/lunMonth/lunDay/lunNday/lunLeapmonth 와 같은 의미
+        """
+        pos = sol_date.toordinal() - self.base
+        if not 0 <= pos < self.n_days:
+            return None
+
+        packed = self.days[pos]
+        if packed == NO_DATA:
+            return None
+        year, flags, nday = self.months[packed >> DAY_BITS]
+        return {
+            "year": year,
+            "month": flags & ~LEAP_FLAG,
+            "day": (packed & ((1 << DAY_BITS) - 1)) + 1,
+            "nday": nday,
+            "leapmonth": "윤" if flags & LEAP_FLAG else "평",
+        }
+
+
+_table: Optional[LunarTable] = None
+_table_loaded = False
+_table_lock = threading.Lock()
+
+
+def get_lunar_table() -> Optional[LunarTable]:
+    """음력 표 (프로세스당 한 번 로드). 파일이 없거나 깨졌으면 None"""
+    global _table, _table_loaded
+
+    if _table_loaded:
+        return _table
+
+    with _table_lock:
+        if not _table_loaded:
+            path = default_table_path()
+            try:
+                with open(path, "rb") as f:
+                    _table = LunarTable(f.read())
+                dev_print(
+                    f"[음력표] 로드: {_table.first_date} ~ {_table.last_date} ({path})"
+                )
+            except (OSError, ValueError, struct.error) as e:
+                print(f"[음력표][WARNING] 음력 표를 읽을 수 없습니다: {e}")
+                _table = None
+            _table_loaded = True
+    return _table
+
+
+def solar_to_lunar(sol_date: date) -> Optional[Dict]:
+    """양력 → 음력 (표 범위 밖이거나 표가 없으면 None)"""
+    table = get_lunar_table()
+    if table is None:
+        return None
+    return table.lookup(sol_date)
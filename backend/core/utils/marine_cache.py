@@ -0,0 +1,119 @@
+# core/utils/marine_cache.py
+"""
+해양/기상 데이터 캐시
+
+- 사용자 좌표를 일정 크기의 격자(cell)로 묶어서 캐시 키로 사용
+  (같은 시간대에 200m 떨어진 두 사용자는 같은 결과를 공유)
+- 소스별로 데이터 갱신 주기가 달라서 TTL 정책을 따로 둔다.
+    * kma     : 초단기실황 base_time 단위 (매시 10분 갱신)
+    * fishing : 바다낚시지수 predcNoonSeCd 단위 (오전/오후)
+    * tide    : 조석예보 표 - 하루 단위 (관측소 기준)
+    * luncal  : 음력/물때 - 달력 하루 단위
+    * buoy    : 부이 최신 관측 - MARINE_CACHE_BUOY_TTL 초
+"""
+
+import math
+import os
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+
+CACHE_KEY_PREFIX = "marine"
+
+
+# 개발 모드용 출력 함수
+def dev_print(*args, **kwargs):
+    if os.getenv("APP_ENV") == "development":
+        print(*args, **kwargs)
+
+
+def _now_kst():
+    return datetime.utcnow() + timedelta(hours=9)
+
+
+def _seconds_until(target, now):
+    return max(int((target - now).total_seconds()), 1)
+
+
+def _next_midnight(now):
+    return now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+
+
+# ==========================================
+# 소스별 TTL 정책 → (bucket, ttl 초)
+# ==========================================
+def _kma_policy(now, requested_at):
+    # 초단기실황은 매시 10분 이후 갱신 → kma_api._calc_base_datetime 과 같은 기준
+    base = now - timedelta(minutes=10)
+    bucket = base.strftime("%Y%m%d%H00")
+    next_refresh = base.replace(minute=0, second=0, microsecond=0) + timedelta(
+        hours=1, minutes=10
+    )
+    return bucket, _seconds_until(next_refresh, now)
+
+
+def _fishing_policy(now, requested_at):
+    # 바다낚시지수는 요청 시각의 날짜 + 오전/오후(predcNoonSeCd) 단위로 바뀜
+    # (키는 요청 시각 기준, TTL 은 지금 기준으로 다음 오전/오후 경계까지)
+    target = requested_at or now
+    half = "오전" if target.hour < 12 else "오후"
+    if now.hour < 12:
+        boundary = now.replace(hour=12, minute=0, second=0, microsecond=0)
+    else:
+        boundary = _next_midnight(now)
+    return f"{target.strftime('%Y%m%d')}{half}", _seconds_until(boundary, now)
+
+
+def _daily_policy(now, requested_at):
+    # 조석예보 표 / 음력 물때는 날짜가 바뀔 때만 달라짐
+    return now.strftime("%Y%m%d"), _seconds_until(_next_midnight(now), now)
+
+
+def _buoy_policy(now, requested_at):
+    return "latest", getattr(settings, "MARINE_CACHE_BUOY_TTL", 600)
+
+
+TTL_POLICIES = {
+    "kma": _kma_policy,
+    "fishing": _fishing_policy,
+    "tide": _daily_policy,
+    "luncal": _daily_policy,
+    "buoy": _buoy_policy,
+}
+
+
+def cell_key(lat, lon, *extra):
+    """
+    좌표를 MARINE_CACHE_CELL_DEG 크기의 격자로 묶은 키
+    (extra 로 어종 등 추가 구분값을 붙일 수 있음)
+    """
+    size = getattr(settings, "MARINE_CACHE_CELL_DEG", 0.02)
+    parts = [str(math.floor(float(lat) / size)), str(math.floor(float(lon) / size))]
+    parts.extend(str(e) for e in extra if e)
+    return ":".join(parts)
+
+
+def get_or_fetch(source, key, fetcher, requested_at=None):
+    """
+    source 의 TTL 정책에 따라 캐시된 값을 반환하고, 없으면 fetcher() 호출 후 저장.
+
+    - fetcher 결과가 None/빈 값이면 캐시하지 않음 (다음 요청에서 재시도)
+    - 캐시에서 꺼낸 값은 매번 새 객체이므로 호출자가 수정해도 안전
+    """
+    if not getattr(settings, "MARINE_CACHE_ENABLED", True):
+        return fetcher()
+
+    bucket, ttl = TTL_POLICIES[source](_now_kst(), requested_at)
+    cache_key = f"{CACHE_KEY_PREFIX}:{source}:{key}:{bucket}"
+
+    cached = cache.get(cache_key)
+    if cached is not None:
+        dev_print(f"[해양캐시] HIT {cache_key}")
+        return cached
+
+    dev_print(f"[해양캐시] MISS {cache_key}")
+    value = fetcher()
+    if value:
+        cache.set(cache_key, value, ttl)
+    return value
@@ -0,0 +1,77 @@
+# core/utils/metrics.py
+"""
+간단한 운영 지표 (Django 캐시 기반)
+
+- 캐시(FileBasedCache)를 공유하므로 웹 워커와 배치 명령의 지표를 한곳에서 본다.
+- incr      : 누적 카운터
+- set_gauge : 마지막 값 (소요 시간, 지연 등)
+- observe   : 관측값의 횟수/합계/최대/마지막 값
+  (자주 부르는 곳은 메모리에 모았다가 observe_many 로 한 번에 기록)
+- snapshot  : 등록된 지표 전체 (관리자용 /api/metrics/ 에서 사용)
+
+프로세스 사이에 원자적이지는 않으므로 대략적인 추세를 보는 용도로만 쓴다.
+"""
+
+from typing import Any, Dict, Optional
+
+from django.core.cache import cache
+
+METRIC_KEY = "metrics:{name}"
+INDEX_KEY = "metrics:names"
+
+# 이 프로세스에서 이미 등록한 지표 이름
+_registered = set()
+
+
+def _key(name: str) -> str:
+    return METRIC_KEY.format(name=name)
+
+
+def _register(name: str):
+    if name in _registered:
+        return
+    names = cache.get(INDEX_KEY) or []
+    if name not in names:
+        cache.set(INDEX_KEY, sorted(names + [name]), None)
+    _registered.add(name)
+
+
+def incr(name: str, amount=1):
+    """카운터 증가"""
+    key = _key(name)
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key, amount)
+    except ValueError:  # 그 사이 만료/삭제된 경우
+        cache.set(key, amount, None)
+    _register(name)
+
+
+def set_gauge(name: str, value: Any):
+    """게이지 값 설정 (마지막 값만 유지)"""
+    cache.set(_key(name), value, None)
+    _register(name)
+
+
+def observe(name: str, value: float):
+    """관측값 기록 → name.count / name.sum / name.max / name.last"""
+    observe_many(name, 1, value, value, value)
+
+
+def observe_many(name: str, count: int, total: float, max_value: float, last: float):
+    """메모리에 모아 둔 관측값 여러 개를 한 번에 기록 (observe 와 같은 키)"""
+    incr(f"{name}.count", count)
+    incr(f"{name}.sum", total)
+    current_max = cache.get(_key(f"{name}.max"))
+    if current_max is None or max_value > current_max:
+        set_gauge(f"{name}.max", max_value)
+    set_gauge(f"{name}.last", last)
+
+
+def snapshot(prefix: Optional[str] = None) -> Dict[str, Any]:
+    """등록된 지표 값 (prefix 로 시작하는 것만 고를 수 있음)"""
+    names = [
+        n for n in (cache.get(INDEX_KEY) or []) if not prefix or n.startswith(prefix)
+    ]
+    values = cache.get_many([_key(n) for n in names])
+    return {n: values.get(_key(n)) for n in names}
@@ -0,0 +1,177 @@
+# core/utils/micro_batcher.py
+"""
+동시 요청 묶어 처리하기 (dynamic micro-batching)
+
+- 여러 스레드가 submit(item) 으로 넣은 요청을 전용 스레드 하나가 모은다.
+- 첫 요청이 들어온 뒤 max_wait_ms 동안(또는 max_batch_size 개가 찰 때까지)
+  기다렸다가 handler(items) 를 한 번 호출하고, 결과를 요청별로 돌려준다.
+- 모델 추론처럼 배치 크기를 키워도 시간이 거의 늘지 않는 작업에 사용
+- handler 는 항상 전용 스레드 하나에서만 실행되므로 따로 잠글 필요가 없다.
+- metric_name 을 주면 배치 크기/처리 시간과 대기열 길이/대기 시간을 기록한다.
+  배치마다 캐시에 쓰지 않고 메모리에 모았다가 flush_seconds 마다 한 번에 쓴다.
+"""
+
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from django.conf import settings
+
+from . import metrics
+
+
+class _Pending:
+    __slots__ = ("item", "event", "result", "error", "enqueued_at")
+
+    def __init__(self, item):
+        self.item = item
+        self.enqueued_at = time.monotonic()
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class MicroBatcher:
+    """
+    handler: items 목록 → 같은 길이/순서의 결과 목록
+    metric_name: 지정하면 core.utils.metrics 에 기록
+      {metric_name}.batch_size / batch_ms / queue_ms(배치 안 최대 대기 시간) 관측값,
+      {metric_name}.queue_depth(배치를 꺼낸 뒤 남은 요청 수) 게이지
+    flush_seconds: 지표를 캐시에 쓰는 간격 (기본: BATCH_METRICS_FLUSH_SECONDS)
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], Sequence[Any]],
+        max_batch_size: int = 8,
+        max_wait_ms: float = 10,
+        name: str = "micro-batcher",
+        metric_name: Optional[str] = None,
+        flush_seconds: Optional[float] = None,
+    ):
+        self.handler = handler
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.name = name
+        self.metric_name = metric_name
+        if flush_seconds is None:
+            flush_seconds = getattr(settings, "BATCH_METRICS_FLUSH_SECONDS", 10)
+        self.flush_seconds = max(0.0, flush_seconds)
+
+        # 아직 캐시에 쓰지 않은 관측값: 이름 → [count, sum, max, last]
+        self._observed: Dict[str, List[float]] = {}
+        self._queue_depth = None
+        self._flushed_at = time.monotonic()
+
+        self._queue: "queue.Queue[_Pending]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid = None
+
+    def submit(self, item, timeout: Optional[float] = None):
+        """item 을 넣고 결과를 기다린다 (handler 의 예외는 그대로 전달)"""
+        self._ensure_thread()
+
+        pending = _Pending(item)
+        self._queue.put(pending)
+        if not pending.event.wait(timeout):
+            raise TimeoutError(f"{self.name}: {timeout}s 안에 처리되지 않았습니다.")
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
+
+    def _ensure_thread(self):
+        # gunicorn 이 fork 한 프로세스에는 부모의 스레드가 없으므로 pid 도 확인
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._queue = queue.Queue()
+            self._thread = threading.Thread(
+                target=self._run, name=self.name, daemon=True
+            )
+            self._pid = os.getpid()
+            self._thread.start()
+
+    def _collect(self) -> List[_Pending]:
+        # 한가할 때도 모아 둔 지표는 제때 쓰도록 flush_seconds 마다 깨어난다.
+        try:
+            first = self._queue.get(timeout=self.flush_seconds or None)
+        except queue.Empty:
+            return []
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if not batch:
+                self._flush_metrics()
+                continue
+            started = time.monotonic()
+            queue_depth = self._queue.qsize()
+            try:
+                results = list(self.handler([p.item for p in batch]))
+                if len(results) != len(batch):
+                    raise RuntimeError(
+                        f"{self.name}: 결과 {len(results)}개 / 요청 {len(batch)}개"
+                    )
+                for pending, result in zip(batch, results):
+                    pending.result = result
+            except Exception as e:
+                for pending in batch:
+                    pending.error = e
+            finally:
+                for pending in batch:
+                    pending.event.set()
+
+            if self.metric_name:
+                self._observe("batch_size", len(batch))
+                self._observe("batch_ms", round((time.monotonic() - started) * 1000, 1))
+                self._observe(
+                    "queue_ms", round((started - batch[0].enqueued_at) * 1000, 1)
+                )
+                self._queue_depth = queue_depth
+                if time.monotonic() - self._flushed_at >= self.flush_seconds:
+                    self._flush_metrics()
+
+    # ------------------------------------------
+    # 지표 (메모리에 모았다가 한 번에 기록)
+    # ------------------------------------------
+    def _observe(self, name: str, value: float):
+        stat = self._observed.get(name)
+        if stat is None:
+            self._observed[name] = [1, value, value, value]
+            return
+        stat[0] += 1
+        stat[1] += value
+        stat[2] = max(stat[2], value)
+        stat[3] = value
+
+    def _flush_metrics(self):
+        self._flushed_at = time.monotonic()
+        if not self.metric_name:
+            return
+        observed, self._observed = self._observed, {}
+        queue_depth, self._queue_depth = self._queue_depth, None
+        try:
+            for name, (count, total, max_value, last) in observed.items():
+                metrics.observe_many(
+                    f"{self.metric_name}.{name}", count, total, max_value, last
+                )
+            if queue_depth is not None:
+                metrics.set_gauge(f"{self.metric_name}.queue_depth", queue_depth)
+        except Exception:
+            pass
@@ -0,0 +1,237 @@
+# core/utils/model_server.py
+"""
+에기 추천 비전 모델(YOLO + Keras) 전용 추론 서버 / 클라이언트
+
+- run_model_server 명령이 별도 프로세스에서 모델을 한 번만 로드하고
+  로컬 Unix 소켓으로 요청을 받는다.
+- 웹 워커(gunicorn)는 predict_via_server 로 이미지와 해양 데이터를 보내고
+  결과만 받으므로, 워커 수를 늘려도 모델이 워커마다 복사되지 않는다.
+
+프로토콜 (요청/응답 모두 프레임 = 4바이트 길이(big-endian) + 본문)
+- 요청 : JSON 헤더 프레임 {"op": "predict"|"ping", "marine_data": {...}}
+         + op 가 predict 이면 이미지 바이트 프레임
+- 응답 : JSON 프레임 {"ok": bool, "result": ..., "error": str}
+"""
+
+import io
+import json
+import os
+import socket
+import socketserver
+import struct
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+
+_LENGTH = struct.Struct("!I")
+# 한 프레임 최대 크기 (업로드 이미지 포함)
+MAX_FRAME_BYTES = 32 * 1024 * 1024
+
+
+# 개발 모드용 출력 함수
+def dev_print(*args, **kwargs):
+    if os.getenv("APP_ENV") == "development":
+        print(*args, **kwargs)
+
+
+class ModelServerUnavailable(Exception):
+    """모델 서버에 연결할 수 없거나 응답이 올바르지 않음"""
+
+
+class ModelServerError(Exception):
+    """모델 서버가 요청을 받았지만 추론 중 에러를 돌려줌 (ok: False)"""
+
+
+def default_socket_path() -> str:
+    return getattr(
+        settings,
+        "MODEL_SERVER_SOCKET",
+        os.path.join(settings.BASE_DIR, "model_server.sock"),
+    )
+
+
+# ==========================================
+# 프레임 입출력
+# ==========================================
+def _recv_exact(sock, size: int) -> bytes:
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = sock.recv(min(remaining, 1024 * 1024))
+        if not chunk:
+            raise ConnectionError("연결이 끊어졌습니다.")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _send_frame(sock, payload: bytes):
+    sock.sendall(_LENGTH.pack(len(payload)) + payload)
+
+
+def _recv_frame(sock) -> bytes:
+    (size,) = _LENGTH.unpack(_recv_exact(sock, _LENGTH.size))
+    if size > MAX_FRAME_BYTES:
+        raise ValueError(f"프레임이 너무 큽니다: {size} bytes")
+    return _recv_exact(sock, size)
+
+
+def _send_json(sock, obj):
+    _send_frame(sock, json.dumps(obj, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+def _recv_json(sock):
+    return json.loads(_recv_frame(sock).decode("utf-8"))
+
+
+# ==========================================
+# 서버 (manage.py run_model_server)
+# ==========================================
+# 배치를 쓰지 않을 때는 추론을 한 번에 하나씩 (Keras/YOLO 모델을 스레드 사이에 동시에 쓰지 않음)
+# 배치를 쓰면 묶음 처리 스레드 하나가 추론하므로 잠그지 않는다.
+_inference_lock = threading.Lock()
+_started_at = time.time()
+# serve() 가 실행 중인 프로세스(run_model_server)인지
+_serving = False
+
+
+def is_serving() -> bool:
+    return _serving
+
+
+def _models_status() -> Dict[str, Any]:
+    from . import ai_inference, lazy_resource
+
+    return {
+        "resources": lazy_resource.registry_stats(),
+        "egi_rec_model": ai_inference.egi_rec_model is not None,
+        "water_cls_model": ai_inference.water_cls_model is not None,
+        "yolo_model": ai_inference.yolo_model is not None,
+        "backend": ai_inference.loaded_backend,
+        "uptime_sec": round(time.time() - _started_at),
+    }
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        from .ai_inference import infer, inference_batching_enabled
+
+        try:
+            header = _recv_json(self.request)
+            op = header.get("op")
+
+            if op == "ping":
+                _send_json(self.request, {"ok": True, "result": _models_status()})
+                return
+
+            if op != "predict":
+                _send_json(self.request, {"ok": False, "error": f"unknown op: {op}"})
+                return
+
+            image_bytes = _recv_frame(self.request)
+            started = time.monotonic()
+            lock = nullcontext() if inference_batching_enabled() else _inference_lock
+            with lock:
+                rec_color, water_color, debug_info = infer(
+                    io.BytesIO(image_bytes), header.get("marine_data") or {}
+                )
+            dev_print(f"[모델서버] 추론 {(time.monotonic() - started) * 1000:.0f}ms")
+
+            _send_json(
+                self.request,
+                {"ok": True, "result": [rec_color, water_color, debug_info]},
+            )
+        except (ConnectionError, ValueError, struct.error) as e:
+            dev_print(f"[모델서버] 잘못된 요청: {e}")
+        except Exception as e:
+            print(f"[모델서버] 처리 에러: {e}")
+            try:
+                _send_json(self.request, {"ok": False, "error": str(e)})
+            except OSError:
+                pass
+
+
+class ModelServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(socket_path: Optional[str] = None):
+    """모델을 로드하고 socket_path 에서 요청을 받는다 (종료될 때까지 블록)"""
+    global _serving
+    from .ai_inference import warm_up_models
+
+    socket_path = socket_path or default_socket_path()
+    _serving = True
+
+    # 소켓을 열기 전에 모델 로드 + 더미 추론까지 끝내 둔다.
+    try:
+        warm_up_models()
+    except Exception as e:
+        print(f"[모델서버] 워밍업 실패: {e}")
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    server = ModelServer(socket_path, _RequestHandler)
+    # gunicorn 과 같은 그룹(www-data)에서 접속할 수 있도록
+    os.chmod(socket_path, 0o660)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+# ==========================================
+# 클라이언트 (웹 워커)
+# ==========================================
+def _request(header: Dict[str, Any], body: Optional[bytes] = None, timeout=None):
+    socket_path = default_socket_path()
+    timeout = timeout or getattr(settings, "MODEL_SERVER_TIMEOUT", 30)
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(socket_path)
+            _send_json(sock, header)
+            if body is not None:
+                _send_frame(sock, body)
+            response = _recv_json(sock)
+    except (OSError, ValueError, struct.error) as e:
+        raise ModelServerUnavailable(f"{socket_path}: {e}") from e
+
+    if not response.get("ok"):
+        raise ModelServerError(response.get("error") or "알 수 없는 에러")
+    return response.get("result")
+
+
+def _read_image_bytes(image_file) -> bytes:
+    if isinstance(image_file, (bytes, bytearray)):
+        return bytes(image_file)
+    if isinstance(image_file, str):
+        with open(image_file, "rb") as f:
+            return f.read()
+    if hasattr(image_file, "seek"):
+        image_file.seek(0)
+    return image_file.read()
+
+
+def predict_via_server(image_file, marine_data):
+    """모델 서버에 추론 요청 → (추천 색상, 물색, debug_info)"""
+    rec_color, water_color, debug_info = _request(
+        {"op": "predict", "marine_data": marine_data},
+        _read_image_bytes(image_file),
+    )
+    return rec_color, water_color, debug_info
+
+
+def ping_server(timeout: float = 2) -> Dict[str, Any]:
+    """
+    모델 서버 상태 (로드된 모델, 가동 시간)
+    연결 실패 시 ModelServerUnavailable, 서버가 에러를 돌려주면 ModelServerError
+    """
+    return _request({"op": "ping"}, timeout=timeout)
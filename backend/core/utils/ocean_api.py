@@ -6,9 +6,16 @@
 
 import requests
 import os
-from haversine import haversine
-from core.models import Buoy
+import threading
+from collections import deque
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from .spatial_index import get_index
 
 load_dotenv()
 
@@ -86,20 +93,12 @@ def get_nearby_buoys(user_lat, user_lon, limit=5):
     """
     가까운 부이 N개 구하기
     """
-    buoys = Buoy.objects.all()
-    dev_print(f"[MOF] [DEBUG] DB에 등록된 전체 부이 개수: {buoys.count()}")
+    index = get_index("buoy")
+    dev_print(f"[MOF] [DEBUG] DB에 등록된 전체 부이 개수: {len(index)}")
 
-    buoy_list = []
+    buoy_list = index.nearest(user_lat, user_lon, k=limit)
 
-    for buoy in buoys:
-        buoy_loc = (buoy.lat, buoy.lon)
-        user_loc = (user_lat, user_lon)
-        dist = haversine(user_loc, buoy_loc)
-        buoy_list.append((buoy, dist))
-
-    buoy_list.sort(key=lambda x: x[1])
-
-    result = [item[0] for item in buoy_list[:limit]]
+    result = [item[0] for item in buoy_list]
 
     if result:
         dev_print(f"[MOF] [DEBUG] 가장 가까운 부이 {len(result)}개:")
@@ -110,9 +109,10 @@ def get_nearby_buoys(user_lat, user_lon, limit=5):
     return result
 
 
-def fetch_buoy_api(buoy, service_key):
+def fetch_buoy_api(buoy, service_key, session=None):
     """
     단일 부이의 API 호출 및 데이터 파싱
+    (session 을 넘기면 그 커넥션 풀을 재사용)
     """
     base_url = "http://www.khoa.go.kr/api/oceangrid/buObsRecent/search.do"
     request_url = (
@@ -126,7 +126,7 @@ def fetch_buoy_api(buoy, service_key):
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
-        response = requests.get(request_url, headers=headers, timeout=5)
+        response = (session or requests).get(request_url, headers=headers, timeout=5)
 
         dev_print(f"[MOF] [DEBUG] 응답 상태: {response.status_code}")
 
@@ -201,17 +201,113 @@ def extract_latest_value(raw_data_list, key):
     return None
 
 
-def get_buoy_data(user_lat, user_lon):
+def summarize_buoy_raw(raw_data):
+    """부이 raw_data 리스트 → 항목별 최신 유효값 요약 dict"""
+    wind_dir_deg, _ = _extract_latest_wind_dir(raw_data)
+    return {
+        "water_temp": extract_latest_value(raw_data, "water_temp"),
+        "wave_height": extract_latest_value(raw_data, "wave_height"),
+        "wind_speed": extract_latest_value(raw_data, "wind_speed"),
+        "wind_direction_deg": wind_dir_deg,
+        "record_time": raw_data[-1].get("record_time"),
+    }
+
+
+def _merge_buoy_summary(result, buoy, summary, required_keys):
+    """부이 1개의 요약값으로 result 의 빈 필드를 채운다. 하나라도 채웠으면 True"""
+    data_found = False
+    wind_found = False
+
+    # 필요한 데이터만 채우기
+    for key in required_keys:
+        if result[key] is None:
+            value = summary.get(key)
+            if value is not None:
+                result[key] = value
+                data_found = True
+                dev_print(f"    ✓ {buoy.name}: {key}={value}")
+
+    # 대표 관측소 설정 (처음 데이터를 준 부이)
+    if result["station_name"] is None and data_found:
+        result["station_name"] = buoy.name
+        result["record_time"] = summary.get("record_time")
+
+    # 풍향이 비어 있다면 이 부이에서 풍향도 세팅
+    if result["wind_direction_deg"] is None or result["wind_direction_16"] is None:
+        dir_deg = summary.get("wind_direction_deg")
+        if dir_deg is not None:
+            result["wind_direction_deg"] = dir_deg
+            result["wind_direction_16"] = _deg_to_16_wind(dir_deg)
+            wind_found = True
+
+    return data_found or wind_found
+
+
+# 부이 조회용 공용 HTTP 세션 (프로세스당 1개)
+# 스레드 풀은 요청마다 따로 만든다. (느린 KHOA 응답이 다른 사용자의 조회를 막지 않도록)
+_buoy_session = None
+_buoy_session_lock = threading.Lock()
+
+
+def _get_buoy_session():
+    """KHOA 서버와의 keep-alive 커넥션을 재사용하는 세션"""
+    global _buoy_session
+
+    if _buoy_session is None:
+        with _buoy_session_lock:
+            if _buoy_session is None:
+                pool_size = getattr(settings, "BUOY_POLL_MAX_WORKERS", 8)
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _buoy_session = session
+    return _buoy_session
+
+
+def _iter_buoy_data_sequential(buoys, service_key):
+    session = _get_buoy_session()
+    for buoy in buoys:
+        yield buoy, fetch_buoy_api(buoy, service_key, session)
+
+
+def _iter_buoy_data_parallel(buoys, service_key, window):
     """
-    적극적 데이터 수집 - 반드시 데이터를 찾아냄
+    거리 순서를 유지하면서 최대 window 개씩 동시에 요청.
+    호출자가 순회를 멈추면(break) 아직 시작하지 않은 요청은 취소한다.
+    스레드 풀은 이 조회 전용 (window 개) - 다른 요청과 슬롯을 나눠 쓰지 않는다.
     """
-    service_key = os.getenv("OceanServiceKey")
+    executor = ThreadPoolExecutor(max_workers=window, thread_name_prefix="buoy-poll")
+    session = _get_buoy_session()
+    pending = deque()
+    buoy_iter = iter(buoys)
+
+    def _submit_next():
+        buoy = next(buoy_iter, None)
+        if buoy is not None:
+            pending.append(
+                (buoy, executor.submit(fetch_buoy_api, buoy, service_key, session))
+            )
 
-    if not service_key:
-        print("[MOF] [ERROR] OceanServiceKey가 .env 파일에 없습니다!")
-        return None
-
-    result = {
+    try:
+        for _ in range(window):
+            _submit_next()
+
+        while pending:
+            buoy, future = pending.popleft()
+            raw_data = future.result()
+            _submit_next()
+            yield buoy, raw_data
+    finally:
+        cancelled = sum(1 for _, future in pending if future.cancel())
+        if cancelled:
+            dev_print(f"[MOF] 남은 부이 요청 {cancelled}개 취소")
+        # 실행 중인 요청은 기다리지 않는다. (HTTP timeout 이 지나면 스레드도 끝남)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _new_buoy_result():
+    return {
         "station_name": None,
         "water_temp": None,
         "wave_height": None,
@@ -219,66 +315,92 @@ def get_buoy_data(user_lat, user_lon):
         "record_time": None,
         "wind_direction_deg": None,
         "wind_direction_16": None,
+        # 쓴 관측값 중 가장 먼저 수집한 시각 (ISO). 경과 시간은 응답 만들 때 계산
+        # (이 결과는 marine_cache 에 저장되므로 여기서 계산하면 캐시 TTL 만큼 틀어짐)
+        "buoy_fetched_at": None,
     }
 
-    required_keys = ["water_temp", "wave_height", "wind_speed"]
 
-    # 단계별 확장 검색
-    search_limits = [3, None]  # None은 전체
+def _buoy_search_stages(user_lat, user_lon):
+    """
+    단계별 후보 부이 목록 (각 단계 안에서는 거리 순)
+    1) 가까운 부이 3개
+    2) BUOY_SEARCH_RADIUS_KM 반경 안의 나머지 부이
+    """
+    nearest = get_nearby_buoys(user_lat, user_lon, limit=3)
+    dev_print(f"[MOF] 가까운 부이 {len(nearest)}개 검색 중...")
+    yield nearest
+
+    radius_km = getattr(settings, "BUOY_SEARCH_RADIUS_KM", 200)
+    dev_print(f"[MOF] 반경 {radius_km}km 안의 부이 검색 중...")
+    searched_ids = {buoy.station_id for buoy in nearest}
+    yield [
+        buoy
+        for buoy, _ in get_index("buoy").within(user_lat, user_lon, radius_km)
+        if buoy.station_id not in searched_ids
+    ]
+
+
+REQUIRED_BUOY_KEYS = ["water_temp", "wave_height", "wind_speed"]
+
+
+def _is_complete(result):
+    return all(result[k] is not None for k in REQUIRED_BUOY_KEYS)
+
+
+# ==========================================
+# 실시간 조회 (KHOA API 직접 호출)
+# ==========================================
+def get_buoy_data_live(user_lat, user_lon, parallel=None):
+    """
+    적극적 데이터 수집 - 반드시 데이터를 찾아냄
+
+    parallel (None 이면 settings.BUOY_POLL_PARALLEL):
+    - True  : 거리 순서대로 최대 BUOY_POLL_MAX_WORKERS 개씩 동시에 요청하고
+              (요청마다 전용 스레드 풀),
+              수온/파고/풍속이 모두 채워지면 남은 요청은 취소
+    - False : 한 개씩 순서대로 요청
+    """
+    service_key = os.getenv("OceanServiceKey")
+
+    if not service_key:
+        print("[MOF] [ERROR] OceanServiceKey가 .env 파일에 없습니다!")
+        return None
+
+    if parallel is None:
+        parallel = getattr(settings, "BUOY_POLL_PARALLEL", True)
+    window = getattr(settings, "BUOY_POLL_MAX_WORKERS", 8)
 
-    for limit in search_limits:
-        if all(result[k] is not None for k in required_keys):
+    result = _new_buoy_result()
+
+    # 단계별 확장 검색
+    for candidate_buoys in _buoy_search_stages(user_lat, user_lon):
+        if _is_complete(result):
             dev_print(f"[MOF] 모든 데이터 수집 완료!")
             break
 
-        # 부이 목록 가져오기
-        if limit is None:
-            dev_print(f"[MOF] 전국 모든 부이 검색 중...")
-            candidate_buoys = list(Buoy.objects.all())
-        else:
-            dev_print(f"[MOF] 가까운 부이 {limit}개 검색 중...")
-            candidate_buoys = get_nearby_buoys(user_lat, user_lon, limit=limit)
-
         if not candidate_buoys:
             dev_print(f"[MOF] [ERROR] 부이 목록이 비어있습니다!")
             continue
 
-        # 각 부이에서 데이터 수집
-        for buoy in candidate_buoys:
-            # 이미 모든 데이터가 있으면 중단
-            if all(result[k] is not None for k in required_keys):
-                break
+        if parallel:
+            buoy_stream = _iter_buoy_data_parallel(candidate_buoys, service_key, window)
+        else:
+            buoy_stream = _iter_buoy_data_sequential(candidate_buoys, service_key)
 
-            raw_data = fetch_buoy_api(buoy, service_key)
+        # 각 부이에서 데이터 수집 (거리 순서대로 병합)
+        try:
+            for buoy, raw_data in buoy_stream:
+                if raw_data:
+                    _merge_buoy_summary(
+                        result, buoy, summarize_buoy_raw(raw_data), REQUIRED_BUOY_KEYS
+                    )
 
-            if not raw_data:
-                continue
-
-            data_found = False
-
-            # 필요한 데이터만 채우기
-            for key in required_keys:
-                if result[key] is None:
-                    value = extract_latest_value(raw_data, key)
-                    if value is not None:
-                        result[key] = value
-                        data_found = True
-                        dev_print(f"    ✓ {buoy.name}: {key}={value}")
-
-            # 대표 관측소 설정 (처음 데이터를 준 부이)
-            if result["station_name"] is None and data_found:
-                result["station_name"] = buoy.name
-                result["record_time"] = raw_data[-1].get("record_time")
-
-            # 풍향이 비어 있다면 이 부이에서 풍향도 세팅
-            if (
-                result["wind_direction_deg"] is None
-                or result["wind_direction_16"] is None
-            ):
-                dir_deg, dir_16 = _extract_latest_wind_dir(raw_data)
-                if dir_deg is not None:
-                    result["wind_direction_deg"] = dir_deg
-                    result["wind_direction_16"] = dir_16
+                # 모든 데이터가 채워지면 중단 (남은 요청 취소)
+                if _is_complete(result):
+                    break
+        finally:
+            buoy_stream.close()
 
         # 이번 단계에서 데이터를 찾았으면 다음 단계로 넘어가지 않음
         if result["station_name"] is not None:
@@ -286,8 +408,150 @@ def get_buoy_data(user_lat, user_lon):
 
     # 최종 체크
     if result["station_name"] is None:
-        dev_print(f"[MOF] [Warning] 전국 모든 부이를 검색했지만 데이터가 없습니다.")
+        dev_print(f"[MOF] [Warning] 반경 내 부이를 모두 검색했지만 데이터가 없습니다.")
         dev_print(f"[MOF] [Warning] API 키 또는 API 응답 형식을 확인하세요.")
         return None
 
+    result["buoy_fetched_at"] = timezone.now().isoformat()
     return result
+
+
+# ==========================================
+# 스냅샷 조회 (refresh_buoy_snapshots 배치가 채운 BuoySnapshot)
+# ==========================================
+def _snapshot_summary(snapshot):
+    return {
+        "water_temp": snapshot.water_temp,
+        "wave_height": snapshot.wave_height,
+        "wind_speed": snapshot.wind_speed,
+        "wind_direction_deg": snapshot.wind_direction_deg,
+        "record_time": snapshot.record_time or None,
+    }
+
+
+def get_buoy_data_from_snapshots(user_lat, user_lon):
+    """
+    로컬 BuoySnapshot 만으로 get_buoy_data 와 같은 결과를 만든다 (외부 API 호출 없음).
+    BUOY_SNAPSHOT_MAX_AGE 초보다 오래된 스냅샷은 사용하지 않는다.
+    """
+    from core.models import BuoySnapshot
+
+    now = timezone.now()
+    max_age = getattr(settings, "BUOY_SNAPSHOT_MAX_AGE", 10800)
+    oldest_used = None
+
+    result = _new_buoy_result()
+
+    for candidate_buoys in _buoy_search_stages(user_lat, user_lon):
+        if _is_complete(result):
+            break
+
+        snapshots = BuoySnapshot.objects.in_bulk(
+            [buoy.station_id for buoy in candidate_buoys]
+        )
+
+        for buoy in candidate_buoys:
+            snapshot = snapshots.get(buoy.station_id)
+            if snapshot is None:
+                continue
+            if (now - snapshot.fetched_at).total_seconds() > max_age:
+                continue
+
+            if _merge_buoy_summary(
+                result, buoy, _snapshot_summary(snapshot), REQUIRED_BUOY_KEYS
+            ):
+                if oldest_used is None or snapshot.fetched_at < oldest_used:
+                    oldest_used = snapshot.fetched_at
+
+            if _is_complete(result):
+                break
+
+        if result["station_name"] is not None:
+            break
+
+    if result["station_name"] is None:
+        return None
+
+    result["buoy_fetched_at"] = oldest_used.isoformat()
+    dev_print(
+        f"[MOF] 스냅샷 사용: {result['station_name']} "
+        f"(수집 후 {buoy_age_sec(result)}초 경과)"
+    )
+    return result
+
+
+def buoy_age_sec(data, now=None):
+    """
+    부이 관측값을 수집한 뒤 지난 시간(초). buoy_fetched_at 이 없으면 None
+    data: get_buoy_data 결과 또는 collect_all_marine_data 결과
+    """
+    fetched_at = (data or {}).get("buoy_fetched_at")
+    if not fetched_at:
+        return None
+    fetched_at = datetime.fromisoformat(fetched_at)
+    return max(0, int(((now or timezone.now()) - fetched_at).total_seconds()))
+
+
+def get_buoy_data(user_lat, user_lon, parallel=None):
+    """
+    사용자 위치 기준 부이 관측값 (수온/파고/풍속/풍향)
+
+    - BUOY_SNAPSHOT_ENABLED 이면 배치가 채운 로컬 스냅샷만 읽는다.
+      결과의 buoy_fetched_at(수집 시각)으로 데이터가 얼마나 오래됐는지 알 수 있다.
+    - 쓸 만한 스냅샷이 없을 때 BUOY_SNAPSHOT_LIVE_FALLBACK 이면 API 를 직접 호출
+    """
+    if getattr(settings, "BUOY_SNAPSHOT_ENABLED", True):
+        result = get_buoy_data_from_snapshots(user_lat, user_lon)
+        if result is not None:
+            return result
+
+        if not getattr(settings, "BUOY_SNAPSHOT_LIVE_FALLBACK", False):
+            dev_print(f"[MOF] [Warning] 사용 가능한 부이 스냅샷이 없습니다.")
+            return None
+        dev_print(f"[MOF] 스냅샷 없음 → 실시간 조회")
+
+    return get_buoy_data_live(user_lat, user_lon, parallel=parallel)
+
+
+# ==========================================
+# 스냅샷 갱신 (manage.py refresh_buoy_snapshots)
+# ==========================================
+def refresh_buoy_snapshots(max_workers=None):
+    """
+    전체 부이의 최신 관측값을 받아 BuoySnapshot 에 저장.
+    (갱신된 부이 수, 전체 부이 수) 반환. 응답이 없는 부이는 기존 스냅샷을 유지한다.
+    """
+    from core.models import Buoy, BuoySnapshot
+
+    service_key = os.getenv("OceanServiceKey")
+    if not service_key:
+        print("[MOF] [ERROR] OceanServiceKey가 .env 파일에 없습니다!")
+        return 0, 0
+
+    max_workers = max_workers or getattr(settings, "BUOY_POLL_MAX_WORKERS", 8)
+    buoys = list(Buoy.objects.all())
+    session = _get_buoy_session()
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="buoy-refresh"
+    ) as executor:
+        raw_list = list(
+            executor.map(lambda b: fetch_buoy_api(b, service_key, session), buoys)
+        )
+
+    fetched_at = timezone.now()
+    updated = 0
+
+    with transaction.atomic():
+        for buoy, raw_data in zip(buoys, raw_list):
+            if not raw_data:
+                continue
+
+            summary = summarize_buoy_raw(raw_data)
+            summary["record_time"] = summary["record_time"] or ""
+            BuoySnapshot.objects.update_or_create(
+                buoy=buoy, defaults={**summary, "fetched_at": fetched_at}
+            )
+            updated += 1
+
+    return updated, len(buoys)
@@ -0,0 +1,255 @@
+# core/utils/onnx_backend.py
+"""
+에기 추천 비전 모델의 ONNX Runtime(CPU) 백엔드
+
+- export_onnx_models 명령이 .h5(Keras) / .pt(YOLO) 를 ONNX 로 변환해 ai_models/ 에 저장
+- ONNX 파일과 onnxruntime 이 있으면 ai_inference 가 TensorFlow / Ultralytics 대신
+  이 모듈의 래퍼를 쓴다 (VISION_BACKEND 설정, 기본 auto)
+- 래퍼는 기존 코드가 쓰는 인터페이스만 흉내 낸다.
+  - OnnxKerasModel.predict(inputs, verbose=0)   ← keras Model.predict
+  - OnnxYolo(images, verbose=False)[i].boxes    ← ultralytics YOLO 호출 결과
+- resnet50_preprocess 는 keras resnet50.preprocess_input(caffe 모드)과 같은 계산
+- VISION_QUANTIZED 이면 에기/물색 모델은 quantize_vision_models 명령이 만든
+  int8 모델(*.int8.onnx)을 쓴다.
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+import cv2
+import numpy as np
+from django.conf import settings
+from PIL import Image
+
+try:
+    import onnxruntime as ort
+except ImportError:  # 선택 의존성 (pip install onnxruntime)
+    ort = None
+
+
+MODEL_DIR = os.path.join(settings.BASE_DIR, "core", "ai_models")
+EGI_REC_ONNX_PATH = os.path.join(MODEL_DIR, "best_egi_rec.onnx")
+WATER_CLS_ONNX_PATH = os.path.join(MODEL_DIR, "cnn_water_cls.onnx")
+YOLO_ONNX_PATH = os.path.join(MODEL_DIR, "yolo_water_detect.onnx")
+
+# ultralytics predict 기본값과 같게
+YOLO_CONF_THRESHOLD = 0.25
+YOLO_IOU_THRESHOLD = 0.7
+YOLO_DEFAULT_IMGSZ = 640
+
+# keras resnet50 (caffe 모드) BGR 평균
+_RESNET_BGR_MEAN = np.array([103.939, 116.779, 123.68], dtype=np.float32)
+
+
+# 개발 모드용 출력 함수
+def dev_print(*args, **kwargs):
+    if os.getenv("APP_ENV") == "development":
+        print(*args, **kwargs)
+
+
+def resnet50_preprocess(x):
+    """keras.applications.resnet50.preprocess_input 과 같은 변환 (RGB→BGR, 평균 빼기)"""
+    x = np.asarray(x, dtype=np.float32)[..., ::-1]
+    return x - _RESNET_BGR_MEAN
+
+
+def _session(path: str):
+    options = ort.SessionOptions()
+    threads = getattr(settings, "ONNX_NUM_THREADS", 0)
+    if threads:
+        options.intra_op_num_threads = threads
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return ort.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+
+
+# ==========================================
+# Keras 모델 래퍼
+# ==========================================
+class OnnxKerasModel:
+    """tf2onnx 로 변환한 Keras 모델 (입력 순서 = 원래 model.inputs 순서)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.session = _session(path)
+        self.input_names = [i.name for i in self.session.get_inputs()]
+
+    def predict(self, inputs, verbose=0):
+        if not isinstance(inputs, (list, tuple)):
+            inputs = [inputs]
+        feed = {
+            name: np.asarray(value, dtype=np.float32)
+            for name, value in zip(self.input_names, inputs)
+        }
+        return self.session.run(None, feed)[0]
+
+
+# ==========================================
+# YOLO 래퍼 (ultralytics 결과와 같은 모양)
+# ==========================================
+class OnnxBox:
+    __slots__ = ("xyxy", "conf", "cls")
+
+    def __init__(self, xyxy, conf, cls):
+        self.xyxy = [xyxy]
+        self.conf = [conf]
+        self.cls = [cls]
+
+
+class OnnxYoloResult:
+    def __init__(self, boxes: List[OnnxBox]):
+        self.boxes = boxes
+
+
+def _nms(boxes, scores, iou_threshold):
+    """xyxy 박스 NMS → 남길 index (점수 내림차순)"""
+    order = scores.argsort()[::-1]
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    keep = []
+    while order.size:
+        i = order[0]
+        keep.append(i)
+        xx1 = np.maximum(boxes[i, 0], boxes[order[1:], 0])
+        yy1 = np.maximum(boxes[i, 1], boxes[order[1:], 1])
+        xx2 = np.minimum(boxes[i, 2], boxes[order[1:], 2])
+        yy2 = np.minimum(boxes[i, 3], boxes[order[1:], 3])
+        inter = np.clip(xx2 - xx1, 0, None) * np.clip(yy2 - yy1, 0, None)
+        iou = inter / (areas[i] + areas[order[1:]] - inter + 1e-9)
+        order = order[1:][iou <= iou_threshold]
+    return keep
+
+
+class OnnxYolo:
+    """ultralytics 가 export 한 YOLOv8 계열 검출 모델 (출력: N × (4+클래스) × 앵커)"""
+
+    def __init__(self, path: str, conf=YOLO_CONF_THRESHOLD, iou=YOLO_IOU_THRESHOLD):
+        self.path = path
+        self.session = _session(path)
+        self.conf = conf
+        self.iou = iou
+
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        # 배치 차원이 고정(1)이면 한 장씩 실행
+        self.dynamic_batch = not isinstance(model_input.shape[0], int)
+        self.imgsz = self._input_size(model_input.shape)
+
+    def _input_size(self, shape):
+        meta = self.session.get_modelmeta().custom_metadata_map or {}
+        if "imgsz" in meta:
+            try:
+                h, w = json.loads(meta["imgsz"])
+                return int(h), int(w)
+            except (ValueError, TypeError):
+                pass
+        if isinstance(shape[2], int) and isinstance(shape[3], int):
+            return shape[2], shape[3]
+        return YOLO_DEFAULT_IMGSZ, YOLO_DEFAULT_IMGSZ
+
+    def _letterbox(self, image: Image.Image):
+        """비율을 유지해 imgsz 에 맞추고 회색(114)으로 채움 → (CHW 배열, 배율, 여백)"""
+        target_h, target_w = self.imgsz
+        w, h = image.size
+        ratio = min(target_w / w, target_h / h)
+        new_w, new_h = round(w * ratio), round(h * ratio)
+        # ultralytics LetterBox 와 같은 반올림
+        pad_x = int(round((target_w - new_w) / 2 - 0.1))
+        pad_y = int(round((target_h - new_h) / 2 - 0.1))
+
+        canvas = np.full((target_h, target_w, 3), 114, dtype=np.uint8)
+        resized = cv2.resize(
+            np.asarray(image), (new_w, new_h), interpolation=cv2.INTER_LINEAR
+        )
+        canvas[pad_y : pad_y + new_h, pad_x : pad_x + new_w] = resized
+        array = canvas.transpose(2, 0, 1).astype(np.float32) / 255.0
+        return array, ratio, (pad_x, pad_y)
+
+    def _postprocess(self, output, ratio, pad, size) -> OnnxYoloResult:
+        preds = output.T  # (앵커, 4+클래스)
+        class_scores = preds[:, 4:]
+        cls = class_scores.argmax(axis=1)
+        scores = class_scores[np.arange(len(cls)), cls]
+        mask = scores > self.conf
+        if not mask.any():
+            return OnnxYoloResult([])
+
+        cx, cy, bw, bh = preds[mask, :4].T
+        boxes = np.stack([cx - bw / 2, cy - bh / 2, cx + bw / 2, cy + bh / 2], axis=1)
+        scores, cls = scores[mask], cls[mask]
+
+        # 원본 이미지 좌표로
+        boxes[:, [0, 2]] = (boxes[:, [0, 2]] - pad[0]) / ratio
+        boxes[:, [1, 3]] = (boxes[:, [1, 3]] - pad[1]) / ratio
+        boxes[:, [0, 2]] = boxes[:, [0, 2]].clip(0, size[0])
+        boxes[:, [1, 3]] = boxes[:, [1, 3]].clip(0, size[1])
+
+        keep = _nms(boxes, scores, self.iou)
+        return OnnxYoloResult(
+            [OnnxBox(boxes[i], float(scores[i]), int(cls[i])) for i in keep]
+        )
+
+    def __call__(self, images, verbose=False):
+        if isinstance(images, Image.Image):
+            images = [images]
+
+        prepared = [self._letterbox(im) for im in images]
+        if self.dynamic_batch:
+            batch = np.stack([p[0] for p in prepared])
+            outputs = self.session.run(None, {self.input_name: batch})[0]
+        else:
+            outputs = [
+                self.session.run(None, {self.input_name: p[0][None]})[0][0]
+                for p in prepared
+            ]
+
+        return [
+            self._postprocess(output, ratio, pad, im.size)
+            for output, (_, ratio, pad), im in zip(outputs, prepared, images)
+        ]
+
+
+# ==========================================
+# 로딩
+# ==========================================
+def onnx_models_available() -> bool:
+    """onnxruntime 이 설치되어 있고 변환된 에기/YOLO 모델 파일이 있는지"""
+    return (
+        ort is not None
+        and os.path.exists(EGI_REC_ONNX_PATH)
+        and os.path.exists(YOLO_ONNX_PATH)
+    )
+
+
+def int8_path(path: str) -> str:
+    """ONNX 경로 → int8 양자화 모델 경로 (best_egi_rec.onnx → best_egi_rec.int8.onnx)"""
+    root, ext = os.path.splitext(path)
+    return f"{root}.int8{ext}"
+
+
+def _keras_model(path: str, quantized: bool) -> OnnxKerasModel:
+    if quantized:
+        if os.path.exists(int8_path(path)):
+            return OnnxKerasModel(int8_path(path))
+        print(f"⚠️ int8 모델이 없어 원본을 사용합니다: {int8_path(path)}")
+    return OnnxKerasModel(path)
+
+
+def load_onnx_models(quantized: Optional[bool] = None) -> Optional[Dict[str, Any]]:
+    """
+    ai_inference 전역 모델 자리에 넣을 ONNX 래퍼들. 사용할 수 없으면 None
+    quantized(기본: VISION_QUANTIZED 설정)이면 에기/물색 모델은 int8 파일을 쓴다.
+    """
+    if not onnx_models_available():
+        return None
+    if quantized is None:
+        quantized = getattr(settings, "VISION_QUANTIZED", False)
+
+    models = {
+        "egi_rec_model": _keras_model(EGI_REC_ONNX_PATH, quantized),
+        "water_cls_model": None,
+        "yolo_model": OnnxYolo(YOLO_ONNX_PATH),
+        "preprocess_input": resnet50_preprocess,
+    }
+    if os.path.exists(WATER_CLS_ONNX_PATH):
+        models["water_cls_model"] = _keras_model(WATER_CLS_ONNX_PATH, quantized)
+    return models
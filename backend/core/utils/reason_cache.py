@@ -0,0 +1,234 @@
+# core/utils/reason_cache.py
+"""
+에기 추천 근거(LLM 생성 문장) DB 캐시
+
+- 근거는 (물색, 에기 색상, 환경 구간) 조합마다 한 번 생성해 RecommendationReason 에 저장
+  물색 3 × 에기 색상 9 정도라 pregenerate_reasons 명령으로 미리 전부 만들어 둔다.
+- 요청 처리 중에는 저장된 근거를 바로 돌려준다. (LLM 생성 시간 0)
+  - REASON_CACHE_TTL 보다 오래된 근거는 그대로 돌려주고 백그라운드에서 재생성
+  - LLM 없이 기본 멘트로 저장된 근거(source=rule)도 오래된 것으로 보고 계속 재생성
+  - 없는 조합은 기본 멘트를 돌려주고 백그라운드에서 생성
+    (REASON_CACHE_BLOCKING_MISS 면 그 자리에서 생성)
+- 백그라운드 생성 스레드는 LLM_BATCH_MAX_SIZE 개 (LLM_BATCHING 이 꺼져 있으면 1개)
+  동시에 생성 요청을 넣어야 LLM 묶음 처리가 한 배치를 채운다.
+  같은 조합은 한 번만 대기열에 올린다.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from . import metrics
+from .sllm_service import (
+    PROMPT_EGI_TRANSLATION,
+    PROMPT_HEADER,
+    PROMPT_WATER_TRANSLATION,
+    RULE_BASED_PROMPT,
+    fallback_reason,
+    generate_reasons_batch,
+    generate_recommendation_reason,
+    stream_recommendation_reason,
+)
+
+SOURCE_LLM = "llm"
+SOURCE_RULE = "rule"
+# 응답의 sllm_prompt 자리에 넣는 값
+CACHED_PROMPT = "Cached Reason"
+
+
+# 개발 모드용 출력 함수
+def dev_print(*args, **kwargs):
+    if os.getenv("APP_ENV") == "development":
+        print(*args, **kwargs)
+
+
+def env_bucket(env_data: Optional[Dict[str, Any]]) -> str:
+    """
+    근거 생성에 쓰이는 환경 조건 구간
+    지금 프롬프트는 물색/에기색과 RAG 문맥만 쓰고 해양 조건은 넣지 않으므로 한 구간뿐이다.
+    (프롬프트에 조건을 넣게 되면 여기서 구간을 나누고 pregenerate 대상도 늘린다)
+    """
+    return "all"
+
+
+def all_combinations():
+    """미리 생성할 (물색, 에기 색상, 환경 구간) 목록"""
+    return [
+        (water, egi, "all")
+        for water in PROMPT_WATER_TRANSLATION
+        for egi in PROMPT_EGI_TRANSLATION
+    ]
+
+
+# ==========================================
+# 생성 / 저장
+# ==========================================
+def generate_and_store(water_color, egi_color, bucket="all", env_data=None):
+    """LLM 으로 생성해 저장 → RecommendationReason"""
+    reason, prompt = generate_recommendation_reason(
+        water_color, egi_color, env_data or {}
+    )
+    source = SOURCE_LLM if prompt.startswith(PROMPT_HEADER) else SOURCE_RULE
+    return store_reason(water_color, egi_color, bucket, reason, source)
+
+
+def generate_and_store_batch(keys):
+    """
+    [(물색, 에기 색상, 환경 구간), ...] 을 generate 한 번으로 생성해 저장
+    → [RecommendationReason, ...] (pregenerate_reasons 용)
+    """
+    results = generate_reasons_batch([(water, egi) for water, egi, _ in keys])
+    return [
+        store_reason(
+            water,
+            egi,
+            bucket,
+            reason,
+            SOURCE_LLM if prompt.startswith(PROMPT_HEADER) else SOURCE_RULE,
+        )
+        for (water, egi, bucket), (reason, prompt) in zip(keys, results)
+    ]
+
+
+def store_reason(water_color, egi_color, bucket, reason, source):
+    from core.models import RecommendationReason
+
+    row, _ = RecommendationReason.objects.update_or_create(
+        water_color=water_color,
+        egi_color=egi_color,
+        env_bucket=bucket,
+        defaults={
+            "reason": reason,
+            "source": source,
+            "generated_at": timezone.now(),
+        },
+    )
+    metrics.incr(f"reason_cache.generated_{source}")
+    return row
+
+
+_executor = None
+_pending = set()
+_init_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+
+    if _executor is None:
+        with _init_lock:
+            if _executor is None:
+                # 한 번에 하나씩 넣으면 LLM 배치가 항상 1개짜리가 되므로
+                # 배치 크기만큼 동시에 생성 요청을 넣는다.
+                workers = 1
+                if getattr(settings, "LLM_BATCHING", True):
+                    workers = max(1, getattr(settings, "LLM_BATCH_MAX_SIZE", 4))
+                _executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="reason-refresh"
+                )
+    return _executor
+
+
+def _refresh(key: Tuple[str, str, str], env_data):
+    try:
+        generate_and_store(*key, env_data=env_data)
+        dev_print(f"[근거캐시] 재생성 완료 {key}")
+    except Exception as e:
+        print(f"[근거캐시] 재생성 실패 {key}: {e}")
+    finally:
+        with _init_lock:
+            _pending.discard(key)
+        close_old_connections()
+
+
+def schedule_refresh(water_color, egi_color, bucket="all", env_data=None) -> bool:
+    """백그라운드 재생성 예약 (이미 대기 중이면 False)"""
+    key = (water_color, egi_color, bucket)
+    with _init_lock:
+        if key in _pending:
+            return False
+        _pending.add(key)
+    _get_executor().submit(_refresh, key, env_data)
+    return True
+
+
+# ==========================================
+# 조회
+# ==========================================
+def is_stale(row) -> bool:
+    """다시 생성해야 하는 근거 (TTL 지남 또는 LLM 이 아닌 기본 멘트)"""
+    if row.source != SOURCE_LLM:
+        return True
+    ttl = getattr(settings, "REASON_CACHE_TTL", 7 * 24 * 3600)
+    return ttl > 0 and row.generated_at < timezone.now() - timedelta(seconds=ttl)
+
+
+def _prompt_for(row) -> str:
+    # 기본 멘트는 결과 캐시에 넣지 않도록 RULE_BASED_PROMPT 로 표시
+    return CACHED_PROMPT if row.source == SOURCE_LLM else RULE_BASED_PROMPT
+
+
+def _lookup(water_color, egi_color, env_data):
+    """저장된 근거 행 (오래됐으면 백그라운드 재생성 예약). 없으면 None"""
+    from core.models import RecommendationReason
+
+    bucket = env_bucket(env_data)
+    row = RecommendationReason.objects.filter(
+        water_color=water_color, egi_color=egi_color, env_bucket=bucket
+    ).first()
+    if row is None:
+        metrics.incr("reason_cache.miss")
+        return None
+
+    metrics.incr("reason_cache.hit")
+    if is_stale(row):
+        metrics.incr("reason_cache.stale")
+        schedule_refresh(water_color, egi_color, bucket, env_data)
+    return row
+
+
+def get_reason(water_color, egi_color, env_data) -> Tuple[str, str]:
+    """
+    (추천 근거, sllm_prompt) - generate_recommendation_reason 과 같은 모양
+    저장된 근거가 있으면 LLM 을 부르지 않는다.
+    """
+    if not getattr(settings, "REASON_CACHE_ENABLED", True):
+        return generate_recommendation_reason(water_color, egi_color, env_data)
+
+    row = _lookup(water_color, egi_color, env_data)
+    if row is None:
+        bucket = env_bucket(env_data)
+        if getattr(settings, "REASON_CACHE_BLOCKING_MISS", False):
+            row = generate_and_store(water_color, egi_color, bucket, env_data)
+            return row.reason, _prompt_for(row)
+        schedule_refresh(water_color, egi_color, bucket, env_data)
+        return fallback_reason(water_color, egi_color), RULE_BASED_PROMPT
+
+    return row.reason, _prompt_for(row)
+
+
+def stream_reason(water_color, egi_color, env_data):
+    """
+    추천 근거를 조각(str)씩 내보내는 generator (스트리밍 API 용)
+    저장된 근거가 있으면 한 조각으로, 없으면 LLM 생성 토큰을 그대로 흘려보내고 저장한다.
+    끝나면 (전체 근거, source) 를 return
+    """
+    enabled = getattr(settings, "REASON_CACHE_ENABLED", True)
+    if enabled:
+        row = _lookup(water_color, egi_color, env_data)
+        if row is not None:
+            yield row.reason
+            return row.reason, row.source
+
+    reason, source = yield from stream_recommendation_reason(
+        water_color, egi_color, env_data
+    )
+    if enabled:
+        store_reason(water_color, egi_color, env_bucket(env_data), reason, source)
+    return reason, source
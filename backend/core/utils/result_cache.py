@@ -0,0 +1,145 @@
+# core/utils/result_cache.py
+"""
+에기 추천 결과 캐시 (프로세스 메모리, LRU + TTL)
+
+- 같은 사진으로 다시 요청하거나 여러 사용자가 같은 사진을 올리면
+  YOLO / Keras / LLM 을 다시 돌리지 않고 이전 결과를 쓴다.
+- 키 = 이미지 바이트 sha256 + 거칠게 묶은 해양 조건 (모델 입력에 쓰이는 값들)
+  → 같은 사진이라도 물때·날씨·수온 등이 달라지면 새로 추론
+- 값 = (추천 색상, 물색, 추천 근거) 만 저장 (디버그용 base64 이미지는 넣지 않음)
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Hashable, Optional
+
+from django.conf import settings
+
+
+class TTLLRUCache:
+    """최대 maxsize 개, 각 항목 ttl 초 유지. 넘치면 가장 오래 안 쓴 항목부터 제거"""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 1800):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default=None):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+
+# ==========================================
+# 에기 추천 결과
+# ==========================================
+_egi_cache: Optional[TTLLRUCache] = None
+_egi_cache_lock = threading.Lock()
+
+
+def _get_egi_cache() -> TTLLRUCache:
+    global _egi_cache
+    if _egi_cache is None:
+        with _egi_cache_lock:
+            if _egi_cache is None:
+                _egi_cache = TTLLRUCache(
+                    maxsize=getattr(settings, "EGI_RESULT_CACHE_SIZE", 256),
+                    ttl=getattr(settings, "EGI_RESULT_CACHE_TTL", 1800),
+                )
+    return _egi_cache
+
+
+def image_digest(image_file) -> str:
+    """업로드 파일 내용의 sha256 (읽은 뒤 처음 위치로 되돌림)"""
+    digest = hashlib.sha256()
+    if isinstance(image_file, (bytes, bytearray)):
+        digest.update(image_file)
+        return digest.hexdigest()
+
+    image_file.seek(0)
+    for chunk in iter(lambda: image_file.read(1024 * 1024), b""):
+        digest.update(chunk)
+    image_file.seek(0)
+    return digest.hexdigest()
+
+
+def _bucket(value, step):
+    try:
+        return round(float(value) / step) * step
+    except (TypeError, ValueError):
+        return None
+
+
+def marine_key(marine_data: Dict[str, Any]) -> tuple:
+    """
+    추천 결과에 영향을 주는 해양 조건을 거칠게 묶은 값
+    (ai_inference.preprocess_env_data 와 LLM 프롬프트에 쓰이는 항목)
+    """
+    return (
+        marine_data.get("target_fish"),
+        _bucket(marine_data.get("water_temp"), 1),
+        _bucket(marine_data.get("wind_speed"), 1),
+        _bucket(marine_data.get("wind_direction_deg"), 45),
+        _bucket(marine_data.get("wave_height"), 0.5),
+        marine_data.get("rain_type_text"),
+        str(marine_data.get("moon_phase")),
+        # preprocess_env_data 가 현재 시각(시)을 입력으로 씀
+        (datetime.utcnow() + timedelta(hours=9)).hour,
+    )
+
+
+def get_egi_result(digest: str, marine_data) -> Optional[Dict[str, Any]]:
+    """{"recommended_color", "water_color", "reason"} 또는 None"""
+    if not getattr(settings, "EGI_RESULT_CACHE_ENABLED", True):
+        return None
+    return _get_egi_cache().get((digest, marine_key(marine_data)))
+
+
+def set_egi_result(digest: str, marine_data, recommended_color, water_color, reason):
+    if not getattr(settings, "EGI_RESULT_CACHE_ENABLED", True):
+        return
+    _get_egi_cache().set(
+        (digest, marine_key(marine_data)),
+        {
+            "recommended_color": recommended_color,
+            "water_color": water_color,
+            "reason": reason,
+        },
+    )
+
+
+def egi_cache_stats() -> Dict[str, int]:
+    return _get_egi_cache().stats()
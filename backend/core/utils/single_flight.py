@@ -0,0 +1,52 @@
+# core/utils/single_flight.py
+"""
+같은 key 에 대한 동시 호출 합치기 (single-flight)
+
+- 한 key 에 대해 이미 진행 중인 호출이 있으면 새로 호출하지 않고
+  그 결과(또는 예외)를 같이 받는다.
+- 캐시 미스가 동시에 몰릴 때 upstream API 를 한 번만 부르기 위한 용도
+- 프로세스 안(스레드 사이)에서만 합쳐진다.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """key 로 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 fn() 실행"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+        return call.result
@@ -1,14 +1,26 @@
 # backend/core/utils/sllm_service.py
 
+import gc
 import os
 import json
+import threading
 import torch
 import re
 from core.utils.search_engine import SearchEngine
-from transformers import AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig
+from transformers import (
+    AutoModelForCausalLM,
+    AutoTokenizer,
+    BitsAndBytesConfig,
+    StoppingCriteria,
+    StoppingCriteriaList,
+    TextIteratorStreamer,
+)
 from peft import PeftModel
 from django.conf import settings
 
+from core.utils import lazy_resource
+from core.utils.micro_batcher import MicroBatcher
+
 # os.environ["CUDA_VISIBLE_DEVICES"] = "-1"
 
 
@@ -34,6 +46,14 @@ search_engine = None
 WATER_MAP = {}
 EGI_MAP = {}
 
+# 기본 멘트를 돌려줄 때 프롬프트 자리에 넣는 값
+RULE_BASED_PROMPT = "Rule-based Fallback (No LLM)"
+# LLM 프롬프트 첫 줄 (생성 결과가 LLM 에서 나왔는지 구분할 때 사용)
+PROMPT_HEADER = "당신은 낚시전문가입니다. 다음은 물색과 에기색에 대한 스크립트입니다.\n"
+
+# 생성 결과에서 이 문구가 나오면 그 앞까지만 근거로 사용
+STOP_MARKERS = ["당신은 낚시전문가입니다", "###", "참고로 현재"]
+
 PROMPT_WATER_TRANSLATION = {"muddy": "탁함", "clear": "맑음", "medium": "보통"}
 PROMPT_EGI_TRANSLATION = {
     "blue": "파랑",
@@ -77,15 +97,8 @@ def load_rag_data():
         print(f"❌ [RAG] Load Error: {e}")
 
 
-def load_llm_model():
-    """
-    환경에 따라 유연하게 모델을 로딩하는 함수
-    1. GPU(Local/High-Spec Server): 4bit 양자화로 고속 로딩
-    2. CPU(t3.medium): RAM/Swap을 사용하여 로딩 시도 -> 실패 시 기본 멘트 사용
-    """
-    global llm_model, llm_tokenizer, search_engine
-
-    dev_print("⏳ [Lazy Load] AI 모델 로딩 프로세스 시작...")
+def _load_search_engine():
+    global search_engine
 
     load_rag_data()
 
@@ -96,6 +109,24 @@ def load_llm_model():
     except Exception as e:
         dev_print(f"⚠️ [Search] Connection Failed: {e}")
         search_engine = None
+    return search_engine
+
+
+def _unload_search_engine(_engine):
+    global search_engine
+    search_engine = None
+
+
+def _load_llm():
+    """
+    환경에 따라 유연하게 모델을 로딩하는 함수 (lazy_resource 로더)
+    1. GPU(Local/High-Spec Server): 4bit 양자화로 고속 로딩
+    2. CPU(t3.medium): RAM/Swap을 사용하여 로딩 시도 -> 실패 시 기본 멘트 사용
+    → (llm_model, llm_tokenizer). 실패하면 예외 (다음 요청에서 다시 시도)
+    """
+    global llm_model, llm_tokenizer
+
+    dev_print("⏳ [Lazy Load] AI 모델 로딩 프로세스 시작...")
 
     # ---------------------------------------------------------
     # CASE A: GPU가 있는 경우 (개발 환경)
@@ -123,12 +154,12 @@ def load_llm_model():
             llm_model.eval()
 
             dev_print("✅ [LLM] GPU Mode Loaded Successfully!")
-            return
+            return llm_model, llm_tokenizer
 
         except Exception as e:
             print(f"❌ [GPU Load Error] {e}")
             llm_model = None
-            return
+            raise
 
     # ---------------------------------------------------------
     # CASE B: GPU가 없는 경우 (AWS t3.medium)
@@ -152,6 +183,7 @@ def load_llm_model():
             llm_model.eval()
 
             dev_print("✅ [LLM] CPU Mode Loaded! (속도는 느릴 수 있습니다)")
+            return llm_model, llm_tokenizer
 
         except (RuntimeError, MemoryError) as e:
             dev_print("\n" + "=" * 50)
@@ -160,10 +192,12 @@ def load_llm_model():
             dev_print("✅ '기본 멘트(Rule-based)' 모드로 자동 전환합니다.")
             dev_print("=" * 50 + "\n")
             llm_model = None
+            raise
 
         except Exception as e:
             print(f"❌ [Unknown Error] CPU 로딩 중 오류 발생: {e}")
             llm_model = None
+            raise
 
         # print("\n" + "=" * 40)
         # print("⚠️  [System] Server Mode (No GPU).")
@@ -176,10 +210,42 @@ def load_llm_model():
         # return
 
 
+def _unload_llm(_loaded):
+    global llm_model, llm_tokenizer
+
+    llm_model = None
+    llm_tokenizer = None
+    gc.collect()
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+# 동시 첫 요청에도 1.3B 모델은 한 번만 로드 (LLM_IDLE_UNLOAD_SECONDS 동안 안 쓰면 언로드)
+_llm = lazy_resource.register(
+    "llm",
+    _load_llm,
+    _unload_llm,
+    idle_seconds=getattr(settings, "LLM_IDLE_UNLOAD_SECONDS", 0),
+)
+_search = lazy_resource.register(
+    "search_engine", _load_search_engine, _unload_search_engine
+)
+
+
+def load_llm_model():
+    """검색 엔진 + LLM 로드 (LLM 로드에 실패하면 기본 멘트 모드)"""
+    _search.get()
+    try:
+        _llm.get()
+    except Exception:
+        pass
+
+
 # ==========================================
 # 3. 검색 및 생성
 # ==========================================
 def get_relevant_context(water, egi):
+    search_engine = _search.get()
     if not search_engine:
         return ""
     w_q = WATER_MAP.get(water, water)
@@ -191,79 +257,270 @@ def get_relevant_context(water, egi):
         return ""
 
 
-def generate_recommendation_reason(water_color, egi_color, env_data):
-    global llm_model, llm_tokenizer
+def fallback_reason(water_color, egi_color):
+    """LLM 없이 쓰는 기본 멘트"""
+    p_water = PROMPT_WATER_TRANSLATION.get(water_color, water_color)
+    p_egi = PROMPT_EGI_TRANSLATION.get(egi_color, egi_color)
+    return f"현재 관측된 {p_water} 물색 환경에서는 시인성이 좋은 {p_egi} 색상의 에기가 대상어에게 가장 강력하게 어필할 수 있어 추천합니다."
 
-    # 1. 번역 (영어 -> 한글 변환)
+
+def build_prompt(water_color, egi_color):
+    context_text = get_relevant_context(water_color, egi_color)
     p_water = PROMPT_WATER_TRANSLATION.get(water_color, water_color)
     p_egi = PROMPT_EGI_TRANSLATION.get(egi_color, egi_color)
 
-    if llm_model is None:
-        load_llm_model()
+    return (
+        PROMPT_HEADER
+        + "스크립트의 내용을 바탕으로 해당 물색에 에기색을 추천하는 근거를 작성하세요.\n"
+        f"### 물색:{p_water}, 에기색:{p_egi}\n"
+        f"### 스크립트:\n{context_text}\n\n"
+        "### 추천 근거:\n"
+    )
 
-    if not llm_model:
-        fallback_reason = f"현재 관측된 {p_water} 물색 환경에서는 시인성이 좋은 {p_egi} 색상의 에기가 대상어에게 가장 강력하게 어필할 수 있어 추천합니다."
-        return fallback_reason, "Rule-based Fallback (No LLM)"
 
-    try:
-        # 1. 문맥 준비
-        context_text = get_relevant_context(water_color, egi_color)
+# 생성 옵션 (반복 방지 설정 강화)
+def _generate_kwargs(tokenizer):
+    return dict(
+        max_new_tokens=150,
+        temperature=0.1,
+        repetition_penalty=1.3,
+        do_sample=True,
+        eos_token_id=tokenizer.eos_token_id,
+        pad_token_id=tokenizer.eos_token_id,
+    )
+
+
+def _clean_reason(reason, water_color, egi_color):
+    """생성 결과 뒷부분 찌꺼기 제거 (멈춤 문구 뒤 / 끝 문장부호), 너무 짧으면 기본 문장"""
+    for marker in STOP_MARKERS:
+        if marker in reason:
+            reason = reason.split(marker)[0].strip()
+
+    reason = reason.rstrip(",. ") + "."
+
+    if len(reason) < 5:
         p_water = PROMPT_WATER_TRANSLATION.get(water_color, water_color)
         p_egi = PROMPT_EGI_TRANSLATION.get(egi_color, egi_color)
+        reason = f"{p_water} 물색에는 {p_egi} 색상이 가장 유리하여 추천합니다."
+    return reason
 
-        prompt = (
-            "당신은 낚시전문가입니다. 다음은 물색과 에기색에 대한 스크립트입니다.\n"
-            "스크립트의 내용을 바탕으로 해당 물색에 에기색을 추천하는 근거를 작성하세요.\n"
-            f"### 물색:{p_water}, 에기색:{p_egi}\n"
-            f"### 스크립트:\n{context_text}\n\n"
-            "### 추천 근거:\n"
-        )
 
-        # 2. 토큰화
-        inputs = llm_tokenizer(prompt, return_tensors="pt").to(llm_model.device)
+def generate_recommendation_reason(water_color, egi_color, env_data):
+    """
+    (추천 근거, 프롬프트)
+    LLM_BATCHING 이면 동시에 들어온 요청과 묶어서 generate 한 번으로 생성
+    """
+    if getattr(settings, "LLM_BATCHING", True):
+        return _get_llm_batcher().submit((water_color, egi_color))
 
-        if "token_type_ids" in inputs:
-            del inputs["token_type_ids"]
+    # 1. 번역 (영어 -> 한글 변환)
+    p_water = PROMPT_WATER_TRANSLATION.get(water_color, water_color)
+    p_egi = PROMPT_EGI_TRANSLATION.get(egi_color, egi_color)
+
+    # 생성하는 동안은 유휴 언로드되지 않도록 빌려 둔다.
+    with _llm.acquire(required=False) as loaded:
+        if not loaded:
+            return fallback_reason(water_color, egi_color), RULE_BASED_PROMPT
+
+        model, tokenizer = loaded
+
+        try:
+            # 1. 문맥 준비
+            prompt = build_prompt(water_color, egi_color)
+
+            # 2. 토큰화
+            inputs = tokenizer(prompt, return_tensors="pt").to(model.device)
+
+            if "token_type_ids" in inputs:
+                del inputs["token_type_ids"]
+
+            # 3. 생성 (반복 방지 설정 강화)
+            with torch.no_grad():
+                outputs = model.generate(**inputs, **_generate_kwargs(tokenizer))
+
+            # 1. 전체 텍스트 디코딩
+            full_output = tokenizer.decode(outputs[0], skip_special_tokens=True)
+
+            # 2. "### 추천 근거:" 기준으로 자르기
+            if "### 추천 근거:" in full_output:
+                reason = full_output.split("### 추천 근거:")[-1].strip()
+            else:
+                # 실패 시 프롬프트 길이만큼 자르기
+                input_len = inputs.input_ids.shape[1]
+                generated_tokens = outputs[0][input_len:]
+                reason = tokenizer.decode(
+                    generated_tokens, skip_special_tokens=True
+                ).strip()
+
+            # 3. 뒷부분 찌꺼기 제거
+            return _clean_reason(reason, water_color, egi_color), prompt
+
+        except Exception as e:
+            print(f"Gen Error: {e}")
+            return f"{p_water} 물색에는 {p_egi} 색상이 유리합니다.", str(e)
+
+
+# ==========================================
+# 4. 묶음 생성 (동시 요청)
+# ==========================================
+def generate_reasons_batch(items):
+    """
+    [(물색, 에기 색상), ...] → [(추천 근거, 프롬프트), ...]
+    프롬프트를 왼쪽 패딩으로 맞춰 generate 를 한 번만 호출한다.
+    (같은 조합이 여러 개면 한 번만 생성해 나눠 줌)
+    """
+    with _llm.acquire(required=False) as loaded:
+        if not loaded:
+            return [(fallback_reason(w, e), RULE_BASED_PROMPT) for w, e in items]
+
+        model, tokenizer = loaded
+        unique = list(dict.fromkeys(items))
+        prompts = [build_prompt(w, e) for w, e in unique]
+
+        try:
+            # 디코더 모델은 뒤에 이어서 생성하므로 패딩은 왼쪽에
+            tokenizer.padding_side = "left"
+            if tokenizer.pad_token is None:
+                tokenizer.pad_token = tokenizer.eos_token
 
-        # 3. 생성 (반복 방지 설정 강화)
-        with torch.no_grad():
-            outputs = llm_model.generate(
-                **inputs,
-                max_new_tokens=150,
-                temperature=0.1,
-                repetition_penalty=1.3,
-                do_sample=True,
-                eos_token_id=llm_tokenizer.eos_token_id,
-                pad_token_id=llm_tokenizer.eos_token_id,
+            inputs = tokenizer(prompts, return_tensors="pt", padding=True).to(
+                model.device
             )
+            if "token_type_ids" in inputs:
+                del inputs["token_type_ids"]
+
+            with torch.no_grad():
+                outputs = model.generate(**inputs, **_generate_kwargs(tokenizer))
+
+            input_len = inputs["input_ids"].shape[1]
+            generated = {}
+            for (w, e), prompt, output in zip(unique, prompts, outputs):
+                text = tokenizer.decode(output[input_len:], skip_special_tokens=True)
+                generated[(w, e)] = (_clean_reason(text.strip(), w, e), prompt)
+        except Exception as ex:
+            print(f"Gen Error: {ex}")
+            generated = {
+                (w, e): (
+                    f"{PROMPT_WATER_TRANSLATION.get(w, w)} 물색에는 "
+                    f"{PROMPT_EGI_TRANSLATION.get(e, e)} 색상이 유리합니다.",
+                    str(ex),
+                )
+                for w, e in unique
+            }
+
+    return [generated[item] for item in items]
+
+
+_llm_batcher = None
+_llm_batcher_lock = threading.Lock()
+
+
+def _get_llm_batcher():
+    global _llm_batcher
+
+    if _llm_batcher is None:
+        with _llm_batcher_lock:
+            if _llm_batcher is None:
+                _llm_batcher = MicroBatcher(
+                    generate_reasons_batch,
+                    max_batch_size=getattr(settings, "LLM_BATCH_MAX_SIZE", 4),
+                    max_wait_ms=getattr(settings, "LLM_BATCH_WAIT_MS", 50),
+                    name="llm-generate",
+                    metric_name="llm_generate",
+                )
+    return _llm_batcher
 
-        # 1. 전체 텍스트 디코딩
-        full_output = llm_tokenizer.decode(outputs[0], skip_special_tokens=True)
 
-        # 2. "### 추천 근거:" 기준으로 자르기
-        if "### 추천 근거:" in full_output:
-            reason = full_output.split("### 추천 근거:")[-1].strip()
-        else:
-            # 실패 시 프롬프트 길이만큼 자르기
-            input_len = inputs.input_ids.shape[1]
-            generated_tokens = outputs[0][input_len:]
-            reason = llm_tokenizer.decode(
-                generated_tokens, skip_special_tokens=True
-            ).strip()
+# ==========================================
+# 5. 스트리밍 생성
+# ==========================================
+class _StopWhenSet(StoppingCriteria):
+    """멈춤 표시(event)가 켜지면 생성 중단 (멈춤 문구 발견 / 클라이언트 연결 끊김)"""
 
-        # 3. 뒷부분 찌꺼기 제거
-        stop_markers = ["당신은 낚시전문가입니다", "###", "참고로 현재"]
-        for marker in stop_markers:
-            if marker in reason:
-                reason = reason.split(marker)[0].strip()
+    def __init__(self, event):
+        self.event = event
 
-        reason = reason.rstrip(",. ") + "."
+    def __call__(self, input_ids, scores, **kwargs):
+        return self.event.is_set()
 
-        if len(reason) < 5 in reason:
-            reason = f"{p_water} 물색에는 {p_egi} 색상이 가장 유리하여 추천합니다."
 
-        return reason, prompt
+def _find_stop(text):
+    positions = [text.find(m) for m in STOP_MARKERS if m in text]
+    return min(positions) if positions else None
 
-    except Exception as e:
-        print(f"Gen Error: {e}")
-        return f"{p_water} 물색에는 {p_egi} 색상이 유리합니다.", str(e)
+
+def stream_recommendation_reason(water_color, egi_color, env_data):
+    """
+    추천 근거를 생성되는 대로 조각(str)씩 내보내는 generator
+    - TextIteratorStreamer 로 토큰을 받아 내보내고, 멈춤 문구(STOP_MARKERS)가 나오면
+      그 앞까지만 보내고 생성을 멈춘다. 문구가 조각 경계에 걸칠 수 있어
+      마지막 몇 글자는 다음 조각이 올 때까지 붙잡아 둔다.
+    - LLM 이 없으면 기본 멘트 한 조각
+    - 끝나면 (전체 근거, "llm" | "rule") 를 return (yield from 으로 받음)
+    """
+    p_water = PROMPT_WATER_TRANSLATION.get(water_color, water_color)
+    p_egi = PROMPT_EGI_TRANSLATION.get(egi_color, egi_color)
+
+    with _llm.acquire(required=False) as loaded:
+        if not loaded:
+            reason = fallback_reason(water_color, egi_color)
+            yield reason
+            return reason, "rule"
+
+        model, tokenizer = loaded
+        inputs = tokenizer(build_prompt(water_color, egi_color), return_tensors="pt").to(
+            model.device
+        )
+        if "token_type_ids" in inputs:
+            del inputs["token_type_ids"]
+
+        streamer = TextIteratorStreamer(
+            tokenizer, skip_prompt=True, skip_special_tokens=True
+        )
+        stop = threading.Event()
+
+        def _generate():
+            try:
+                with torch.no_grad():
+                    model.generate(
+                        **inputs,
+                        **_generate_kwargs(tokenizer),
+                        streamer=streamer,
+                        stopping_criteria=StoppingCriteriaList([_StopWhenSet(stop)]),
+                    )
+            except Exception as e:
+                print(f"Gen Error: {e}")
+                streamer.end()
+
+        worker = threading.Thread(target=_generate, name="llm-stream", daemon=True)
+        worker.start()
+
+        holdback = max(len(m) for m in STOP_MARKERS) - 1
+        pending, sent = "", []
+        try:
+            for piece in streamer:
+                pending += piece
+                if not sent:
+                    pending = pending.lstrip()
+                cut = _find_stop(pending)
+                if cut is not None:
+                    pending = pending[:cut]
+                    break
+                if len(pending) > holdback:
+                    chunk, pending = pending[:-holdback], pending[-holdback:]
+                    sent.append(chunk)
+                    yield chunk
+        finally:
+            # 멈춤 문구 / 연결 끊김이면 남은 토큰은 만들지 않는다.
+            stop.set()
+            worker.join()
+
+    # 뒷부분 찌꺼기 제거 (generate_recommendation_reason 과 같게)
+    tail = pending.rstrip(",. ")
+    if not "".join(sent).strip() and len(tail.strip()) < 5:
+        reason = f"{p_water} 물색에는 {p_egi} 색상이 가장 유리하여 추천합니다."
+        yield reason
+        return reason, "rule"
+
+    yield tail + "."
+    return "".join(sent) + tail + ".", "llm"
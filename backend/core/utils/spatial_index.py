@@ -0,0 +1,225 @@
+# core/utils/spatial_index.py
+"""
+정적 지점 테이블(부이/조위관측소/해안지점/낚시포인트/항구)용 공간 인덱스
+
+- 프로세스당 한 번 테이블을 읽어 KD-tree 를 만들고 재사용
+- 위경도를 단위 구 위의 3차원 좌표로 바꿔 KD-tree 에 넣기 때문에
+  현(chord) 거리 순서 = 대원(haversine) 거리 순서 → 정확한 최근접 검색
+- 테이블이 바뀌면(post_save/post_delete 시그널, invalidate 호출)
+  캐시의 버전 값을 올려 다른 워커 프로세스도 다음 조회 때 다시 만든다.
+"""
+
+import os
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy.spatial import cKDTree
+from django.core.cache import cache
+
+from .geo_math import chord_to_km, km_to_chord, to_unit_xyz
+
+VERSION_CACHE_KEY = "spatial_index:version:{name}"
+# 다른 프로세스의 변경 여부(버전)를 확인하는 최소 간격(초)
+VERSION_CHECK_INTERVAL = 30
+
+
+# 개발 모드용 출력 함수
+def dev_print(*args, **kwargs):
+    if os.getenv("APP_ENV") == "development":
+        print(*args, **kwargs)
+
+
+class SpatialIndex:
+    """
+    (lat, lon) 좌표를 가진 레코드 목록 위의 k-최근접 / 반경 검색
+
+    records: 모델 인스턴스 등 임의의 객체 리스트
+    coords : records 와 같은 순서의 (lat, lon) 리스트
+    """
+
+    def __init__(self, records: List[Any], coords: List[Tuple[float, float]]):
+        self.records = list(records)
+        if self.records:
+            lats, lons = zip(*coords)
+            self._tree = cKDTree(to_unit_xyz(lats, lons))
+        else:
+            self._tree = None
+
+    def __len__(self):
+        return len(self.records)
+
+    def nearest(
+        self,
+        lat: float,
+        lon: float,
+        k: int = 1,
+        max_distance_km: Optional[float] = None,
+    ) -> List[Tuple[Any, float]]:
+        """가까운 순서대로 최대 k개 (레코드, 거리 km)"""
+        if self._tree is None or k <= 0:
+            return []
+
+        k = min(k, len(self.records))
+        upper = (
+            km_to_chord(max_distance_km) if max_distance_km is not None else np.inf
+        )
+        chords, idxs = self._tree.query(
+            to_unit_xyz([lat], [lon])[0], k=k, distance_upper_bound=upper
+        )
+        chords = np.atleast_1d(chords)
+        idxs = np.atleast_1d(idxs)
+
+        valid = idxs < len(self.records)
+        distances = chord_to_km(chords[valid])
+        return [
+            (self.records[i], float(d)) for i, d in zip(idxs[valid], distances)
+        ]
+
+    def within(
+        self, lat: float, lon: float, radius_km: float
+    ) -> List[Tuple[Any, float]]:
+        """반경 radius_km 안의 레코드를 가까운 순서대로 (레코드, 거리 km)"""
+        if self._tree is None:
+            return []
+
+        point = to_unit_xyz([lat], [lon])[0]
+        idxs = self._tree.query_ball_point(point, km_to_chord(radius_km))
+        if not idxs:
+            return []
+
+        idxs = np.asarray(idxs)
+        chords = np.linalg.norm(self._tree.data[idxs] - point, axis=1)
+        distances = chord_to_km(chords)
+        order = np.argsort(distances, kind="stable")
+        return [(self.records[idxs[i]], float(distances[i])) for i in order]
+
+
+# ==========================================
+# 정적 테이블 인덱스 레지스트리
+# ==========================================
+def _buoy_queryset():
+    from core.models import Buoy
+
+    return Buoy.objects.all()
+
+
+def _tide_station_queryset():
+    from core.models import TideStation
+
+    return TideStation.objects.all()
+
+
+def _coastal_point_queryset():
+    from core.models import CoastalPoint
+
+    return CoastalPoint.objects.filter(is_active=True)
+
+
+def _fishing_spot_queryset():
+    from core.models import FishingSpot
+
+    return FishingSpot.objects.exclude(lat__isnull=True).exclude(lon__isnull=True)
+
+
+def _port_queryset():
+    from core.models import Port
+
+    return Port.objects.all()
+
+
+INDEX_SOURCES: Dict[str, Callable] = {
+    "buoy": _buoy_queryset,
+    "tide_station": _tide_station_queryset,
+    "coastal_point": _coastal_point_queryset,
+    "fishing_spot": _fishing_spot_queryset,
+    "port": _port_queryset,
+}
+
+# name -> {"index": SpatialIndex, "version": str, "checked_at": float}
+_indexes: Dict[str, Dict[str, Any]] = {}
+_build_lock = threading.Lock()
+
+
+def _current_version(name: str) -> str:
+    key = VERSION_CACHE_KEY.format(name=name)
+    version = cache.get(key)
+    if version is None:
+        version = uuid.uuid4().hex
+        # 다른 프로세스가 먼저 만들었다면 그 값을 사용
+        if not cache.add(key, version, None):
+            version = cache.get(key) or version
+    return version
+
+
+def _build_index(name: str) -> SpatialIndex:
+    started = time.monotonic()
+    records = list(INDEX_SOURCES[name]())
+    index = SpatialIndex(records, [(r.lat, r.lon) for r in records])
+    dev_print(
+        f"[공간인덱스] {name} 인덱스 생성: {len(index)}개 "
+        f"({(time.monotonic() - started) * 1000:.1f}ms)"
+    )
+    return index
+
+
+def get_index(name: str) -> SpatialIndex:
+    """
+    이름('buoy', 'tide_station', 'coastal_point', 'fishing_spot', 'port')으로
+    공간 인덱스 조회. 처음 호출하거나 테이블이 바뀌었으면 다시 만든다.
+    """
+    entry = _indexes.get(name)
+    now = time.monotonic()
+
+    if entry is not None and now - entry["checked_at"] < VERSION_CHECK_INTERVAL:
+        return entry["index"]
+
+    version = _current_version(name)
+    if entry is not None and entry["version"] == version:
+        entry["checked_at"] = now
+        return entry["index"]
+
+    with _build_lock:
+        entry = _indexes.get(name)
+        if entry is not None and entry["version"] == version:
+            entry["checked_at"] = now
+            return entry["index"]
+
+        index = _build_index(name)
+        _indexes[name] = {"index": index, "version": version, "checked_at": now}
+        return index
+
+
+def invalidate(name: Optional[str] = None):
+    """
+    인덱스 무효화 (name=None 이면 전체).
+    bulk_create 등 시그널이 발생하지 않는 대량 적재 후에 직접 호출한다.
+    """
+    names = [name] if name else list(INDEX_SOURCES.keys())
+    for n in names:
+        cache.set(VERSION_CACHE_KEY.format(name=n), uuid.uuid4().hex, None)
+        _indexes.pop(n, None)
+        dev_print(f"[공간인덱스] {n} 인덱스 무효화")
+
+
+def connect_signals():
+    """정적 테이블 변경 시 인덱스를 무효화하도록 시그널 연결 (CoreConfig.ready 에서 호출)"""
+    from django.db.models.signals import post_delete, post_save
+
+    for name, queryset_fn in INDEX_SOURCES.items():
+        model = queryset_fn().model
+
+        def _handler(sender, _name=name, **kwargs):
+            invalidate(_name)
+
+        post_save.connect(
+            _handler, sender=model, weak=False, dispatch_uid=f"spatial_index_{name}_save"
+        )
+        post_delete.connect(
+            _handler,
+            sender=model,
+            weak=False,
+            dispatch_uid=f"spatial_index_{name}_delete",
+        )
@@ -7,9 +7,10 @@
 import requests
 import os
 from datetime import datetime, timedelta
-from haversine import haversine
-from core.models import TideStation
+from django.conf import settings
 from dotenv import load_dotenv
+from . import marine_cache, tide_table
+from .spatial_index import get_index
 
 load_dotenv()
 
@@ -24,18 +25,12 @@ def get_nearest_tide_station(user_lat, user_lon):
     """
     가장 가까운 조위 관측소 찾기
     """
-    stations = TideStation.objects.all()
+    station_list = get_index("tide_station").nearest(user_lat, user_lon, k=1)
 
-    if not stations.exists():
+    if not station_list:
         dev_print("[조석예보] 조위 관측소 데이터가 없습니다!")
         return None
 
-    station_list = []
-    for station in stations:
-        dist = haversine((user_lat, user_lon), (station.lat, station.lon))
-        station_list.append((station, dist))
-
-    station_list.sort(key=lambda x: x[1])
     nearest_station, distance = station_list[0]
 
     dev_print(
@@ -114,9 +109,10 @@ def fetch_tide_prediction_multi_day(station_id, days=2):
     return None
 
 
-def fetch_tide_prediction(station_id, target_date=None):
+def fetch_tide_prediction(station_id, target_date=None, session=None):
     """
     조석예보 API 호출 (하위 호환성 유지)
+    (session 을 넘기면 그 커넥션 풀을 재사용 - 단일 날짜 요청만 해당)
     """
     # 단일 날짜 요청이면 그대로 처리
     if target_date:
@@ -135,7 +131,7 @@ def fetch_tide_prediction(station_id, target_date=None):
         }
 
         try:
-            response = requests.get(base_url, params=params, timeout=10)
+            response = (session or requests).get(base_url, params=params, timeout=10)
 
             if response.status_code != 200:
                 return None
@@ -168,13 +164,32 @@ def get_tide_info(user_lat, user_lon):
     if not station:
         return None
 
-    # 2. 조석예보 API 호출 (2일치)
-    tide_data = fetch_tide_prediction(station.station_id)  # target_date=None이면 2일치
+    # 2. 배치가 채운 조석 표에서 다음 만조/간조 검색 (이진 탐색)
+    if getattr(settings, "TIDE_TABLE_ENABLED", True):
+        next_high, next_low = tide_table.next_tides(station.station_id)
+
+        if next_high and next_low:
+            result = {
+                "station_name": station.name,
+                "next_high_tide": next_high.strftime("%H:%M"),
+                "next_low_tide": next_low.strftime("%H:%M"),
+            }
+            dev_print(f"[조석예보] 조석 표 결과: {result}")
+            return result
+
+        dev_print(f"[조석예보] 조석 표에 {station.name} 예보 없음 → API 호출")
+
+    # 3. 조석예보 API 호출 (2일치, 관측소별 하루 단위 캐시)
+    tide_data = marine_cache.get_or_fetch(
+        "tide",
+        station.station_id,
+        lambda: fetch_tide_prediction(station.station_id),  # target_date=None이면 2일치
+    )
 
     if not tide_data:
         return None
 
-    # 3. 다음 만조/간조 시간 찾기
+    # 4. 다음 만조/간조 시간 찾기
     current_time = datetime.now()
     next_high = None
     next_low = None
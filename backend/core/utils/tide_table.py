@@ -0,0 +1,260 @@
+# core/utils/tide_table.py
+"""
+관측소별 조석예보(만조/간조) 표
+
+- refresh_tide_tables 배치가 하루 한 번 전체 TideStation 의 며칠치 예보를
+  tideObsPreTab 에서 받아 TidePrediction 테이블에 저장
+- 요청 시에는 관측소별로 정렬된 고조/저조 시각 배열을 메모리에 두고
+  bisect 로 다음 만조/간조를 찾는다.
+- 배치가 끝나면 캐시의 버전 값을 올려 다른 워커 프로세스도 다음 조회 때 다시 읽는다.
+"""
+
+import os
+import threading
+import time
+import uuid
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+import requests
+from django.core.cache import cache
+from django.db import transaction
+from requests.adapters import HTTPAdapter
+
+KST = ZoneInfo("Asia/Seoul")
+
+HL_CODES = ("고조", "저조")
+
+VERSION_CACHE_KEY = "tide_table:version"
+# 다른 프로세스(배치)의 갱신 여부를 확인하는 최소 간격(초)
+VERSION_CHECK_INTERVAL = 60
+
+
+# 개발 모드용 출력 함수
+def dev_print(*args, **kwargs):
+    if os.getenv("APP_ENV") == "development":
+        print(*args, **kwargs)
+
+
+def _now_kst():
+    return datetime.utcnow() + timedelta(hours=9)
+
+
+def _today_start_kst() -> datetime:
+    """오늘 00:00 (KST, aware)"""
+    return _now_kst().replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=KST)
+
+
+class TideTable:
+    """
+    관측소별 고조/저조 시각 배열 (KST naive datetime, 오름차순)
+
+    rows: (station_id, tide_time, hl_code) 목록. tide_time 은 aware 여도 되고
+          KST naive 여도 된다.
+    """
+
+    def __init__(self, rows):
+        self._times: Dict[str, Dict[str, List[datetime]]] = {}
+
+        for station_id, tide_time, hl_code in rows:
+            if hl_code not in HL_CODES:
+                continue
+            if tide_time.tzinfo is not None:
+                tide_time = tide_time.astimezone(KST).replace(tzinfo=None)
+            by_code = self._times.setdefault(
+                station_id, {code: [] for code in HL_CODES}
+            )
+            by_code[hl_code].append(tide_time)
+
+        for by_code in self._times.values():
+            for times in by_code.values():
+                times.sort()
+
+    def __len__(self):
+        return len(self._times)
+
+    def next_tide(
+        self, station_id: str, hl_code: str, after: datetime
+    ) -> Optional[datetime]:
+        """after(KST naive) 이후 첫 hl_code 시각. 표에 없으면 None"""
+        times = self._times.get(station_id, {}).get(hl_code)
+        if not times:
+            return None
+        idx = bisect_right(times, after)
+        return times[idx] if idx < len(times) else None
+
+
+# ==========================================
+# 요청 시 조회
+# ==========================================
+# {"table": TideTable, "version": str, "checked_at": float}
+_state: Dict[str, Any] = {}
+_load_lock = threading.Lock()
+
+
+def _current_version() -> str:
+    version = cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(VERSION_CACHE_KEY, version, None):
+            version = cache.get(VERSION_CACHE_KEY) or version
+    return version
+
+
+def _load_table() -> TideTable:
+    from core.models import TidePrediction
+
+    started = time.monotonic()
+    rows = TidePrediction.objects.filter(
+        tide_time__gte=_today_start_kst() - timedelta(days=1)
+    ).values_list("station_id", "tide_time", "hl_code")
+    table = TideTable(rows)
+    dev_print(
+        f"[조석표] 로드: 관측소 {len(table)}곳 "
+        f"({(time.monotonic() - started) * 1000:.1f}ms)"
+    )
+    return table
+
+
+def get_tide_table() -> TideTable:
+    """메모리의 조석 표 (배치가 갱신했으면 다시 읽는다)"""
+    now = time.monotonic()
+    if _state and now - _state["checked_at"] < VERSION_CHECK_INTERVAL:
+        return _state["table"]
+
+    version = _current_version()
+    if _state and _state["version"] == version:
+        _state["checked_at"] = now
+        return _state["table"]
+
+    with _load_lock:
+        if _state and _state["version"] == version:
+            _state["checked_at"] = now
+            return _state["table"]
+
+        table = _load_table()
+        _state.update(table=table, version=version, checked_at=now)
+        return table
+
+
+def next_tides(station_id: str, after: Optional[datetime] = None):
+    """
+    (다음 만조, 다음 간조) KST naive datetime. 표에 없으면 각각 None
+    """
+    table = get_tide_table()
+    after = after or _now_kst()
+    return (
+        table.next_tide(station_id, "고조", after),
+        table.next_tide(station_id, "저조", after),
+    )
+
+
+def invalidate():
+    """다른 프로세스까지 조석 표를 다시 읽도록 버전 변경"""
+    cache.set(VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+    _state.clear()
+
+
+# ==========================================
+# 배치 갱신 (manage.py refresh_tide_tables)
+# ==========================================
+def _parse_predictions(raw_data) -> List[Tuple[datetime, str, Optional[float]]]:
+    """tideObsPreTab 응답 → (aware 시각, 고조/저조, 조위) 목록"""
+    parsed = []
+    for item in raw_data or []:
+        hl_code = item.get("hl_code")
+        if hl_code not in HL_CODES:
+            continue
+        try:
+            tide_time = datetime.strptime(item.get("tph_time"), "%Y-%m-%d %H:%M:%S")
+        except (TypeError, ValueError):
+            continue
+        try:
+            level = float(item.get("tph_level"))
+        except (TypeError, ValueError):
+            level = None
+        parsed.append((tide_time.replace(tzinfo=KST), hl_code, level))
+    return parsed
+
+
+def _download_station(station_id, dates, session):
+    """한 관측소의 여러 날짜 예보. 하루라도 실패하면 None (기존 데이터 유지)"""
+    from .tide_api import fetch_tide_prediction
+
+    predictions = []
+    for target_date in dates:
+        raw_data = fetch_tide_prediction(station_id, target_date, session=session)
+        if not raw_data:
+            return None
+        predictions.extend(_parse_predictions(raw_data))
+    return predictions
+
+
+def refresh_tide_tables(days: int = 3, max_workers: int = 8):
+    """
+    전체 관측소의 오늘부터 days 일치 만조/간조 예보를 받아 TidePrediction 교체.
+    (갱신 관측소 수, 전체 관측소 수, 저장 행 수) 반환
+    """
+    from core.models import TidePrediction, TideStation
+
+    if not os.getenv("OceanServiceKey"):
+        print("[조석표] OceanServiceKey .env에 없습니다!")
+        return 0, 0, 0
+
+    stations = list(TideStation.objects.all())
+    window_start = _today_start_kst()
+    dates = [
+        (window_start + timedelta(days=d)).strftime("%Y%m%d") for d in range(days)
+    ]
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    with session, ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="tide-refresh"
+    ) as executor:
+        results = list(
+            executor.map(
+                lambda st: _download_station(st.station_id, dates, session), stations
+            )
+        )
+
+    updated = saved = 0
+    with transaction.atomic():
+        for station, predictions in zip(stations, results):
+            if predictions is None:
+                dev_print(f"[조석표] {station.name}: 수집 실패 (기존 데이터 유지)")
+                continue
+
+            TidePrediction.objects.filter(
+                station=station, tide_time__gte=window_start
+            ).delete()
+            TidePrediction.objects.bulk_create(
+                [
+                    TidePrediction(
+                        station=station,
+                        tide_time=tide_time,
+                        hl_code=hl_code,
+                        tide_level=level,
+                    )
+                    for tide_time, hl_code, level in predictions
+                ],
+                ignore_conflicts=True,
+            )
+            updated += 1
+            saved += len(predictions)
+
+        # 지난 예보 정리 (어제 것까지는 남겨 둠)
+        TidePrediction.objects.filter(
+            tide_time__lt=window_start - timedelta(days=1)
+        ).delete()
+
+    if updated:
+        invalidate()
+
+    return updated, len(stations), saved
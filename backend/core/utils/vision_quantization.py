@@ -0,0 +1,219 @@
+# core/utils/vision_quantization.py
+"""
+에기 추천 / 물색 분류 모델 int8 정적 양자화 (ONNX Runtime)
+
+- 보정(calibration) 이미지를 서비스와 같은 방식으로 전처리
+  (YOLO 로 수면 영역 crop → 64×64 / 224×224) 해서 활성값 범위를 잡고
+  QDQ 형식 int8 모델(*.int8.onnx)을 만든다.
+- 평가 이미지에서 원본(fp32) 대비 top-1 일치율, 확률 차이, 지연 시간, 파일 크기를 비교
+  (물색은 폴더 이름이 clear/medium/muddy 이면 정답 기준 정확도도 계산)
+- 서빙은 VISION_QUANTIZED 설정 (onnx_backend.load_onnx_models)
+
+quantize_vision_models 명령에서만 사용한다.
+"""
+
+import glob
+import os
+import statistics
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+import joblib
+import numpy as np
+from PIL import Image
+
+from . import ai_inference, onnx_backend
+
+IMAGE_PATTERNS = ("*.jpg", "*.jpeg", "*.png")
+
+
+# 개발 모드용 출력 함수
+def dev_print(*args, **kwargs):
+    if os.getenv("APP_ENV") == "development":
+        print(*args, **kwargs)
+
+
+# ==========================================
+# 입력 준비
+# ==========================================
+def list_images(folder: str, limit: Optional[int] = None) -> List[str]:
+    paths = []
+    for pattern in IMAGE_PATTERNS:
+        paths += glob.glob(os.path.join(folder, "**", pattern), recursive=True)
+    paths.sort()
+    return paths[:limit] if limit else paths
+
+
+def _water_label(path: str) -> Optional[str]:
+    label = os.path.basename(os.path.dirname(path)).lower()
+    return label if label in ai_inference.WATER_CLASSES else None
+
+
+class _EnvSampler:
+    """
+    에기 모델 환경 입력 예시값
+    - 앞 4칸(풍속/수온/시간/풍향, 표준화된 값)은 표준정규분포
+    - 물때_/날씨_ 원-핫 칸은 그룹마다 하나씩 켠다 (metadata_cols.pkl 이 있을 때)
+    """
+
+    def __init__(self, env_dim: int, rng):
+        self.env_dim = env_dim
+        self.rng = rng
+        self.groups = []
+        try:
+            cols = list(joblib.load(ai_inference.META_COLS_PATH))
+        except Exception:
+            cols = []
+        for prefix in ("물때_", "날씨_"):
+            idxs = [
+                i
+                for i, c in enumerate(cols)
+                if str(c).startswith(prefix) and i < env_dim
+            ]
+            if idxs:
+                self.groups.append(idxs)
+
+    def sample(self):
+        vector = np.zeros((1, self.env_dim), dtype=np.float32)
+        vector[0, :4] = self.rng.normal(size=min(4, self.env_dim))
+        for idxs in self.groups:
+            vector[0, self.rng.choice(idxs)] = 1.0
+        return vector
+
+
+def build_inputs(paths: List[str], yolo_model, env_dim: int, seed: int = 0):
+    """
+    이미지 → 모델 입력 목록
+    [{"egi": [img(1,64,64,3), env(1,n)], "water": [img(1,224,224,3)], "label": str|None}]
+    """
+    rng = np.random.default_rng(seed)
+    env_sampler = _EnvSampler(env_dim, rng)
+
+    samples = []
+    for path in paths:
+        try:
+            image = Image.open(path).convert("RGB")
+        except Exception as e:
+            dev_print(f"[양자화] 이미지 건너뜀 {path}: {e}")
+            continue
+
+        crop = image
+        if yolo_model is not None:
+            for box in yolo_model([image])[0].boxes:
+                crop = image.crop(tuple(map(int, box.xyxy[0])))
+                break
+
+        egi_in = (np.array(crop.resize((64, 64)), dtype=np.float32) / 255.0)[None]
+        water_in = onnx_backend.resnet50_preprocess(
+            np.array(crop.resize((224, 224)), dtype=np.float32)[None]
+        )
+        samples.append(
+            {
+                "egi": [egi_in, env_sampler.sample()],
+                "water": [water_in],
+                "label": _water_label(path),
+            }
+        )
+    return samples
+
+
+# ==========================================
+# 양자화
+# ==========================================
+def quantize_model(src: str, dst: str, feeds: List[List[np.ndarray]]):
+    """src(fp32 ONNX) → dst(int8 QDQ). feeds: 보정용 입력 목록 (모델 입력 순서)"""
+    from onnxruntime.quantization import (
+        CalibrationDataReader,
+        QuantFormat,
+        QuantType,
+        quantize_static,
+    )
+    from onnxruntime.quantization.shape_inference import quant_pre_process
+
+    input_names = onnx_backend.OnnxKerasModel(src).input_names
+
+    class _Reader(CalibrationDataReader):
+        def __init__(self):
+            self._iter = iter([dict(zip(input_names, feed)) for feed in feeds])
+
+        def get_next(self):
+            return next(self._iter, None)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        prepared = os.path.join(tmp, "prepared.onnx")
+        try:
+            quant_pre_process(src, prepared)
+        except Exception as e:
+            dev_print(f"[양자화] 전처리 생략 ({e})")
+            prepared = src
+
+        quantize_static(
+            prepared,
+            dst,
+            _Reader(),
+            quant_format=QuantFormat.QDQ,
+            per_channel=True,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8,
+        )
+
+
+# ==========================================
+# 비교 리포트
+# ==========================================
+def _median_ms(fn, feeds, repeat=3):
+    samples = []
+    for _ in range(repeat):
+        for feed in feeds:
+            started = time.perf_counter()
+            fn(feed)
+            samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def compare_models(
+    fp32_path: str,
+    int8_path: str,
+    feeds: List[List[np.ndarray]],
+    labels: Optional[List[Optional[str]]] = None,
+    classes: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """fp32 / int8 모델의 결과 차이와 지연 시간·크기 비교"""
+    fp32 = onnx_backend.OnnxKerasModel(fp32_path)
+    int8 = onnx_backend.OnnxKerasModel(int8_path)
+
+    fp32_out = np.concatenate([fp32.predict(feed) for feed in feeds])
+    int8_out = np.concatenate([int8.predict(feed) for feed in feeds])
+    fp32_top = fp32_out.argmax(axis=1)
+    int8_top = int8_out.argmax(axis=1)
+    abs_diff = np.abs(fp32_out - int8_out)
+
+    report = {
+        "samples": len(feeds),
+        "top1_agreement": round(float((fp32_top == int8_top).mean()), 4),
+        "max_abs_diff": round(float(abs_diff.max()), 6),
+        "mean_abs_diff": round(float(abs_diff.mean()), 6),
+        "fp32_ms": round(_median_ms(fp32.predict, feeds), 3),
+        "int8_ms": round(_median_ms(int8.predict, feeds), 3),
+        "fp32_mb": round(os.path.getsize(fp32_path) / 1e6, 2),
+        "int8_mb": round(os.path.getsize(int8_path) / 1e6, 2),
+    }
+
+    # 정답이 있는 샘플만으로 정확도
+    if labels and classes:
+        labeled = [
+            (i, classes.index(label)) for i, label in enumerate(labels) if label in classes
+        ]
+        if labeled:
+            idx = np.array([i for i, _ in labeled])
+            truth = np.array([c for _, c in labeled])
+            fp32_acc = float((fp32_top[idx] == truth).mean())
+            int8_acc = float((int8_top[idx] == truth).mean())
+            report.update(
+                labeled_samples=len(labeled),
+                fp32_accuracy=round(fp32_acc, 4),
+                int8_accuracy=round(int8_acc, 4),
+                accuracy_drop=round(fp32_acc - int8_acc, 4),
+            )
+    return report
@@ -0,0 +1,110 @@
+# core/utils/warmup.py
+"""
+워커 부팅 시 모델 워밍업 + 준비 상태(readiness)
+
+- gunicorn 워커가 앱을 불러온 직후(gunicorn.conf.py 의 post_worker_init)
+  백그라운드 스레드에서 비전 모델 / LLM 을 로드하고 더미 추론을 한 번 돌린다.
+- /api/health/ 는 워밍업이 끝나기 전에는 503 을 돌려주므로
+  로드밸런서가 준비된 워커에만 요청을 보낼 수 있다.
+- WARMUP_ON_START 가 꺼져 있으면 기존처럼 첫 요청 때 지연 로딩한다.
+"""
+
+import os
+import threading
+import time
+import traceback
+from typing import Any, Dict
+
+from django.conf import settings
+
+
+# 개발 모드용 출력 함수
+def dev_print(*args, **kwargs):
+    if os.getenv("APP_ENV") == "development":
+        print(*args, **kwargs)
+
+
+# status: cold(시작 전) / warming / ready / failed
+_state: Dict[str, Any] = {"status": "cold", "steps": {}}
+_lock = threading.Lock()
+_started_pid = None
+
+
+def _warm_vision():
+    if getattr(settings, "MODEL_SERVER_ENABLED", False):
+        # 비전 모델은 모델 서버가 들고 있으므로 연결만 확인
+        from .model_server import ping_server
+
+        return ping_server()
+
+    from . import ai_inference
+
+    ai_inference.warm_up_models()
+    return {"backend": ai_inference.loaded_backend}
+
+
+def _warm_llm():
+    from . import sllm_service
+
+    # 생성까지 한 번 돌려서 토크나이저/모델 첫 호출 비용을 미리 치른다.
+    _, prompt = sllm_service.generate_recommendation_reason("clear", "red", {})
+
+    # LLM 로드에 실패해도 생성은 기본 멘트로 넘어가므로 여기서 실패로 기록한다.
+    # (ready 로 보고하면 모든 요청이 기본 멘트를 받는다)
+    if sllm_service.llm_model is None:
+        raise RuntimeError(f"LLM 이 로드되지 않았습니다. ({prompt})")
+    return {"llm_loaded": True}
+
+
+def warm_up():
+    """모든 모델 워밍업 (단계별 소요 시간과 결과를 상태에 기록)"""
+    steps = [("vision", _warm_vision)]
+    if getattr(settings, "WARMUP_LLM", True):
+        steps.append(("llm", _warm_llm))
+
+    _state.update(status="warming", started_at=time.time(), steps={})
+    failed = False
+    for name, fn in steps:
+        started = time.monotonic()
+        try:
+            detail = fn()
+            _state["steps"][name] = {
+                "ok": True,
+                "seconds": round(time.monotonic() - started, 2),
+                **(detail or {}),
+            }
+        except Exception as e:
+            failed = True
+            traceback.print_exc()
+            _state["steps"][name] = {
+                "ok": False,
+                "seconds": round(time.monotonic() - started, 2),
+                "error": str(e),
+            }
+
+    _state.update(status="failed" if failed else "ready", finished_at=time.time())
+    print(f"[워밍업] pid={os.getpid()} {_state['status']} {_state['steps']}")
+
+
+def start_warmup():
+    """이 프로세스에서 한 번만 백그라운드 워밍업 시작"""
+    global _started_pid
+
+    with _lock:
+        if _started_pid == os.getpid():
+            return
+        _started_pid = os.getpid()
+        _state.update(status="warming", steps={})
+
+    threading.Thread(target=warm_up, name="model-warmup", daemon=True).start()
+
+
+def readiness():
+    """(요청을 받아도 되는지, 상태 dict)"""
+    if not getattr(settings, "WARMUP_ON_START", False):
+        # 워밍업을 쓰지 않으면 첫 요청 때 지연 로딩 → 항상 받음
+        return True, {"status": "lazy"}
+
+    state = {k: v for k, v in _state.items()}
+    state["pid"] = os.getpid()
+    return state["status"] == "ready", state
@@ -1,6 +1,6 @@
 # core/views.py
 
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 import json
 import traceback
 
@@ -9,6 +9,7 @@ from django.contrib.auth import authenticate, get_user_model
 from django.core.paginator import Paginator
 from django.db.models import Sum, Count, Q
 from django.db.models.functions import Coalesce
+from django.http import StreamingHttpResponse
 
 # Django REST framework
 from rest_framework import generics, status
@@ -16,6 +17,7 @@ from rest_framework.authtoken.models import Token
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.permissions import (
     AllowAny,
+    IsAdminUser,
     IsAuthenticated,
     IsAuthenticatedOrReadOnly,
 )
@@ -63,15 +65,27 @@ from .serializers import (
 )
 from .utils.integrated_data_collector import collect_all_marine_data
 from .utils.fishing_index_api import SUPPORTED_FISH
+from .utils.ocean_api import buoy_age_sec
 
 # from .utils.egi_rag import run_egi_rag
 from .utils.egi_service import (
     get_recommendation_context,
 )
+from .utils.reason_cache import SOURCE_LLM, stream_reason
+from .utils.result_cache import set_egi_result
+from .utils.boat_availability import (
+    availability_covers,
+    filter_available_boats,
+    nearest_available_by_boat,
+    synced_boat_ids,
+    today_kst,
+)
 from .utils.boat_schedule_service import (
-    find_nearest_available_schedule,
+    find_nearest_available_schedules,
     get_schedules_in_range,
 )
+from .utils import lazy_resource, metrics
+from .utils.warmup import readiness
 from .utils.stt_service import STTParser
 from .utils.sllm_service import generate_recommendation_reason
 
@@ -717,6 +731,8 @@ class OceanDataView(APIView):
             )
 
         final_result = collect_all_marine_data(lat, lon, target_fish=target_fish)
+        # 부이 관측값의 경과 시간은 캐시된 값이 아니라 지금 기준으로
+        final_result["buoy_age_sec"] = buoy_age_sec(final_result)
         return Response(final_result, status=status.HTTP_200_OK)
 
 
@@ -732,6 +748,133 @@ class EgiRecommendView(APIView):
     parser_classes = (MultiPartParser, FormParser)
     serializer_class = EgiRecommendSerializer
 
+    def _load_context(self, request, with_reason=True):
+        """입력 검증 + 추천 컨텍스트 조회 → (ctx, 오류 응답)"""
+        dev_print("\n" + "=" * 50)
+        dev_print("🔍 API 요청 받음")
+        dev_print(f"Method: {request.method}")
+        dev_print(f"Data keys: {request.data.keys()}")
+        dev_print(f"Files keys: {request.FILES.keys()}")
+        dev_print("=" * 50 + "\n")
+
+        # 1. 입력 검증
+        serializer = EgiRecommendSerializer(data=request.data)
+        if not serializer.is_valid():
+            dev_print(f"❌ Validation Error: {serializer.errors}")
+            return None, Response(
+                serializer.errors, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        image_file = serializer.validated_data.get("image")
+        lat = serializer.validated_data["lat"]
+        lon = serializer.validated_data["lon"]
+        target_fish = serializer.validated_data.get("target_fish") or "쭈갑"
+
+        dev_print(f"✅ Validation passed")
+        dev_print(f"Image file: {serializer.validated_data.get('image')}")
+        dev_print(
+            f"Lat/Lon: {serializer.validated_data['lat']}, {serializer.validated_data['lon']}"
+        )
+
+        # -------------------------------------------------------------
+        # 2. 통합 서비스 호출
+        # -------------------------------------------------------------
+        dev_print(">>> get_recommendation_context 호출 전")
+        ctx = get_recommendation_context(
+            lat, lon, image_file, target_fish, with_reason=with_reason
+        )
+        dev_print(f">>> get_recommendation_context 결과: {ctx is not None}")
+
+        if ctx is None:
+            dev_print("⚠️ Context가 None - 물 감지 실패")
+            return None, Response(
+                {
+                    "status": "fail",
+                    "message": "사진에서 바다(물)를 찾을 수 없습니다.\n수면이 잘 보이도록 다시 촬영해주세요.",
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        return ctx, None
+
+    def _build_response_data(self, request, ctx, reason_text):
+        """추천 컨텍스트 → 응답 data (DB 에기 매핑 포함)"""
+        marine_env = ctx["marine_data"]
+        ai_rec_color = ctx["recommended_color"]
+        water_color = ctx["water_color"]
+
+        # YOLO 신뢰도 점수
+        base_score = int(ctx.get("confidence", 0.95) * 100)
+        final_score = min(base_score, 99.9)
+
+        # -------------------------------------------------------------
+        # 3. DB 매핑 및 조회
+        # -------------------------------------------------------------
+        COLOR_TRANSLATION = {
+            "blue": "파랑",
+            "brown": "갈색",
+            "green": "초록",
+            "orange": "주황",
+            "pink": "핑크",
+            "purple": "보라",
+            "rainbow": "무지개",
+            "red": "빨강",
+            "yellow": "노랑",
+        }
+
+        db_color_name = COLOR_TRANSLATION.get(ai_rec_color, "노랑")
+        matched_egis = Egi.objects.filter(color__color_name=db_color_name)[:3]
+
+        recommendations = []
+        if matched_egis.exists():
+            for egi in matched_egis:
+                egi_data = EgiSerializer(egi, context={"request": request}).data
+                egi_data.update(
+                    {
+                        "color_name": egi.color.color_name,
+                        "reason": reason_text,
+                        "score": final_score,
+                    }
+                )
+                recommendations.append(egi_data)
+        else:
+            recommendations.append(
+                {
+                    "name": f"추천 색상: {db_color_name} (상품 준비중)",
+                    "color_name": db_color_name,
+                    "reason": reason_text,
+                    "score": 95.0,
+                    "image_url": None,
+                    "brand": "-",
+                    "egi_id": 0,
+                }
+            )
+
+        # -------------------------------------------------------------
+        # 4. 응답 반환
+        # -------------------------------------------------------------
+        response_data = {
+            "status": "success",
+            "data": {
+                "analysis_result": {"water_color": water_color, "confidence": 0.95},
+                "environment": {
+                    "water_temp": marine_env.get("water_temp"),
+                    "tide": marine_env.get("moon_phase"),
+                    "weather": marine_env.get("rain_type_text"),
+                    "wind_speed": marine_env.get("wind_speed"),
+                    "location_name": marine_env.get("location_name"),
+                    "buoy_age_sec": buoy_age_sec(marine_env),
+                },
+                "recommendations": recommendations,
+                "debug_info": (
+                    ctx.get("debug_info", {})
+                    if os.getenv("APP_ENV") == "development"
+                    else {}
+                ),
+            },
+        }
+        return response_data
+
     @extend_schema(
         summary="에기 추천 (AI + 환경 분석)",
         description="이미지와 위치 정보를 받아 최적의 에기를 추천하고, RAG 기반의 전문적인 근거를 제공합니다.",
@@ -740,50 +883,9 @@ class EgiRecommendView(APIView):
     )
     def post(self, request, *args, **kwargs):
         try:
-            dev_print("\n" + "=" * 50)
-            dev_print("🔍 API 요청 받음")
-            dev_print(f"Method: {request.method}")
-            dev_print(f"Data keys: {request.data.keys()}")
-            dev_print(f"Files keys: {request.FILES.keys()}")
-            dev_print("=" * 50 + "\n")
-
-            # 1. 입력 검증
-            serializer = EgiRecommendSerializer(data=request.data)
-            if not serializer.is_valid():
-                dev_print(f"❌ Validation Error: {serializer.errors}")
-                return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-
-            image_file = serializer.validated_data.get("image")
-            lat = serializer.validated_data["lat"]
-            lon = serializer.validated_data["lon"]
-            target_fish = serializer.validated_data.get("target_fish") or "쭈갑"
-
-            dev_print(f"✅ Validation passed")
-            dev_print(f"Image file: {serializer.validated_data.get('image')}")
-            dev_print(
-                f"Lat/Lon: {serializer.validated_data['lat']}, {serializer.validated_data['lon']}"
-            )
-
-            # -------------------------------------------------------------
-            # 2. 통합 서비스 호출
-            # -------------------------------------------------------------
-            dev_print(">>> get_recommendation_context 호출 전")
-            ctx = get_recommendation_context(lat, lon, image_file, target_fish)
-            dev_print(f">>> get_recommendation_context 결과: {ctx is not None}")
-
-            if ctx is None:
-                dev_print("⚠️ Context가 None - 물 감지 실패")
-                return Response(
-                    {
-                        "status": "fail",
-                        "message": "사진에서 바다(물)를 찾을 수 없습니다.\n수면이 잘 보이도록 다시 촬영해주세요.",
-                    },
-                    status=status.HTTP_200_OK,
-                )
-
-            marine_env = ctx["marine_data"]
-            ai_rec_color = ctx["recommended_color"]
-            water_color = ctx["water_color"]
+            ctx, error_response = self._load_context(request)
+            if error_response is not None:
+                return error_response
 
             reason_text = ctx.get("reason", "추천 근거를 생성할 수 없습니다.")
 
@@ -794,76 +896,42 @@ class EgiRecommendView(APIView):
                     "sllm_prompt", "프롬프트 없음"
                 )
 
-            # YOLO 신뢰도 점수
-            base_score = int(ctx.get("confidence", 0.95) * 100)
-            final_score = min(base_score, 99.9)
-
-            # -------------------------------------------------------------
-            # 3. DB 매핑 및 조회
-            # -------------------------------------------------------------
-            COLOR_TRANSLATION = {
-                "blue": "파랑",
-                "brown": "갈색",
-                "green": "초록",
-                "orange": "주황",
-                "pink": "핑크",
-                "purple": "보라",
-                "rainbow": "무지개",
-                "red": "빨강",
-                "yellow": "노랑",
-            }
+            response_data = self._build_response_data(request, ctx, reason_text)
+            return Response(response_data, status=status.HTTP_200_OK)
+        except Exception as e:
+            dev_print(f"\n❌ 예상치 못한 에러:")
+            dev_print(traceback.format_exc())
+            return Response(
+                {"status": "error", "message": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
 
-            db_color_name = COLOR_TRANSLATION.get(ai_rec_color, "노랑")
-            matched_egis = Egi.objects.filter(color__color_name=db_color_name)[:3]
 
-            recommendations = []
-            if matched_egis.exists():
-                for egi in matched_egis:
-                    egi_data = EgiSerializer(egi, context={"request": request}).data
-                    egi_data.update(
-                        {
-                            "color_name": egi.color.color_name,
-                            "reason": reason_text,
-                            "score": final_score,
-                        }
-                    )
-                    recommendations.append(egi_data)
-            else:
-                recommendations.append(
-                    {
-                        "name": f"추천 색상: {db_color_name} (상품 준비중)",
-                        "color_name": db_color_name,
-                        "reason": reason_text,
-                        "score": 95.0,
-                        "image_url": None,
-                        "brand": "-",
-                        "egi_id": 0,
-                    }
-                )
+def _sse_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
 
-            # -------------------------------------------------------------
-            # 4. 응답 반환
-            # -------------------------------------------------------------
-            response_data = {
-                "status": "success",
-                "data": {
-                    "analysis_result": {"water_color": water_color, "confidence": 0.95},
-                    "environment": {
-                        "water_temp": marine_env.get("water_temp"),
-                        "tide": marine_env.get("moon_phase"),
-                        "weather": marine_env.get("rain_type_text"),
-                        "wind_speed": marine_env.get("wind_speed"),
-                        "location_name": marine_env.get("location_name"),
-                    },
-                    "recommendations": recommendations,
-                    "debug_info": (
-                        ctx.get("debug_info", {})
-                        if os.getenv("APP_ENV") == "development"
-                        else {}
-                    ),
-                },
-            }
-            return Response(response_data, status=status.HTTP_200_OK)
+
+class EgiRecommendStreamView(EgiRecommendView):
+    """
+    에기 추천 API - 추천 근거 스트리밍 (Server-Sent Events)
+    - event: result  → 감지/색상 추천 결과 (근거 빈 문자열, 일반 API 의 data 와 같은 모양)
+    - event: reason  → 생성되는 근거 조각 {"text": ...}
+    - event: done    → 전체 근거 {"reason": ...}
+    입력 오류 / 물 감지 실패는 일반 API 와 같은 JSON 응답
+    """
+
+    @extend_schema(
+        summary="에기 추천 (근거 스트리밍)",
+        description="색상 추천 결과를 먼저 보내고, LLM 추천 근거를 생성되는 대로 text/event-stream 으로 보냅니다.",
+        request=EgiRecommendSerializer,
+        responses={200: OpenApiResponse(description="text/event-stream")},
+    )
+    def post(self, request, *args, **kwargs):
+        try:
+            ctx, error_response = self._load_context(request, with_reason=False)
+            if error_response is not None:
+                return error_response
+            response_data = self._build_response_data(request, ctx, "")
         except Exception as e:
             dev_print(f"\n❌ 예상치 못한 에러:")
             dev_print(traceback.format_exc())
@@ -872,6 +940,53 @@ class EgiRecommendView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+        response = StreamingHttpResponse(
+            self._events(ctx, response_data), content_type="text/event-stream"
+        )
+        response["Cache-Control"] = "no-cache"
+        # nginx 가 응답을 모아서 보내지 않도록
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    def _events(self, ctx, response_data):
+        yield _sse_event("result", response_data)
+
+        # 결과 캐시에 있던 추천이면 근거도 이미 있음
+        if ctx.get("reason"):
+            yield _sse_event("reason", {"text": ctx["reason"]})
+            yield _sse_event("done", {"reason": ctx["reason"]})
+            return
+
+        try:
+            reason, source = yield from self._reason_events(ctx)
+        except Exception as e:
+            dev_print(traceback.format_exc())
+            yield _sse_event("error", {"message": str(e)})
+            return
+
+        # 기본 멘트는 결과 캐시에 넣지 않는다. (다음 요청에서 LLM 근거를 받도록)
+        if source == SOURCE_LLM:
+            set_egi_result(
+                ctx["image_digest"],
+                ctx["marine_data"],
+                ctx["recommended_color"],
+                ctx["water_color"],
+                reason,
+            )
+        yield _sse_event("done", {"reason": reason})
+
+    def _reason_events(self, ctx):
+        """근거 조각마다 reason 이벤트 → 끝나면 (전체 근거, source) 를 return"""
+        stream = stream_reason(
+            ctx["water_color"], ctx["recommended_color"], ctx["marine_data"]
+        )
+        while True:
+            try:
+                piece = next(stream)
+            except StopIteration as stop:
+                return stop.value
+            yield _sse_event("reason", {"text": piece})
+
 
 # ========================
 # 6. 회원 API
@@ -1214,6 +1329,13 @@ class BoatSearchView(APIView):
         # DB 조회 결과를 먼저 정렬
         qs = qs.order_by("boat_id")
 
+        # 동기화된 예약 현황이 검색 기간을 덮고 있으면
+        # 날짜/인원 조건을 SQL 로 먼저 거른 뒤 페이지를 나눈다 (외부 API 호출 없음)
+        end_date = base_date + timedelta(days=7)
+        use_availability = availability_covers(end_date)
+        if use_availability:
+            qs = filter_available_boats(qs, base_date, end_date, people)
+
         paginator = Paginator(qs, page_size)
         page_obj = paginator.get_page(page)
 
@@ -1238,16 +1360,32 @@ class BoatSearchView(APIView):
 
         final_results = []
 
-        for boat in page_obj.object_list:
-            if not boat.ship_no:
-                continue
+        page_boats = [boat for boat in page_obj.object_list if boat.ship_no]
+        schedule_by_boat = {}
+        live_boats = page_boats
+        if use_availability:
+            # 기간의 달을 최근에 받은 선박은 동기화된 현황에서 가장 가까운 출항 (쿼리 1번)
+            fresh_ids = synced_boat_ids(
+                [boat.boat_id for boat in page_boats], base_date, end_date
+            )
+            schedule_by_boat = nearest_available_by_boat(
+                fresh_ids, base_date, end_date, people
+            )
+            live_boats = [boat for boat in page_boats if boat.boat_id not in fresh_ids]
 
-            schedule_summary = find_nearest_available_schedule(
-                ship_no=boat.ship_no,
+        if live_boats:
+            # 나머지 선박들의 스케줄을 한 번에 조회 (필요한 달을 동시에 요청)
+            schedule_by_ship = find_nearest_available_schedules(
+                [boat.ship_no for boat in live_boats],
                 base_date=base_date,
                 max_days=7,
                 min_passengers=people,
             )
+            for boat in live_boats:
+                schedule_by_boat[boat.boat_id] = schedule_by_ship.get(boat.ship_no)
+
+        for boat in page_boats:
+            schedule_summary = schedule_by_boat.get(boat.boat_id)
 
             # 스케줄이 없으면 결과 목록에서 제외 (이번 페이지 결과가 10개보다 적을 수 있음)
             if not schedule_summary:
@@ -1288,7 +1426,9 @@ class BoatSearchView(APIView):
                     "page": page_obj.number,
                     "page_size": page_size,
                     "total_pages": paginator.num_pages,
-                    "total_boats": paginator.count,  # 주의: DB 기준 전체 개수입니다. (스케줄 필터링 전)
+                    # 예약 현황 동기화 범위 안이면 스케줄 조건까지 반영된 개수
+                    # (아직 받지 못한 선박은 포함), 아니면 DB 기준 전체 개수
+                    "total_boats": paginator.count,
                     "has_next": page_obj.has_next(),
                     "has_previous": page_obj.has_previous(),
                 },
@@ -1497,6 +1637,16 @@ class MyLikedBoatsView(generics.ListAPIView):
             .order_by("-created_at")
         )
 
+        # 찜한 선박은 sync_liked_boats 워커가 자주 갱신하므로
+        # 예약 현황 테이블에서 가장 가까운 출항을 한 번에 조회 (외부 API 호출 없음)
+        # (선박별로 해당 기간의 달을 최근에 확인했을 때만 사용)
+        start_date = today_kst()
+        end_date = start_date + timedelta(days=7)
+        fresh_ids = synced_boat_ids(
+            [like.boat_id for like in likes], start_date, end_date
+        )
+        schedule_by_boat = nearest_available_by_boat(fresh_ids, start_date, end_date, 1)
+
         results = []
         for like in likes:
             boat = like.boat
@@ -1517,10 +1667,61 @@ class MyLikedBoatsView(generics.ListAPIView):
                     "booking_url": boat.booking_url,  # 예약 링크
                     "source_site": boat.source_site,  # 출처
                     "is_liked": True,
-                    "nearest_schedule": None,
+                    "nearest_schedule": schedule_by_boat.get(boat.boat_id),
                 }
             )
 
         return Response(
             {"status": "success", "count": len(results), "results": results}
         )
+
+
+class MetricsView(APIView):
+    """
+    운영 지표 조회 (관리자 전용)
+    - 동기화 워커 처리량/지연 등 core.utils.metrics 에 기록된 값
+    """
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        summary="운영 지표 (관리자)",
+        description="배치/워커가 기록한 지표를 반환합니다. prefix 로 일부만 조회할 수 있습니다.",
+        parameters=[
+            OpenApiParameter(
+                name="prefix",
+                type=OpenApiTypes.STR,
+                required=False,
+                description="지표 이름 접두어 (예: liked_sync)",
+            )
+        ],
+    )
+    def get(self, request):
+        prefix = request.query_params.get("prefix")
+        return Response({"status": "success", "metrics": metrics.snapshot(prefix)})
+
+
+class HealthView(APIView):
+    """
+    준비 상태 확인 (로드밸런서 / 배포 스크립트용)
+    - 워커 부팅 워밍업(WARMUP_ON_START)이 끝나기 전이거나 실패하면 503
+    - resources: 지연 로딩 자원별 로드 여부 / 사용 중 참조 수
+    """
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    @extend_schema(
+        summary="준비 상태 (health check)",
+        description="모델 워밍업이 끝난 워커는 200, 워밍업 중/실패는 503 을 반환합니다.",
+    )
+    def get(self, request):
+        ready, state = readiness()
+        return Response(
+            {
+                "status": "ready" if ready else "not_ready",
+                "warmup": state,
+                "resources": lazy_resource.registry_stats(),
+            },
+            status=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
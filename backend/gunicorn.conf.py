@@ -0,0 +1,15 @@
+# backend/gunicorn.conf.py
+# gunicorn 설정 (deploy/gunicorn.service 에서 --config 로 사용)
+#
+# 워커가 앱을 불러온 직후 백그라운드에서 모델 워밍업을 시작한다.
+# (WARMUP_ON_START=true 일 때만. 준비 상태는 /api/health/ 로 확인)
+
+
+def post_worker_init(worker):
+    from django.conf import settings
+
+    if getattr(settings, "WARMUP_ON_START", False):
+        from core.utils.warmup import start_warmup
+
+        worker.log.info("모델 워밍업 시작 (pid=%s)", worker.pid)
+        start_warmup()
@@ -49,6 +49,116 @@ ELASTICSEARCH_PORT = 9200
 ELASTICSEARCH_USER = ""
 ELASTICSEARCH_PASSWORD = ""
 
+# ==========================================
+# 해양/기상 데이터 수집 설정
+# ==========================================
+# 낚시지수/부이/기상청/조석/음력 5개 소스를 동시에 호출할지 여부
+MARINE_FANOUT_ENABLED = os.getenv("MARINE_FANOUT_ENABLED", "true").lower() == "true"
+# 병렬 수집 공통 마감 시간(초) - 이 시간 안에 도착한 결과만 병합
+MARINE_FANOUT_DEADLINE = float(os.getenv("MARINE_FANOUT_DEADLINE", "20"))
+# 좌표 격자 캐시 (격자 크기 0.02도 ≈ 2km)
+MARINE_CACHE_ENABLED = os.getenv("MARINE_CACHE_ENABLED", "true").lower() == "true"
+MARINE_CACHE_CELL_DEG = float(os.getenv("MARINE_CACHE_CELL_DEG", "0.02"))
+# 부이 최신 관측값 캐시 유지 시간(초)
+MARINE_CACHE_BUOY_TTL = int(os.getenv("MARINE_CACHE_BUOY_TTL", "600"))
+# 부이 조회: 거리 순 병렬 요청 여부 / 조회 한 번의 동시 요청 수 / 확장 검색 반경(km)
+BUOY_POLL_PARALLEL = os.getenv("BUOY_POLL_PARALLEL", "true").lower() == "true"
+BUOY_POLL_MAX_WORKERS = int(os.getenv("BUOY_POLL_MAX_WORKERS", "8"))
+BUOY_SEARCH_RADIUS_KM = float(os.getenv("BUOY_SEARCH_RADIUS_KM", "200"))
+# 부이 스냅샷: refresh_buoy_snapshots 배치가 채운 값만 읽기 / 사용 가능한 최대 경과(초)
+# / 쓸 만한 스냅샷이 없으면 API 직접 호출
+BUOY_SNAPSHOT_ENABLED = os.getenv("BUOY_SNAPSHOT_ENABLED", "true").lower() == "true"
+BUOY_SNAPSHOT_MAX_AGE = int(os.getenv("BUOY_SNAPSHOT_MAX_AGE", "10800"))
+BUOY_SNAPSHOT_LIVE_FALLBACK = (
+    os.getenv("BUOY_SNAPSHOT_LIVE_FALLBACK", "false").lower() == "true"
+)
+# 조석 표: refresh_tide_tables 배치가 저장한 예보로 다음 만조/간조 계산
+TIDE_TABLE_ENABLED = os.getenv("TIDE_TABLE_ENABLED", "true").lower() == "true"
+# 기상청 초단기실황: 전부 결측이었던 격자를 건너뛰는 기간(초)
+KMA_MISSING_CELL_TTL = int(os.getenv("KMA_MISSING_CELL_TTL", "86400"))
+# 선박 스케줄(ship_no, 월) 캐시: 그대로 쓰는 시간(초) / 이후 오래된 값을 주며 갱신하는 시간(초)
+# / 동시 요청 수
+BOAT_SCHEDULE_CACHE_TTL = int(os.getenv("BOAT_SCHEDULE_CACHE_TTL", "60"))
+BOAT_SCHEDULE_STALE_TTL = int(os.getenv("BOAT_SCHEDULE_STALE_TTL", "600"))
+BOAT_SCHEDULE_MAX_WORKERS = int(os.getenv("BOAT_SCHEDULE_MAX_WORKERS", "10"))
+# 선박 예약 현황 테이블: 검색에 사용 여부 / 동기화 범위(일) / 동기화가 멈춘 것으로 볼 시간(초)
+BOAT_AVAILABILITY_ENABLED = (
+    os.getenv("BOAT_AVAILABILITY_ENABLED", "true").lower() == "true"
+)
+BOAT_AVAILABILITY_DAYS = int(os.getenv("BOAT_AVAILABILITY_DAYS", "30"))
+BOAT_AVAILABILITY_MAX_AGE = int(os.getenv("BOAT_AVAILABILITY_MAX_AGE", "10800"))
+# 찜한 선박 동기화(sync_liked_boats): 이 시간(초)보다 오래 확인하지 않은 달을 다시 받음
+BOAT_LIKED_SYNC_MAX_AGE = int(os.getenv("BOAT_LIKED_SYNC_MAX_AGE", "600"))
+# 비전 모델 서버(run_model_server): 사용 여부 / 소켓 경로 / 응답 대기(초)
+# / 서버에 연결할 수 없을 때 웹 워커에서 직접 추론할지
+MODEL_SERVER_ENABLED = os.getenv("MODEL_SERVER_ENABLED", "false").lower() == "true"
+MODEL_SERVER_SOCKET = os.getenv(
+    "MODEL_SERVER_SOCKET", str(BASE_DIR / "model_server.sock")
+)
+MODEL_SERVER_TIMEOUT = float(os.getenv("MODEL_SERVER_TIMEOUT", "30"))
+MODEL_SERVER_LOCAL_FALLBACK = (
+    os.getenv("MODEL_SERVER_LOCAL_FALLBACK", "false").lower() == "true"
+)
+# 에기 추천 추론 요청 묶어 처리: 웹 워커에서 직접 추론할 때 / 모델 서버(run_model_server)에서
+# 사용 여부 / 최대 배치 크기 / 첫 요청 후 기다리는 시간(ms)
+INFERENCE_BATCHING = os.getenv("INFERENCE_BATCHING", "false").lower() == "true"
+MODEL_SERVER_BATCHING = os.getenv("MODEL_SERVER_BATCHING", "true").lower() == "true"
+INFERENCE_BATCH_MAX_SIZE = int(os.getenv("INFERENCE_BATCH_MAX_SIZE", "8"))
+INFERENCE_BATCH_WAIT_MS = float(os.getenv("INFERENCE_BATCH_WAIT_MS", "10"))
+# 추천 근거 LLM 생성도 동시 요청을 묶어 generate 한 번으로 (왼쪽 패딩)
+LLM_BATCHING = os.getenv("LLM_BATCHING", "true").lower() == "true"
+LLM_BATCH_MAX_SIZE = int(os.getenv("LLM_BATCH_MAX_SIZE", "4"))
+LLM_BATCH_WAIT_MS = float(os.getenv("LLM_BATCH_WAIT_MS", "50"))
+# 묶음 처리 지표(배치 크기/처리 시간)를 메모리에 모았다가 캐시에 쓰는 간격(초)
+BATCH_METRICS_FLUSH_SECONDS = float(os.getenv("BATCH_METRICS_FLUSH_SECONDS", "10"))
+# 비전 모델 백엔드: auto(ONNX 파일이 있으면 ONNX Runtime) / onnx / tensorflow
+# / ONNX Runtime 스레드 수 (0 이면 기본값)
+VISION_BACKEND = os.getenv("VISION_BACKEND", "auto").lower()
+ONNX_NUM_THREADS = int(os.getenv("ONNX_NUM_THREADS", "0"))
+# ONNX 백엔드에서 에기/물색 모델을 int8 양자화본(quantize_vision_models)으로 서빙할지
+VISION_QUANTIZED = os.getenv("VISION_QUANTIZED", "false").lower() == "true"
+# 에기 추천 결과 캐시 (사진 해시 + 해양 조건): 사용 여부 / 최대 항목 수 / 유지 시간(초)
+EGI_RESULT_CACHE_ENABLED = (
+    os.getenv("EGI_RESULT_CACHE_ENABLED", "true").lower() == "true"
+)
+EGI_RESULT_CACHE_SIZE = int(os.getenv("EGI_RESULT_CACHE_SIZE", "256"))
+EGI_RESULT_CACHE_TTL = int(os.getenv("EGI_RESULT_CACHE_TTL", "1800"))
+# 업로드 사진 디코딩 목표 크기(px, YOLO 입력 크기) - JPEG 는 이 크기 이상으로만 줄여 읽음
+VISION_DECODE_SIZE = int(os.getenv("VISION_DECODE_SIZE", "640"))
+# 에기 추천 디버그 이미지(박스 그린 원본/crop base64) 생성: 미설정이면 개발 모드에서만
+VISION_DEBUG_IMAGES = (
+    os.getenv("VISION_DEBUG_IMAGES").lower() == "true"
+    if os.getenv("VISION_DEBUG_IMAGES")
+    else None
+)
+# 워커 부팅 시 모델 워밍업 (gunicorn.conf.py), 끝나기 전에는 /api/health/ 가 503
+WARMUP_ON_START = os.getenv("WARMUP_ON_START", "False").lower() == "true"
+WARMUP_LLM = os.getenv("WARMUP_LLM", "True").lower() == "true"
+# 지연 로딩한 모델을 이 시간(초) 동안 안 쓰면 메모리에서 내림 (0: 내리지 않음)
+VISION_IDLE_UNLOAD_SECONDS = float(os.getenv("VISION_IDLE_UNLOAD_SECONDS", "0"))
+LLM_IDLE_UNLOAD_SECONDS = float(os.getenv("LLM_IDLE_UNLOAD_SECONDS", "0"))
+# 에기 추천 근거 DB 캐시 (pregenerate_reasons), TTL 지나면 백그라운드 재생성
+REASON_CACHE_ENABLED = os.getenv("REASON_CACHE_ENABLED", "True").lower() == "true"
+REASON_CACHE_TTL = int(os.getenv("REASON_CACHE_TTL", str(7 * 24 * 3600)))
+# 캐시에 없는 조합: False 면 기본 멘트 + 백그라운드 생성, True 면 그 자리에서 LLM 생성
+REASON_CACHE_BLOCKING_MISS = (
+    os.getenv("REASON_CACHE_BLOCKING_MISS", "False").lower() == "true"
+)
+
+# ==========================================
+# 캐시 설정
+# ==========================================
+# gunicorn 워커들과 관리 명령(배치 작업)이 같은 캐시를 보도록 파일 기반 캐시 사용
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND", "django.core.cache.backends.filebased.FileBasedCache"
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", os.path.join(BASE_DIR, ".cache")),
+        "OPTIONS": {"MAX_ENTRIES": 20000},
+    }
+}
+
 # Application definition
 
 INSTALLED_APPS = [